@@ -2,6 +2,7 @@
 eBay integration API routes.
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional
 import logging
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 ebay_auth = EbayAuth()
-ebay_api = EbayInventoryAPI()
+ebay_api = EbayInventoryAPI(ebay_auth)
 
 
 @router.get("/auth-status")
@@ -78,7 +79,8 @@ async def login():
         Success status
     """
     try:
-        success = ebay_auth.start_oauth_flow()
+        # The flow blocks for up to two minutes waiting for the browser callback
+        success = await run_in_threadpool(ebay_auth.start_oauth_flow)
 
         if success:
             return {
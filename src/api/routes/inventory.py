@@ -1,8 +1,8 @@
 """
 Inventory API routes.
 """
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Response
+from typing import List, Optional, Tuple
 import logging
 import os
 import uuid
@@ -16,6 +16,7 @@ from src.schemas.item_schema import (
     ItemFilter,
 )
 from src.core.exceptions import NotFoundError, ValidationError, DuplicateError
+from src.core.database import get_db
 from src.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -37,8 +38,10 @@ async def create_item(item: ItemCreate):
         HTTPException: If creation fails
     """
     try:
-        created_item = inventory_service.create_item(item)
-        return created_item.to_dict()
+        # One session per request; serialized before it commits and closes
+        with get_db() as db:
+            created_item = inventory_service.create_item(item, db=db)
+            return created_item.to_dict()
     except DuplicateError as e:
         raise HTTPException(status_code=409, detail=str(e))
     except ValidationError as e:
@@ -48,13 +51,43 @@ async def create_item(item: ItemCreate):
         raise HTTPException(status_code=500, detail="Failed to create item")
 
 
+@router.post("/items/bulk")
+async def create_items(items: List[ItemCreate]):
+    """Create many inventory items at once, e.g. from a CSV import.
+
+    Args:
+        items: Item creation data for each item
+
+    Returns:
+        Success message with the new item IDs
+
+    Raises:
+        HTTPException: If creation fails
+    """
+    try:
+        with get_db() as db:
+            ids = inventory_service.create_items(items, db=db)
+        return {"success": True, "count": len(ids), "ids": ids}
+    except DuplicateError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to create items: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create items")
+
+
 @router.get("/items", response_model=List[ItemResponse])
 async def list_items(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     status: Optional[str] = None,
     category: Optional[str] = None,
     search: Optional[str] = None,
+    after_id: Optional[int] = None,
+    prefix: bool = False,
+    include_total: bool = False,
 ):
     """List inventory items with filters.
 
@@ -64,19 +97,33 @@ async def list_items(
         status: Filter by status
         category: Filter by category
         search: Search query
+        after_id: ID of the last item already received; returns the page
+            after it (keyset paging, skip is ignored)
+        prefix: Match search only against the start of title or SKU
+        include_total: Report the number of matching items in the
+            X-Total-Count header (not available for searches)
 
     Returns:
         List of items
     """
     try:
-        items = inventory_service.list_items(
-            skip=skip,
-            limit=limit,
-            status=status,
-            category=category,
-            search=search,
-        )
-        return [item.to_dict() for item in items]
+        with get_db() as db:
+            items = inventory_service.list_items(
+                skip=skip,
+                limit=limit,
+                status=status,
+                category=category,
+                search=search,
+                after_id=after_id,
+                prefix=prefix,
+                with_total=include_total,
+                db=db,
+            )
+            if include_total:
+                items, total = items
+                if total is not None:
+                    response.headers["X-Total-Count"] = str(total)
+            return [item.to_dict() for item in items]
     except Exception as e:
         logger.error(f"Failed to list items: {e}")
         raise HTTPException(status_code=500, detail="Failed to list items")
@@ -96,8 +143,9 @@ async def get_item(item_id: int):
         HTTPException: If item not found
     """
     try:
-        item = inventory_service.get_item(item_id)
-        return item.to_dict()
+        with get_db() as db:
+            item = inventory_service.get_item(item_id, db=db)
+            return item.to_dict()
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Item not found")
     except Exception as e:
@@ -120,8 +168,9 @@ async def update_item(item_id: int, item: ItemUpdate):
         HTTPException: If update fails
     """
     try:
-        updated_item = inventory_service.update_item(item_id, item)
-        return updated_item.to_dict()
+        with get_db() as db:
+            updated_item = inventory_service.update_item(item_id, item, db=db)
+            return updated_item.to_dict()
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Item not found")
     except DuplicateError as e:
@@ -147,7 +196,8 @@ async def delete_item(item_id: int):
         HTTPException: If deletion fails
     """
     try:
-        inventory_service.delete_item(item_id)
+        with get_db() as db:
+            inventory_service.delete_item(item_id, db=db)
         return {"success": True, "message": "Item deleted successfully"}
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Item not found")
@@ -156,6 +206,78 @@ async def delete_item(item_id: int):
         raise HTTPException(status_code=500, detail="Failed to delete item")
 
 
+async def _read_photo(file: UploadFile) -> Tuple[str, bytes]:
+    """Validate an uploaded image and pick a unique filename for it.
+
+    Nothing is written, so a rejected upload leaves no file behind.
+
+    Args:
+        file: Image file
+
+    Returns:
+        Tuple of (filename, file content)
+
+    Raises:
+        HTTPException: If the file type or size is not allowed
+    """
+    # Validate file type
+    allowed_extensions = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+    file_ext = Path(file.filename).suffix.lower()
+
+    if file_ext not in allowed_extensions:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
+        )
+
+    # Check file size before anything is written
+    content = await file.read()
+    if len(content) > settings.max_upload_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File too large. Max size: {settings.max_upload_size / 1024 / 1024}MB"
+        )
+
+    # Generate unique filename
+    return f"{uuid.uuid4()}{file_ext}", content
+
+
+def _write_photos(photos: List[Tuple[str, bytes]]) -> List[str]:
+    """Save validated photos to the upload directory.
+
+    Files already written are removed again if a later write fails.
+
+    Args:
+        photos: (filename, content) pairs from _read_photo
+
+    Returns:
+        Stored filenames
+    """
+    filenames = []
+    try:
+        for filename, content in photos:
+            with open(os.path.join(settings.upload_dir, filename), "wb") as f:
+                filenames.append(filename)
+                f.write(content)
+    except Exception:
+        _discard_photos(filenames)
+        raise
+    return filenames
+
+
+def _discard_photos(filenames: List[str]):
+    """Remove stored photos that no item refers to.
+
+    Args:
+        filenames: Stored filenames
+    """
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(settings.upload_dir, filename))
+        except OSError as e:
+            logger.warning("Failed to remove orphaned photo %s: %s", filename, e)
+
+
 @router.post("/items/{item_id}/photos")
 async def upload_photo(item_id: int, file: UploadFile = File(...)):
     """Upload a photo for an item.
@@ -171,33 +293,22 @@ async def upload_photo(item_id: int, file: UploadFile = File(...)):
         HTTPException: If upload fails
     """
     try:
-        # Validate file type
-        allowed_extensions = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-        file_ext = Path(file.filename).suffix.lower()
-
-        if file_ext not in allowed_extensions:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
-            )
-
-        # Generate unique filename
-        filename = f"{uuid.uuid4()}{file_ext}"
-        filepath = os.path.join(settings.upload_dir, filename)
-
-        # Save file
-        with open(filepath, "wb") as f:
-            content = await file.read()
-            # Check file size
-            if len(content) > settings.max_upload_size:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File too large. Max size: {settings.max_upload_size / 1024 / 1024}MB"
-                )
-            f.write(content)
-
-        # Add photo to item
-        inventory_service.add_photo(item_id, filename)
+        photo = await _read_photo(file)
+
+        # Files are only written once the item is known to exist, and are
+        # removed again if recording them (or the commit) fails
+        filenames = []
+        try:
+            with get_db() as db:
+                inventory_service.get_item(item_id, db=db)
+                filenames = _write_photos([photo])
+                filename = filenames[0]
+
+                # Add photo to item
+                inventory_service.add_photo(item_id, filename, db=db)
+        except Exception:
+            _discard_photos(filenames)
+            raise
 
         return {
             "success": True,
@@ -214,6 +325,55 @@ async def upload_photo(item_id: int, file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail="Failed to upload photo")
 
 
+@router.post("/items/{item_id}/photos/batch")
+async def upload_photos(item_id: int, files: List[UploadFile] = File(...)):
+    """Upload several photos for an item, recorded with a single update.
+
+    Every file is validated before any is written, and nothing is saved
+    for a missing item.
+
+    Args:
+        item_id: Item ID
+        files: Image files
+
+    Returns:
+        Success message with filenames
+
+    Raises:
+        HTTPException: If upload fails
+    """
+    try:
+        photos = [await _read_photo(file) for file in files]
+
+        # Files are only written once the item is known to exist, and are
+        # removed again if recording them (or the commit) fails
+        filenames = []
+        try:
+            with get_db() as db:
+                inventory_service.get_item(item_id, db=db)
+                filenames = _write_photos(photos)
+
+                # Add all photos to item at once
+                inventory_service.add_photos(item_id, filenames, db=db)
+        except Exception:
+            _discard_photos(filenames)
+            raise
+
+        return {
+            "success": True,
+            "filenames": filenames,
+            "message": f"{len(filenames)} photos uploaded successfully"
+        }
+
+    except NotFoundError:
+        raise HTTPException(status_code=404, detail="Item not found")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to upload photos for item {item_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to upload photos")
+
+
 @router.delete("/items/{item_id}/photos/{filename}")
 async def delete_photo(item_id: int, filename: str):
     """Delete a photo from an item.
@@ -230,7 +390,8 @@ async def delete_photo(item_id: int, filename: str):
     """
     try:
         # Remove from item
-        inventory_service.remove_photo(item_id, filename)
+        with get_db() as db:
+            inventory_service.remove_photo(item_id, filename, db=db)
 
         # Delete file
         filepath = os.path.join(settings.upload_dir, filename)
@@ -261,8 +422,9 @@ async def update_status(item_id: int, status: str):
         HTTPException: If update fails
     """
     try:
-        updated_item = inventory_service.update_status(item_id, status)
-        return updated_item.to_dict()
+        with get_db() as db:
+            updated_item = inventory_service.update_status(item_id, status, db=db)
+            return updated_item.to_dict()
     except NotFoundError:
         raise HTTPException(status_code=404, detail="Item not found")
     except Exception as e:
@@ -278,7 +440,8 @@ async def get_statistics():
         Statistics data
     """
     try:
-        stats = inventory_service.get_statistics()
+        with get_db() as db:
+            stats = inventory_service.get_statistics(db=db)
         return {"success": True, "data": stats}
     except Exception as e:
         logger.error(f"Failed to get statistics: {e}")
@@ -2,6 +2,7 @@
 System API routes.
 """
 from fastapi import APIRouter, HTTPException
+import asyncio
 import logging
 import os
 from datetime import datetime
@@ -80,6 +81,39 @@ async def get_system_info():
         raise HTTPException(status_code=500, detail="Failed to get system information")
 
 
+@router.get("/bootstrap")
+async def get_bootstrap():
+    """Get eBay, Ollama and system status in one response.
+
+    Lets the settings screen load with a single request instead of three.
+
+    Returns:
+        Combined status payloads keyed by "ebay", "ollama" and "system"
+    """
+    from src.api.routes.ebay import get_auth_status
+    from src.api.routes.assistant import check_ollama_status
+
+    ebay, ollama, system = await asyncio.gather(
+        get_auth_status(),
+        check_ollama_status(),
+        get_system_info(),
+        return_exceptions=True,
+    )
+
+    data = {}
+    for name, result in (("ebay", ebay), ("ollama", ollama), ("system", system)):
+        if isinstance(result, Exception):
+            logger.error(f"Bootstrap {name} status failed: {result}")
+            data[name] = {"error": str(getattr(result, "detail", result))}
+        else:
+            data[name] = result["data"]
+
+    return {
+        "success": True,
+        "data": data,
+    }
+
+
 @router.get("/settings")
 async def get_settings():
     """Get application settings.
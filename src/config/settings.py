@@ -2,6 +2,7 @@
 Application settings and configuration management.
 """
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -18,6 +19,11 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(default="sqlite:///./reselleros.db", env="DATABASE_URL")
+    # Connection pool for server databases (SQLite shares one connection)
+    db_pool_size: int = Field(default=10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=20, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")
 
     # API Server
     api_host: str = Field(default="127.0.0.1", env="API_HOST")
@@ -28,6 +34,9 @@ class Settings(BaseSettings):
     ebay_client_secret: Optional[str] = Field(default=None, env="EBAY_CLIENT_SECRET")
     ebay_redirect_uri: str = Field(default="https://localhost:8443", env="EBAY_REDIRECT_URI")
     ebay_environment: str = Field(default="production", env="EBAY_ENVIRONMENT")
+    ebay_refresh_buffer: int = Field(default=300, env="EBAY_REFRESH_BUFFER")
+    ebay_timeout: int = Field(default=30, env="EBAY_TIMEOUT")
+    ebay_token_retries: int = Field(default=3, env="EBAY_TOKEN_RETRIES")
 
     # Ollama Configuration
     ollama_base_url: str = Field(default="http://localhost:11434", env="OLLAMA_BASE_URL")
@@ -111,5 +120,29 @@ class Settings(BaseSettings):
         return "https://api.ebay.com"
 
 
+@lru_cache(maxsize=1)
+def _settings_for_env_stamp(stamp: Optional[tuple]) -> Settings:
+    """Build settings for a given .env file state."""
+    return Settings()
+
+
+def current_settings() -> Settings:
+    """Get settings reflecting the current contents of the .env file.
+
+    Unlike the global instance, this picks up edits made while the
+    application is running. The file is only re-parsed when its
+    modification time or size changes.
+
+    Returns:
+        Settings instance
+    """
+    try:
+        stat = os.stat(Settings.Config.env_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        stamp = None
+    return _settings_for_env_stamp(stamp)
+
+
 # Global settings instance
 settings = Settings()
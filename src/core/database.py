@@ -1,7 +1,7 @@
 """
 Database configuration and session management.
 """
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import create_engine, event, insert, select, text
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
@@ -15,6 +15,44 @@ logger = logging.getLogger(__name__)
 # Create declarative base
 Base = declarative_base()
 
+# Single-column indexes made redundant by composite indexes that lead
+# with the same column; dropped from existing databases on startup
+OBSOLETE_INDEXES = (
+    "ix_items_category",
+    "ix_items_status",
+    "ix_expenses_category",
+    "ix_sales_sale_date",
+    "ix_sales_status",
+)
+
+# Trigram full-text index over item text columns (SQLite FTS5). It holds
+# no data of its own and is kept in sync with items by triggers.
+ITEM_SEARCH_TABLE = "items_fts"
+ITEM_SEARCH_DDL = (
+    f"""CREATE VIRTUAL TABLE {ITEM_SEARCH_TABLE} USING fts5(
+        title, description, sku,
+        content='items', content_rowid='id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS items_fts_ai AFTER INSERT ON items BEGIN
+        INSERT INTO {ITEM_SEARCH_TABLE}(rowid, title, description, sku)
+        VALUES (new.id, new.title, new.description, new.sku);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS items_fts_ad AFTER DELETE ON items BEGIN
+        INSERT INTO {ITEM_SEARCH_TABLE}({ITEM_SEARCH_TABLE}, rowid, title, description, sku)
+        VALUES ('delete', old.id, old.title, old.description, old.sku);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS items_fts_au
+        AFTER UPDATE OF title, description, sku ON items BEGIN
+        INSERT INTO {ITEM_SEARCH_TABLE}({ITEM_SEARCH_TABLE}, rowid, title, description, sku)
+        VALUES ('delete', old.id, old.title, old.description, old.sku);
+        INSERT INTO {ITEM_SEARCH_TABLE}(rowid, title, description, sku)
+        VALUES (new.id, new.title, new.description, new.sku);
+    END""",
+)
+
+# Set by init_database once the item search index is usable
+item_search_enabled = False
+
 # Database engine
 engine = None
 SessionLocal = None
@@ -31,6 +69,8 @@ def _configure_sqlite(dbapi_con, connection_record):
         dbapi_con.execute("PRAGMA synchronous=NORMAL")
         dbapi_con.execute("PRAGMA cache_size=10000")
         dbapi_con.execute("PRAGMA temp_store=MEMORY")
+        # Memory-map up to 256 MB of the database file for reads
+        dbapi_con.execute("PRAGMA mmap_size=268435456")
         logger.debug("SQLite connection configured with WAL mode")
     except Exception as e:
         logger.error(f"Failed to configure SQLite: {e}")
@@ -45,13 +85,26 @@ def init_engine():
 
     logger.info(f"Initializing database: {settings.database_url}")
 
+    # SQLite shares one connection; server databases get a sized pool
+    if "sqlite" in settings.database_url:
+        pool_options = {
+            "connect_args": {"check_same_thread": False},
+            "poolclass": StaticPool,
+        }
+    else:
+        pool_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+        }
+
     # Create engine
     engine = create_engine(
         settings.database_url,
-        connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-        poolclass=StaticPool if "sqlite" in settings.database_url else None,
         echo=settings.is_development,
         pool_pre_ping=True,
+        **pool_options,
     )
 
     # Configure SQLite if using SQLite
@@ -134,6 +187,31 @@ def init_database():
         # Create all tables
         Base.metadata.create_all(bind=engine)
 
+        # create_all skips existing tables, so add any indexes declared since.
+        # Reflection skips expression indexes on SQLite, so look names up
+        # in sqlite_master there instead of relying on checkfirst.
+        existing_indexes = None
+        if "sqlite" in settings.database_url:
+            with engine.connect() as conn:
+                existing_indexes = set(
+                    conn.execute(text("SELECT name FROM sqlite_master WHERE type='index'")).scalars()
+                )
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                if existing_indexes is None:
+                    index.create(bind=engine, checkfirst=True)
+                elif index.name not in existing_indexes:
+                    index.create(bind=engine)
+
+        with engine.begin() as conn:
+            for index_name in OBSOLETE_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+        seed_default_settings(engine)
+
+        if "sqlite" in settings.database_url:
+            init_item_search(engine)
+
         logger.info("Database schema initialized successfully")
 
         # Verify tables were created
@@ -148,6 +226,58 @@ def init_database():
         raise
 
 
+def seed_default_settings(engine):
+    """Insert any default settings missing from the settings table.
+
+    All missing rows go in with one executemany INSERT.
+
+    Args:
+        engine: Database engine
+    """
+    from src.models.settings import UserSettings, DEFAULT_SETTINGS_ROWS
+
+    table = UserSettings.__table__
+    with engine.begin() as conn:
+        existing = set(conn.execute(select(table.c.key)).scalars())
+        missing = [row for row in DEFAULT_SETTINGS_ROWS if row["key"] not in existing]
+        if missing:
+            conn.execute(insert(table), missing)
+            logger.info(f"Added {len(missing)} default settings")
+
+
+def init_item_search(engine):
+    """Create the item full-text index and its sync triggers if missing.
+
+    A newly created index is filled from the existing items. Item search
+    falls back to LIKE scans if this SQLite build lacks FTS5 trigram support.
+
+    Args:
+        engine: Database engine
+    """
+    global item_search_enabled
+
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name"),
+                {"name": ITEM_SEARCH_TABLE},
+            ).first()
+            if exists:
+                for statement in ITEM_SEARCH_DDL[1:]:
+                    conn.execute(text(statement))
+            else:
+                for statement in ITEM_SEARCH_DDL:
+                    conn.execute(text(statement))
+                conn.execute(
+                    text(f"INSERT INTO {ITEM_SEARCH_TABLE}({ITEM_SEARCH_TABLE}) VALUES ('rebuild')")
+                )
+                logger.info("Built item search index")
+        item_search_enabled = True
+    except Exception as e:
+        item_search_enabled = False
+        logger.warning(f"Item search index unavailable, using LIKE search: {e}")
+
+
 def drop_all_tables():
     """Drop all database tables.
 
@@ -157,7 +287,13 @@ def drop_all_tables():
     if settings.is_production:
         raise RuntimeError("Cannot drop tables in production!")
 
+    global item_search_enabled
+
     engine = get_engine()
+    if "sqlite" in settings.database_url:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {ITEM_SEARCH_TABLE}"))
+        item_search_enabled = False
     Base.metadata.drop_all(bind=engine)
     logger.warning("All database tables dropped")
 
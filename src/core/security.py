@@ -115,9 +115,13 @@ class SecureStorage:
             logger.error(f"Failed to store eBay tokens: {e}")
             return False
 
-    def get_ebay_token(self) -> Optional[dict]:
+    def get_ebay_token(self, include_expired: bool = False) -> Optional[dict]:
         """Retrieve eBay OAuth tokens.
 
+        Args:
+            include_expired: Return tokens even if the access token has expired,
+                so the refresh token can still be used
+
         Returns:
             Dictionary with access_token, refresh_token, and expires_at,
             or None if not found or expired
@@ -131,7 +135,7 @@ class SecureStorage:
 
             # Check if token is expired
             expires_at = datetime.fromisoformat(ebay_data["expires_at"])
-            if datetime.utcnow() >= expires_at:
+            if not include_expired and datetime.utcnow() >= expires_at:
                 logger.warning("eBay token has expired")
                 return None
 
@@ -105,7 +105,8 @@ class MainWindow(QMainWindow):
             btn.setObjectName("nav-button")
             btn.setMinimumHeight(50)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda checked, v=view_name: self.switch_view(v))
+            btn.setProperty("view_name", view_name)
+            btn.clicked.connect(self._on_nav_clicked)
             layout.addWidget(btn)
 
         layout.addStretch()
@@ -180,6 +181,10 @@ class MainWindow(QMainWindow):
 
         return widget
 
+    def _on_nav_clicked(self):
+        """Switch to the view named by the clicked sidebar button."""
+        self.switch_view(self.sender().property("view_name"))
+
     def switch_view(self, view_name: str):
         """Switch to a different view.
 
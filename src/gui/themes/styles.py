@@ -0,0 +1,34 @@
+"""
+Shared fonts, stylesheets and option lists for GUI views.
+"""
+from functools import lru_cache
+from PyQt6.QtGui import QFont
+
+# Combo box options
+ITEM_CATEGORIES = (
+    "Clothing", "Electronics", "Collectibles", "Books",
+    "Toys", "Home & Garden", "Sports", "Vintage", "Other"
+)
+ITEM_CONDITIONS = ("New", "Like New", "Good", "Fair", "Poor")
+ITEM_STATUSES = ("Draft", "Ready", "Listed", "Sold", "Archived")
+EXPENSE_CATEGORIES = ("Inventory", "Shipping", "Supplies", "Fees", "Marketing", "Other")
+
+# Summary card stylesheets
+TOTAL_CARD_CSS = "font-size: 16px; font-weight: bold; padding: 10px; background-color: #e8f4f8; border-radius: 5px;"
+MONTH_CARD_CSS = "font-size: 16px; font-weight: bold; padding: 10px; background-color: #fff4e6; border-radius: 5px;"
+PLACEHOLDER_CSS = "color: #999; font-size: 14px; padding: 40px;"
+
+
+@lru_cache(maxsize=None)
+def title_font() -> QFont:
+    """Get the page title font.
+
+    Built on first use, since a QFont needs a running QApplication.
+
+    Returns:
+        Bold 28pt font
+    """
+    font = QFont()
+    font.setPointSize(28)
+    font.setBold(True)
+    return font
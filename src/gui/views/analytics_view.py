@@ -10,6 +10,8 @@ from PyQt6.QtGui import QFont
 import requests
 import logging
 
+from src.gui.themes.styles import title_font
+
 logger = logging.getLogger(__name__)
 
 
@@ -104,10 +106,7 @@ class AnalyticsView(QWidget):
         header_layout = QHBoxLayout()
 
         title = QLabel("Analytics & Reporting")
-        title_font = QFont()
-        title_font.setPointSize(28)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(title_font())
         header_layout.addWidget(title)
 
         header_layout.addStretch()
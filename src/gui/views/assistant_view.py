@@ -7,10 +7,11 @@ from PyQt6.QtWidgets import (
     QGroupBox, QFormLayout, QMessageBox, QProgressBar
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont
 import requests
 import logging
 
+from src.gui.themes.styles import title_font, ITEM_CATEGORIES, ITEM_CONDITIONS
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,10 +32,7 @@ class AssistantView(QWidget):
 
         # Header
         title = QLabel("AI Assistant")
-        title_font = QFont()
-        title_font.setPointSize(28)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(title_font())
         layout.addWidget(title)
 
         # Ollama status
@@ -50,10 +48,7 @@ class AssistantView(QWidget):
         pricing_layout.addRow("Title:", self.pricing_title)
 
         self.pricing_category = QComboBox()
-        self.pricing_category.addItems([
-            "Clothing", "Electronics", "Collectibles", "Books",
-            "Toys", "Home & Garden", "Sports", "Vintage", "Other"
-        ])
+        self.pricing_category.addItems(ITEM_CATEGORIES)
         pricing_layout.addRow("Category:", self.pricing_category)
 
         self.pricing_cost = QDoubleSpinBox()
@@ -62,7 +57,7 @@ class AssistantView(QWidget):
         pricing_layout.addRow("Cost:", self.pricing_cost)
 
         self.pricing_condition = QComboBox()
-        self.pricing_condition.addItems(["New", "Like New", "Good", "Fair", "Poor"])
+        self.pricing_condition.addItems(ITEM_CONDITIONS)
         self.pricing_condition.setCurrentText("Good")
         pricing_layout.addRow("Condition:", self.pricing_condition)
 
@@ -87,10 +82,7 @@ class AssistantView(QWidget):
         title_layout.addRow("Current Title:", self.seo_title)
 
         self.seo_category = QComboBox()
-        self.seo_category.addItems([
-            "Clothing", "Electronics", "Collectibles", "Books",
-            "Toys", "Home & Garden", "Sports", "Vintage", "Other"
-        ])
+        self.seo_category.addItems(ITEM_CATEGORIES)
         title_layout.addRow("Category:", self.seo_category)
 
         optimize_btn = QPushButton("🤖 Optimize Title")
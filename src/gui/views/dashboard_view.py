@@ -10,6 +10,8 @@ from PyQt6.QtGui import QFont
 import requests
 import logging
 
+from src.gui.themes.styles import title_font
+
 logger = logging.getLogger(__name__)
 
 
@@ -88,10 +90,7 @@ class DashboardView(QWidget):
 
         # Header
         header = QLabel("Dashboard")
-        header_font = QFont()
-        header_font.setPointSize(28)
-        header_font.setBold(True)
-        header.setFont(header_font)
+        header.setFont(title_font())
         main_layout.addWidget(header)
 
         # Scroll area for content
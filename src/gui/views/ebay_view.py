@@ -8,9 +8,11 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QFont
-import requests
 import logging
 
+from src.gui.workers import run_in_background, create_api_session
+from src.gui.themes.styles import title_font, PLACEHOLDER_CSS
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,6 +68,7 @@ class EbayView(QWidget):
     def __init__(self):
         super().__init__()
         self.api_url = "http://localhost:8000/api/ebay"
+        self._session = create_api_session()
         self.setup_ui()
         self.check_connection()
 
@@ -91,10 +94,7 @@ class EbayView(QWidget):
         header_layout = QHBoxLayout()
 
         title = QLabel("eBay Integration")
-        title_font = QFont()
-        title_font.setPointSize(28)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(title_font())
         header_layout.addWidget(title)
 
         header_layout.addStretch()
@@ -164,7 +164,7 @@ class EbayView(QWidget):
             "You'll need eBay API credentials from developer.ebay.com"
         )
         self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.placeholder_label.setStyleSheet("color: #999; font-size: 14px; padding: 40px;")
+        self.placeholder_label.setStyleSheet(PLACEHOLDER_CSS)
         layout.addWidget(self.placeholder_label)
 
         # Progress bar for syncing
@@ -177,8 +177,15 @@ class EbayView(QWidget):
 
     def check_connection(self):
         """Check eBay connection status."""
+        run_in_background(
+            self._session.get, f"{self.api_url}/auth-status", timeout=5,
+            on_result=self._on_connection_status,
+            on_error=self._on_connection_failed
+        )
+
+    def _on_connection_status(self, response):
+        """Update connection status from API response."""
         try:
-            response = requests.get(f"{self.api_url}/auth-status", timeout=5)
             if response.status_code == 200:
                 data = response.json().get("data", {})
                 if data.get("authenticated"):
@@ -205,8 +212,12 @@ class EbayView(QWidget):
             else:
                 self.connection_card.update_status("Error checking status", "color: orange;")
         except Exception as e:
-            logger.error(f"Failed to check eBay connection: {e}")
-            self.connection_card.update_status("Error: Cannot reach API", "color: red;")
+            self._on_connection_failed(str(e))
+
+    def _on_connection_failed(self, error):
+        """Handle connection status failure."""
+        logger.error(f"Failed to check eBay connection: {error}")
+        self.connection_card.update_status("Error: Cannot reach API", "color: red;")
 
     def connect_ebay(self):
         """Connect eBay account."""
@@ -220,28 +231,40 @@ class EbayView(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                # Show progress
-                self.progress_bar.show()
-                self.progress_bar.setRange(0, 0)  # Indeterminate
-
-                response = requests.post(f"{self.api_url}/auth/login", timeout=120)
-
-                self.progress_bar.hide()
+            # Show progress while the browser flow completes
+            self.progress_bar.show()
+            self.progress_bar.setRange(0, 0)  # Indeterminate
+            self.connect_btn.setEnabled(False)
+
+            run_in_background(
+                self._session.post, f"{self.api_url}/auth/login", timeout=120,
+                on_result=self._on_connected,
+                on_error=self._on_connect_failed
+            )
+
+    def _on_connected(self, response):
+        """Handle eBay login response."""
+        self.progress_bar.hide()
+        try:
+            if response.status_code == 200:
+                QMessageBox.information(
+                    self, "Success",
+                    "Successfully connected to eBay!"
+                )
+                self.check_connection()
+            else:
+                error = response.json().get("detail", "Unknown error")
+                self.connect_btn.setEnabled(True)
+                QMessageBox.critical(self, "Error", f"Failed to connect: {error}")
+        except Exception as e:
+            self._on_connect_failed(str(e))
 
-                if response.status_code == 200:
-                    QMessageBox.information(
-                        self, "Success",
-                        "Successfully connected to eBay!"
-                    )
-                    self.check_connection()
-                else:
-                    error = response.json().get("detail", "Unknown error")
-                    QMessageBox.critical(self, "Error", f"Failed to connect: {error}")
-            except Exception as e:
-                self.progress_bar.hide()
-                logger.error(f"eBay connection failed: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to connect: {str(e)}")
+    def _on_connect_failed(self, error):
+        """Handle eBay login failure."""
+        self.progress_bar.hide()
+        self.connect_btn.setEnabled(True)
+        logger.error(f"eBay connection failed: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to connect: {error}")
 
     def disconnect_ebay(self):
         """Disconnect eBay account."""
@@ -253,17 +276,28 @@ class EbayView(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                response = requests.post(f"{self.api_url}/auth/logout", timeout=10)
-                if response.status_code == 200:
-                    QMessageBox.information(self, "Success", "Disconnected from eBay")
-                    self.check_connection()
-                else:
-                    error = response.json().get("detail", "Unknown error")
-                    QMessageBox.critical(self, "Error", f"Failed to disconnect: {error}")
-            except Exception as e:
-                logger.error(f"eBay disconnection failed: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to disconnect: {str(e)}")
+            run_in_background(
+                self._session.post, f"{self.api_url}/auth/logout", timeout=10,
+                on_result=self._on_disconnected,
+                on_error=self._on_disconnect_failed
+            )
+
+    def _on_disconnected(self, response):
+        """Handle eBay logout response."""
+        try:
+            if response.status_code == 200:
+                QMessageBox.information(self, "Success", "Disconnected from eBay")
+                self.check_connection()
+            else:
+                error = response.json().get("detail", "Unknown error")
+                QMessageBox.critical(self, "Error", f"Failed to disconnect: {error}")
+        except Exception as e:
+            self._on_disconnect_failed(str(e))
+
+    def _on_disconnect_failed(self, error):
+        """Handle eBay logout failure."""
+        logger.error(f"eBay disconnection failed: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to disconnect: {error}")
 
     def sync_inventory(self):
         """Sync inventory with eBay."""
@@ -276,8 +310,15 @@ class EbayView(QWidget):
 
     def load_api_stats(self):
         """Load eBay API statistics."""
+        run_in_background(
+            self._session.get, f"{self.api_url}/stats", timeout=5,
+            on_result=self._on_api_stats,
+            on_error=self._on_api_stats_failed
+        )
+
+    def _on_api_stats(self, response):
+        """Display eBay API statistics."""
         try:
-            response = requests.get(f"{self.api_url}/stats", timeout=5)
             if response.status_code == 200:
                 data = response.json().get("data", {})
 
@@ -291,12 +332,23 @@ Requests/min: {data.get('requests_per_minute', 0)}
                 self.stats_label.setText(stats_text)
                 self.stats_group.show()
         except Exception as e:
-            logger.error(f"Failed to load API stats: {e}")
+            self._on_api_stats_failed(str(e))
+
+    def _on_api_stats_failed(self, error):
+        """Handle API statistics failure."""
+        logger.error(f"Failed to load API stats: {error}")
 
     def load_ebay_items(self):
         """Load eBay items."""
+        run_in_background(
+            self._session.get, f"{self.api_url}/inventory/items?limit=50", timeout=10,
+            on_result=self._on_ebay_items,
+            on_error=self._on_ebay_items_failed
+        )
+
+    def _on_ebay_items(self, response):
+        """Display eBay items."""
         try:
-            response = requests.get(f"{self.api_url}/inventory/items?limit=50", timeout=10)
             if response.status_code == 200:
                 data = response.json().get("data", {})
                 items = data.get("inventoryItems", [])
@@ -321,7 +373,11 @@ Requests/min: {data.get('requests_per_minute', 0)}
                     self.placeholder_label.setText("No eBay listings found.\n\nStart by creating items in Inventory.")
                     self.placeholder_label.show()
         except Exception as e:
-            logger.error(f"Failed to load eBay items: {e}")
+            self._on_ebay_items_failed(str(e))
+
+    def _on_ebay_items_failed(self, error):
+        """Handle eBay items failure."""
+        logger.error(f"Failed to load eBay items: {error}")
 
     def refresh(self):
         """Refresh view."""
@@ -3,19 +3,43 @@ Expenses view for tracking business expenses.
 """
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QTableWidget, QTableWidgetItem, QLineEdit, QComboBox,
+    QTableView, QLineEdit, QComboBox,
     QHeaderView, QMessageBox, QDialog, QFormLayout, QTextEdit,
-    QDoubleSpinBox, QDateEdit
+    QDoubleSpinBox, QDateEdit, QMenu
 )
-from PyQt6.QtCore import Qt, QDate
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QDate, QTimer, QAbstractTableModel, QModelIndex
 import requests
 import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from src.gui.widgets.delegates import CurrencyDelegate
+from src.gui.themes.styles import (
+    title_font, EXPENSE_CATEGORIES, TOTAL_CARD_CSS, MONTH_CARD_CSS, PLACEHOLDER_CSS
+)
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ExpenseRecord:
+    """Expense tracked locally by the expenses view."""
+
+    id: int
+    title: str
+    category: str
+    amount: float
+    date: str
+    vendor: str = ""
+    description: str = ""
+    # Year and month as an int (e.g. 202401) for cheap month filtering
+    ym: int = field(init=False)
+
+    def __post_init__(self):
+        self.ym = int(self.date[:7].replace("-", ""))
+
+
 class AddExpenseDialog(QDialog):
     """Dialog for adding new expenses."""
 
@@ -34,9 +58,7 @@ class AddExpenseDialog(QDialog):
         layout.addRow("Title *:", self.title_input)
 
         self.category_input = QComboBox()
-        self.category_input.addItems([
-            "Inventory", "Shipping", "Supplies", "Fees", "Marketing", "Other"
-        ])
+        self.category_input.addItems(EXPENSE_CATEGORIES)
         layout.addRow("Category *:", self.category_input)
 
         self.amount_input = QDoubleSpinBox()
@@ -70,6 +92,15 @@ class AddExpenseDialog(QDialog):
         btn_layout.addWidget(save_btn)
         layout.addRow(btn_layout)
 
+    def reset(self):
+        """Clear inputs so the dialog can be reused."""
+        self.title_input.clear()
+        self.category_input.setCurrentIndex(0)
+        self.amount_input.setValue(0)
+        self.date_input.setDate(QDate.currentDate())
+        self.vendor_input.clear()
+        self.description_input.clear()
+
     def get_data(self):
         """Get form data."""
         return {
@@ -83,13 +114,106 @@ class AddExpenseDialog(QDialog):
         }
 
 
+class ExpenseTableModel(QAbstractTableModel):
+    """Table model for the expenses currently shown in the view.
+
+    Keeps a row index by expense id so single expenses can be added or
+    removed without repopulating the table.
+    """
+
+    COLUMNS = ["Date", "Title", "Category", "Amount", "Vendor"]
+    FIELDS = ("date", "title", "category", "amount", "vendor")
+
+    def __init__(self, parent=None):
+        """Initialize model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._rows = []
+        self._row_by_id = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        return getattr(self._rows[index.row()], self.FIELDS[index.column()])
+
+    def set_expenses(self, expenses):
+        """Replace all rows.
+
+        Args:
+            expenses: Iterable of ExpenseRecord
+        """
+        self.beginResetModel()
+        self._rows = list(expenses)
+        self._row_by_id = {expense.id: row for row, expense in enumerate(self._rows)}
+        self.endResetModel()
+
+    def append_expense(self, expense):
+        """Append a single row.
+
+        Args:
+            expense: ExpenseRecord
+        """
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(expense)
+        self._row_by_id[expense.id] = row
+        self.endInsertRows()
+
+    def remove_expense(self, expense_id):
+        """Remove the row for an expense, if shown.
+
+        Args:
+            expense_id: Expense ID
+        """
+        row = self._row_by_id.pop(expense_id, None)
+        if row is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+        for shifted in self._rows[row:]:
+            self._row_by_id[shifted.id] -= 1
+
+    def expense_at(self, row):
+        """Get the ExpenseRecord for a row."""
+        return self._rows[row]
+
+
 class ExpensesView(QWidget):
     """Expenses tracking view."""
 
     def __init__(self):
         super().__init__()
         self.api_url = "http://localhost:8000/api/expenses"
-        self.expenses = []
+        self.expenses = {}
+        self._next_id = 1
+        self.model = ExpenseTableModel(self)
+
+        # Running aggregates, kept in step with self.expenses
+        self._total = 0.0
+        self._month_total = 0.0
+        self._by_category = defaultdict(dict)
+        self._current_ym = self._year_month()
+        self._refresh_pending = False
+        self._add_dialog = None
+
         self.setup_ui()
         # We'll load expenses when the backend endpoint is ready
 
@@ -103,10 +227,7 @@ class ExpensesView(QWidget):
         header_layout = QHBoxLayout()
 
         title = QLabel("Expense Tracking")
-        title_font = QFont()
-        title_font.setPointSize(28)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(title_font())
         header_layout.addWidget(title)
 
         header_layout.addStretch()
@@ -125,11 +246,11 @@ class ExpensesView(QWidget):
         summary_layout = QHBoxLayout()
 
         self.total_label = QLabel("Total Expenses: $0.00")
-        self.total_label.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px; background-color: #e8f4f8; border-radius: 5px;")
+        self.total_label.setStyleSheet(TOTAL_CARD_CSS)
         summary_layout.addWidget(self.total_label)
 
         self.month_label = QLabel("This Month: $0.00")
-        self.month_label.setStyleSheet("font-size: 16px; font-weight: bold; padding: 10px; background-color: #fff4e6; border-radius: 5px;")
+        self.month_label.setStyleSheet(MONTH_CARD_CSS)
         summary_layout.addWidget(self.month_label)
 
         layout.addLayout(summary_layout)
@@ -141,9 +262,7 @@ class ExpensesView(QWidget):
         filter_layout.addWidget(category_label)
 
         self.category_filter = QComboBox()
-        self.category_filter.addItems([
-            "All", "Inventory", "Shipping", "Supplies", "Fees", "Marketing", "Other"
-        ])
+        self.category_filter.addItems(("All",) + EXPENSE_CATEGORIES)
         self.category_filter.currentTextChanged.connect(self.apply_filters)
         filter_layout.addWidget(self.category_filter)
 
@@ -152,26 +271,37 @@ class ExpensesView(QWidget):
         layout.addLayout(filter_layout)
 
         # Expenses table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Date", "Title", "Category", "Amount", "Vendor", "Actions"
-        ])
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(3, CurrencyDelegate(self.table))
+        header = self.table.horizontalHeader()
+        for column, width in {0: 100, 2: 120, 3: 100, 4: 150}.items():
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(column, width)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self.show_context_menu)
         layout.addWidget(self.table)
 
         # Placeholder message
         self.placeholder_label = QLabel("No expenses recorded yet.\nClick 'Add Expense' to get started!")
         self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.placeholder_label.setStyleSheet("color: #999; font-size: 14px; padding: 40px;")
+        self.placeholder_label.setStyleSheet(PLACEHOLDER_CSS)
         layout.addWidget(self.placeholder_label)
         self.table.hide()
 
     def show_add_dialog(self):
         """Show add expense dialog."""
-        dialog = AddExpenseDialog(self)
+        if self._add_dialog is None:
+            self._add_dialog = AddExpenseDialog(self)
+        else:
+            self._add_dialog.reset()
+
+        dialog = self._add_dialog
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
             if not data["title"]:
@@ -183,26 +313,83 @@ class ExpensesView(QWidget):
 
     def add_expense_local(self, data):
         """Add expense locally (temporary until backend ready)."""
-        expense = {
-            "id": len(self.expenses) + 1,
-            "title": data["title"],
-            "category": data["category"],
-            "amount": data["amount"],
-            "date": data["date"],
-            "vendor": data.get("vendor", ""),
-            "description": data.get("description", ""),
-        }
-        self.expenses.append(expense)
-        self.display_expenses()
+        expense = ExpenseRecord(
+            id=self._next_id,
+            title=data["title"],
+            category=data["category"],
+            amount=data["amount"],
+            date=data["date"],
+            vendor=data.get("vendor", ""),
+            description=data.get("description", ""),
+        )
+        self._next_id += 1
+        self.expenses[expense.id] = expense
+        self._track_expense(expense)
+
+        if self.category_filter.currentText() in ("All", expense.category):
+            self.model.append_expense(expense)
+        self.update_summary()
         QMessageBox.information(self, "Success", "Expense added successfully!")
 
+    def _track_expense(self, expense):
+        """Add an expense to the running aggregates."""
+        self._total += expense.amount
+        if expense.ym == self._current_ym:
+            self._month_total += expense.amount
+        self._by_category[expense.category][expense.id] = expense
+
+    def _untrack_expense(self, expense):
+        """Remove an expense from the running aggregates."""
+        self._total -= expense.amount
+        if expense.ym == self._current_ym:
+            self._month_total -= expense.amount
+        del self._by_category[expense.category][expense.id]
+
+    @staticmethod
+    def _year_month():
+        """Get the current year and month as an int (e.g. 202401)."""
+        now = datetime.now()
+        return now.year * 100 + now.month
+
+    def _check_month_rollover(self):
+        """Recompute the month total if the calendar month has changed."""
+        current_ym = self._year_month()
+        if current_ym != self._current_ym:
+            self._current_ym = current_ym
+            self._month_total = sum(
+                e.amount for e in self.expenses.values() if e.ym == current_ym
+            )
+
     def load_expenses(self):
         """Load expenses from API (will be implemented when backend ready)."""
         # For now, just display what we have locally
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Redisplay expenses once the current event-loop pass finishes.
+
+        Multiple requests within the same pass collapse into one redisplay.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run a scheduled redisplay."""
+        self._refresh_pending = False
         self.display_expenses()
 
     def display_expenses(self):
         """Display expenses in table."""
+        category = self.category_filter.currentText()
+        if category == "All":
+            self.model.set_expenses(self.expenses.values())
+        else:
+            self.model.set_expenses(self._by_category.get(category, {}).values())
+        self.update_summary()
+
+    def update_summary(self):
+        """Update totals and toggle the empty-state placeholder."""
         if not self.expenses:
             self.placeholder_label.show()
             self.table.hide()
@@ -210,41 +397,27 @@ class ExpensesView(QWidget):
 
         self.placeholder_label.hide()
         self.table.show()
+        self._check_month_rollover()
 
-        # Apply filters
-        filtered = self.expenses
-        category = self.category_filter.currentText()
-        if category != "All":
-            filtered = [e for e in self.expenses if e["category"] == category]
-
-        self.table.setRowCount(len(filtered))
-
-        total = sum(e["amount"] for e in self.expenses)
-        self.total_label.setText(f"Total Expenses: ${total:.2f}")
-
-        # Calculate this month
-        current_month = datetime.now().strftime("%Y-%m")
-        month_total = sum(e["amount"] for e in self.expenses if e["date"].startswith(current_month))
-        self.month_label.setText(f"This Month: ${month_total:.2f}")
+        self.total_label.setText(f"Total Expenses: ${self._total:.2f}")
+        self.month_label.setText(f"This Month: ${self._month_total:.2f}")
 
-        for row, expense in enumerate(filtered):
-            self.table.setItem(row, 0, QTableWidgetItem(expense["date"]))
-            self.table.setItem(row, 1, QTableWidgetItem(expense["title"]))
-            self.table.setItem(row, 2, QTableWidgetItem(expense["category"]))
-            self.table.setItem(row, 3, QTableWidgetItem(f"${expense['amount']:.2f}"))
-            self.table.setItem(row, 4, QTableWidgetItem(expense.get("vendor", "")))
+    def show_context_menu(self, pos):
+        """Show row actions for the expense under the cursor.
 
-            # Action buttons
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(4, 4, 4, 4)
+        Args:
+            pos: Click position in table viewport coordinates
+        """
+        index = self.table.indexAt(pos)
+        if not index.isValid():
+            return
 
-            delete_btn = QPushButton("Delete")
-            delete_btn.setMaximumWidth(80)
-            delete_btn.clicked.connect(lambda checked, exp_id=expense["id"]: self.delete_expense(exp_id))
-            action_layout.addWidget(delete_btn)
+        expense_id = self.model.expense_at(index.row()).id
 
-            self.table.setCellWidget(row, 5, action_widget)
+        menu = QMenu(self)
+        delete_action = menu.addAction("Delete")
+        if menu.exec(self.table.viewport().mapToGlobal(pos)) == delete_action:
+            self.delete_expense(expense_id)
 
     def delete_expense(self, expense_id):
         """Delete an expense."""
@@ -255,12 +428,21 @@ class ExpensesView(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.expenses = [e for e in self.expenses if e["id"] != expense_id]
-            self.display_expenses()
+            expense = self.expenses.pop(expense_id, None)
+            if expense is None:
+                return
+
+            self._untrack_expense(expense)
+            if not self.expenses:
+                # Drop accumulated float error once the list is empty
+                self._total = self._month_total = 0.0
+
+            self.model.remove_expense(expense_id)
+            self.update_summary()
 
     def apply_filters(self):
         """Apply filters to expense list."""
-        self.display_expenses()
+        self._schedule_refresh()
 
     def refresh(self):
         """Refresh view."""
@@ -3,17 +3,27 @@ Inventory view for managing items.
 """
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QTableWidget, QTableWidgetItem, QLineEdit, QComboBox,
+    QTableView, QLineEdit, QComboBox,
     QHeaderView, QMessageBox, QDialog, QFormLayout, QTextEdit,
-    QDoubleSpinBox, QFileDialog
+    QDoubleSpinBox, QFileDialog, QMenu
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont
-import requests
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
 import logging
 
+from src.gui.workers import run_in_background, create_api_session
+from src.gui.widgets.delegates import CurrencyDelegate
+from src.gui.themes.styles import title_font, ITEM_CATEGORIES, ITEM_CONDITIONS, ITEM_STATUSES
+
 logger = logging.getLogger(__name__)
 
+# Background colors for the status column
+STATUS_COLORS = {
+    "Sold": QColor(Qt.GlobalColor.green),
+    "Listed": QColor(Qt.GlobalColor.cyan),
+    "Draft": QColor(Qt.GlobalColor.yellow),
+}
+
 
 class AddItemDialog(QDialog):
     """Dialog for adding new items."""
@@ -33,10 +43,7 @@ class AddItemDialog(QDialog):
         layout.addRow("Title *:", self.title_input)
 
         self.category_input = QComboBox()
-        self.category_input.addItems([
-            "Clothing", "Electronics", "Collectibles", "Books",
-            "Toys", "Home & Garden", "Sports", "Vintage", "Other"
-        ])
+        self.category_input.addItems(ITEM_CATEGORIES)
         layout.addRow("Category:", self.category_input)
 
         self.cost_input = QDoubleSpinBox()
@@ -45,7 +52,7 @@ class AddItemDialog(QDialog):
         layout.addRow("Cost *:", self.cost_input)
 
         self.condition_input = QComboBox()
-        self.condition_input.addItems(["New", "Like New", "Good", "Fair", "Poor"])
+        self.condition_input.addItems(ITEM_CONDITIONS)
         self.condition_input.setCurrentText("Good")
         layout.addRow("Condition:", self.condition_input)
 
@@ -65,6 +72,14 @@ class AddItemDialog(QDialog):
         btn_layout.addWidget(save_btn)
         layout.addRow(btn_layout)
 
+    def reset(self):
+        """Clear inputs so the dialog can be reused."""
+        self.title_input.clear()
+        self.category_input.setCurrentIndex(0)
+        self.cost_input.setValue(0)
+        self.condition_input.setCurrentText("Good")
+        self.notes_input.clear()
+
     def get_data(self):
         """Get form data."""
         return {
@@ -77,15 +92,125 @@ class AddItemDialog(QDialog):
         }
 
 
+class InventoryTableModel(QAbstractTableModel):
+    """Table model that pages inventory items in from the API on demand.
+
+    Only the first page is requested up front; further pages are fetched
+    when the view scrolls near the end via canFetchMore/fetchMore. Page
+    requests are asynchronous: fetch_page starts the request and the view
+    hands the result back through append_page.
+    """
+
+    COLUMNS = ["ID", "Title", "Category", "Cost", "Price", "Status"]
+    PAGE_SIZE = 100
+
+    def __init__(self, fetch_page, parent=None):
+        """Initialize model.
+
+        Args:
+            fetch_page: Callable taking (offset, limit) that requests a page
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._fetch_page = fetch_page
+        self._items = []
+        self._has_more = False
+        self._loading = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        item = self._items[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return str(item.get("id", ""))
+            elif column == 1:
+                return item.get("title", "")
+            elif column == 2:
+                return item.get("category", "")
+            elif column == 3:
+                return item.get("cost") or 0.0
+            elif column == 4:
+                return item.get("price") or 0.0
+            elif column == 5:
+                return item.get("status", "")
+        elif role == Qt.ItemDataRole.BackgroundRole and column == 5:
+            return STATUS_COLORS.get(item.get("status", ""))
+
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._loading = True
+        self._fetch_page(len(self._items), self.PAGE_SIZE)
+
+    def reset(self, items):
+        """Replace all rows with the first page of results.
+
+        Args:
+            items: First page of items
+        """
+        self.beginResetModel()
+        self._items = list(items)
+        self._has_more = len(items) >= self.PAGE_SIZE
+        self._loading = False
+        self.endResetModel()
+
+    def append_page(self, items):
+        """Append a further page of results.
+
+        Args:
+            items: Page of items
+        """
+        self._has_more = len(items) >= self.PAGE_SIZE
+        self._loading = False
+        if not items:
+            return
+
+        start = len(self._items)
+        self.beginInsertRows(QModelIndex(), start, start + len(items) - 1)
+        self._items.extend(items)
+        self.endInsertRows()
+
+    def item_at(self, row):
+        """Get item data for a row."""
+        return self._items[row]
+
+
 class InventoryView(QWidget):
     """Inventory management view."""
 
     def __init__(self):
         super().__init__()
         self.api_url = "http://localhost:8000/api/inventory"
-        self.items = []
+        self._session = create_api_session()
+        self.model = InventoryTableModel(self.fetch_page, self)
+        self._query_generation = 0
+        # Filters of the current query, reused for every page of it
+        self._query_params = {}
+        self._refresh_pending = False
+        self._add_dialog = None
+        self._loaded = False
         self.setup_ui()
-        self.load_items()
+        # Items are loaded on first show
 
     def setup_ui(self):
         """Setup user interface."""
@@ -97,10 +222,7 @@ class InventoryView(QWidget):
         header_layout = QHBoxLayout()
 
         title = QLabel("Inventory Management")
-        title_font = QFont()
-        title_font.setPointSize(28)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(title_font())
         header_layout.addWidget(title)
 
         header_layout.addStretch()
@@ -110,7 +232,7 @@ class InventoryView(QWidget):
         header_layout.addWidget(add_btn)
 
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self.load_items)
+        refresh_btn.clicked.connect(self._schedule_refresh)
         header_layout.addWidget(refresh_btn)
 
         layout.addLayout(header_layout)
@@ -128,19 +250,16 @@ class InventoryView(QWidget):
         filter_layout.addWidget(status_label)
 
         self.status_filter = QComboBox()
-        self.status_filter.addItems(["All", "Draft", "Ready", "Listed", "Sold", "Archived"])
-        self.status_filter.currentTextChanged.connect(self.load_items)
+        self.status_filter.addItems(("All",) + ITEM_STATUSES)
+        self.status_filter.currentTextChanged.connect(self.on_search_changed)
         filter_layout.addWidget(self.status_filter)
 
         category_label = QLabel("Category:")
         filter_layout.addWidget(category_label)
 
         self.category_filter = QComboBox()
-        self.category_filter.addItems([
-            "All", "Clothing", "Electronics", "Collectibles", "Books",
-            "Toys", "Home & Garden", "Sports", "Vintage", "Other"
-        ])
-        self.category_filter.currentTextChanged.connect(self.load_items)
+        self.category_filter.addItems(("All",) + ITEM_CATEGORIES)
+        self.category_filter.currentTextChanged.connect(self.on_search_changed)
         filter_layout.addWidget(self.category_filter)
 
         filter_layout.addStretch()
@@ -148,29 +267,42 @@ class InventoryView(QWidget):
         layout.addLayout(filter_layout)
 
         # Items table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Title", "Category", "Cost", "Price", "Status", "Actions"
-        ])
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        currency_delegate = CurrencyDelegate(self.table)
+        self.table.setItemDelegateForColumn(3, currency_delegate)
+        self.table.setItemDelegateForColumn(4, currency_delegate)
+        header = self.table.horizontalHeader()
+        for column, width in {0: 60, 2: 120, 3: 90, 4: 90, 5: 90}.items():
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(column, width)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self.show_context_menu)
         layout.addWidget(self.table)
 
         # Search timer (debounce)
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
-        self.search_timer.timeout.connect(self.load_items)
+        self.search_timer.timeout.connect(self._schedule_refresh)
 
     def on_search_changed(self):
-        """Handle search text change."""
+        """Handle search text or filter change."""
         self.search_timer.stop()
-        self.search_timer.start(500)  # Wait 500ms before searching
+        self.search_timer.start(300)  # Coalesce rapid changes into one request
 
     def show_add_dialog(self):
         """Show add item dialog."""
-        dialog = AddItemDialog(self)
+        if self._add_dialog is None:
+            self._add_dialog = AddItemDialog(self)
+        else:
+            self._add_dialog.reset()
+
+        dialog = self._add_dialog
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
             if not data["title"]:
@@ -185,79 +317,123 @@ class InventoryView(QWidget):
         Args:
             data: Item data dictionary
         """
+        run_in_background(
+            self._session.post, self.api_url + "/items", json=data, timeout=10,
+            on_result=self._on_item_created,
+            on_error=self._on_item_created_failed
+        )
+
+    def _on_item_created(self, response):
+        """Handle create item response."""
         try:
-            response = requests.post(self.api_url + "/items", json=data, timeout=10)
             if response.status_code == 200:
                 QMessageBox.information(self, "Success", "Item created successfully!")
-                self.load_items()
+                self._schedule_refresh()
             else:
                 error = response.json().get("detail", "Unknown error")
                 QMessageBox.critical(self, "Error", f"Failed to create item: {error}")
         except Exception as e:
-            logger.error(f"Failed to create item: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to create item: {str(e)}")
+            self._on_item_created_failed(str(e))
+
+    def _on_item_created_failed(self, error):
+        """Handle create item failure."""
+        logger.error(f"Failed to create item: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to create item: {error}")
+
+    def build_params(self):
+        """Build query parameters from the current filters.
+
+        Returns:
+            Query parameters dictionary
+        """
+        params = {}
+        status = self.status_filter.currentText()
+        if status != "All":
+            params["status"] = status
+
+        category = self.category_filter.currentText()
+        if category != "All":
+            params["category"] = category
+
+        search = self.search_box.text().strip()
+        if search:
+            params["search"] = search
+
+        return params
+
+    def fetch_page(self, offset, limit):
+        """Request one page of items from API in the background.
+
+        The first page replaces the model contents; later pages are appended.
+        Responses for a superseded query are dropped.
+
+        Args:
+            offset: Number of items to skip
+            limit: Page size
+        """
+        generation = self._query_generation
+        # Later pages reuse the filters of the query that loaded the first
+        # page, not widgets that may have changed since (e.g. while the
+        # search debounce is pending)
+        params = dict(self._query_params, limit=limit)
+        if offset:
+            # Continue after the last loaded row instead of skipping rows
+            params["after_id"] = self.model.item_at(offset - 1)["id"]
+
+        run_in_background(
+            self._session.get, self.api_url + "/items",
+            params=params, timeout=10,
+            on_result=lambda response: self._on_page_loaded(response, offset, generation),
+            on_error=lambda error: self._on_page_failed(error, offset, generation)
+        )
+
+    def _on_page_loaded(self, response, offset, generation):
+        """Handle a page of items returned by the API."""
+        if response.status_code != 200:
+            self._on_page_failed(f"HTTP {response.status_code}", offset, generation)
+            return
+        if generation != self._query_generation:
+            return
+
+        items = response.json()
+        if offset == 0:
+            self.model.reset(items)
+        else:
+            self.model.append_page(items)
+
+    def _on_page_failed(self, error, offset, generation):
+        """Handle a failed page request."""
+        logger.error(f"Failed to load items: {error}")
+        if generation != self._query_generation:
+            return
+
+        if offset == 0:
+            self.model.reset([])
+        else:
+            self.model.append_page([])
 
     def load_items(self):
-        """Load items from API."""
-        try:
-            # Build query parameters
-            params = {}
-            status = self.status_filter.currentText()
-            if status != "All":
-                params["status"] = status
+        """Load first page of items from API."""
+        self._query_generation += 1
+        self._query_params = self.build_params()
+        self.fetch_page(0, InventoryTableModel.PAGE_SIZE)
 
-            category = self.category_filter.currentText()
-            if category != "All":
-                params["category"] = category
+    def show_context_menu(self, pos):
+        """Show row actions for the item under the cursor.
 
-            search = self.search_box.text().strip()
-            if search:
-                params["search"] = search
+        Args:
+            pos: Click position in table viewport coordinates
+        """
+        index = self.table.indexAt(pos)
+        if not index.isValid():
+            return
 
-            params["limit"] = 1000  # Get all items
+        item_id = self.model.item_at(index.row())["id"]
 
-            response = requests.get(self.api_url + "/items", params=params, timeout=10)
-            if response.status_code == 200:
-                self.items = response.json()
-                self.display_items()
-            else:
-                logger.error(f"Failed to load items: {response.status_code}")
-        except Exception as e:
-            logger.error(f"Failed to load items: {e}")
-
-    def display_items(self):
-        """Display items in table."""
-        self.table.setRowCount(len(self.items))
-
-        for row, item in enumerate(self.items):
-            self.table.setItem(row, 0, QTableWidgetItem(str(item.get("id", ""))))
-            self.table.setItem(row, 1, QTableWidgetItem(item.get("title", "")))
-            self.table.setItem(row, 2, QTableWidgetItem(item.get("category", "")))
-            self.table.setItem(row, 3, QTableWidgetItem(f"${item.get('cost', 0):.2f}"))
-            self.table.setItem(row, 4, QTableWidgetItem(f"${item.get('price', 0):.2f}"))
-
-            # Status with color
-            status_item = QTableWidgetItem(item.get("status", ""))
-            status = item.get("status", "")
-            if status == "Sold":
-                status_item.setBackground(Qt.GlobalColor.green)
-            elif status == "Listed":
-                status_item.setBackground(Qt.GlobalColor.cyan)
-            elif status == "Draft":
-                status_item.setBackground(Qt.GlobalColor.yellow)
-            self.table.setItem(row, 5, status_item)
-
-            # Action buttons
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(4, 4, 4, 4)
-
-            delete_btn = QPushButton("Delete")
-            delete_btn.setMaximumWidth(80)
-            delete_btn.clicked.connect(lambda checked, item_id=item["id"]: self.delete_item(item_id))
-            action_layout.addWidget(delete_btn)
-
-            self.table.setCellWidget(row, 6, action_widget)
+        menu = QMenu(self)
+        delete_action = menu.addAction("Delete")
+        if menu.exec(self.table.viewport().mapToGlobal(pos)) == delete_action:
+            self.delete_item(item_id)
 
     def delete_item(self, item_id):
         """Delete an item.
@@ -272,18 +448,50 @@ class InventoryView(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                response = requests.delete(f"{self.api_url}/items/{item_id}", timeout=10)
-                if response.status_code == 200:
-                    QMessageBox.information(self, "Success", "Item deleted successfully!")
-                    self.load_items()
-                else:
-                    error = response.json().get("detail", "Unknown error")
-                    QMessageBox.critical(self, "Error", f"Failed to delete item: {error}")
-            except Exception as e:
-                logger.error(f"Failed to delete item: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to delete item: {str(e)}")
+            run_in_background(
+                self._session.delete, f"{self.api_url}/items/{item_id}", timeout=10,
+                on_result=self._on_item_deleted,
+                on_error=self._on_item_deleted_failed
+            )
+
+    def _on_item_deleted(self, response):
+        """Handle delete item response."""
+        try:
+            if response.status_code == 200:
+                QMessageBox.information(self, "Success", "Item deleted successfully!")
+                self._schedule_refresh()
+            else:
+                error = response.json().get("detail", "Unknown error")
+                QMessageBox.critical(self, "Error", f"Failed to delete item: {error}")
+        except Exception as e:
+            self._on_item_deleted_failed(str(e))
+
+    def _on_item_deleted_failed(self, error):
+        """Handle delete item failure."""
+        logger.error(f"Failed to delete item: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to delete item: {error}")
+
+    def showEvent(self, event):
+        """Load items the first time the view is shown."""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Reload items once the current event-loop pass finishes.
+
+        Multiple requests within the same pass collapse into one reload.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run a scheduled reload."""
+        self._refresh_pending = False
+        self.load_items()
 
     def refresh(self):
         """Refresh view."""
-        self.load_items()
+        self._schedule_refresh()
@@ -6,14 +6,28 @@ from PyQt6.QtWidgets import (
     QGroupBox, QFormLayout, QLineEdit, QMessageBox, QTextEdit, QComboBox,
     QScrollArea, QFrame
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-import requests
+from PyQt6.QtCore import Qt, QTimer
+import io
 import logging
-import os
+import re
+import time
+from pathlib import Path
+from dotenv import dotenv_values
+
+from src.gui.workers import run_in_background, create_api_session
+from src.gui.themes.styles import title_font
 
 logger = logging.getLogger(__name__)
 
+ENV_PATH = Path(".env")
+ENV_KEY_PATTERN = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=")
+
+# Seconds a successful status response is reused across refreshes
+STATUS_CACHE_TTL = 5.0
+
+# Milliseconds to wait for further refresh requests before reloading
+REFRESH_DELAY_MS = 200
+
 
 class SettingsView(QWidget):
     """Settings view for configuring the application."""
@@ -21,8 +35,17 @@ class SettingsView(QWidget):
     def __init__(self):
         super().__init__()
         self.api_url = "http://localhost:8000/api"
+        self._session = create_api_session()
+        self._http_cache = {}
+        self._loaded = False
+        self._refresh_pending = False
+        self._sections_built = False
+        self._env_setters = {}
+        self._env_cache = {}
+        self._env_lines = []
+        self._env_stamp = None
         self.setup_ui()
-        self.load_settings()
+        # Remaining sections are built and settings loaded on first show
 
     def setup_ui(self):
         """Setup user interface."""
@@ -45,10 +68,7 @@ class SettingsView(QWidget):
 
         # Header
         title = QLabel("Settings")
-        title_font = QFont()
-        title_font.setPointSize(28)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(title_font())
         layout.addWidget(title)
 
         # eBay settings
@@ -109,6 +129,18 @@ class SettingsView(QWidget):
 
         layout.addWidget(ebay_group)
 
+        layout.addStretch()
+        self._content_layout = layout
+
+    def _ensure_sections(self):
+        """Build the AI, system info and logs sections on first use."""
+        if self._sections_built:
+            return
+        self._sections_built = True
+
+        # Sections go ahead of the trailing stretch
+        layout = self._content_layout
+
         # AI settings
         ai_group = QGroupBox("AI Configuration")
         ai_layout = QFormLayout(ai_group)
@@ -133,7 +165,7 @@ class SettingsView(QWidget):
         ollama_link.setOpenExternalLinks(True)
         ai_layout.addRow("Need Ollama?", ollama_link)
 
-        layout.addWidget(ai_group)
+        layout.insertWidget(layout.count() - 1, ai_group)
 
         # System info
         info_group = QGroupBox("System Information")
@@ -152,7 +184,7 @@ class SettingsView(QWidget):
         refresh_info_btn.clicked.connect(self.load_system_info)
         info_layout.addRow(refresh_info_btn)
 
-        layout.addWidget(info_group)
+        layout.insertWidget(layout.count() - 1, info_group)
 
         # Logs
         logs_group = QGroupBox("Application Logs")
@@ -171,48 +203,189 @@ class SettingsView(QWidget):
         logs_btn_layout.addStretch()
         logs_layout.addLayout(logs_btn_layout)
 
-        layout.addWidget(logs_group)
-
-        layout.addStretch()
+        layout.insertWidget(layout.count() - 1, logs_group)
+
+        # Widget setters for the .env keys shown in this view
+        self._env_setters = {
+            'EBAY_CLIENT_ID': self.ebay_client_id_input.setText,
+            'EBAY_CLIENT_SECRET': self.ebay_client_secret_input.setText,
+            'EBAY_ENVIRONMENT': self._set_ebay_environment,
+            'OLLAMA_BASE_URL': self.ollama_url_input.setText,
+            'OLLAMA_MODEL': self.ollama_model_input.setText,
+        }
+
+    def showEvent(self, event):
+        """Build remaining sections and load settings the first time the view is shown."""
+        super().showEvent(event)
+        self._ensure_sections()
+        if not self._loaded:
+            # Shares the pending timer with a refresh() from the same view switch
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Reload settings once requests stop arriving for a short interval.
+
+        Rapid view switches collapse into a single set of status requests.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(REFRESH_DELAY_MS, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run a scheduled reload."""
+        self._refresh_pending = False
+        self.load_settings()
 
     def load_settings(self):
         """Load current settings."""
+        self._ensure_sections()
+        self._loaded = True
         self.load_ebay_credentials()
-        self.check_ebay_status()
-        self.check_ollama_status()
-        self.load_system_info()
+        run_in_background(
+            self._cached_get, f"{self.api_url}/system/bootstrap",
+            on_result=self._on_bootstrap,
+            on_error=self._on_bootstrap_failed
+        )
+
+    def _cached_get(self, url):
+        """GET a status URL and return its data, reusing a recent result.
+
+        Runs on worker threads. Only the parsed data is cached, and only
+        when neither it nor any of its sections reports an error, so a
+        transient backend failure is retried on the next refresh.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            The "data" member of the JSON response
+
+        Raises:
+            requests.HTTPError: If the response is not successful
+        """
+        hit = self._http_cache.get(url)
+        if hit and time.monotonic() - hit[0] < STATUS_CACHE_TTL:
+            return hit[1]
+
+        response = self._session.get(url, timeout=5)
+        response.raise_for_status()
+        data = response.json().get("data", {})
+        sections = [data] + [value for value in data.values() if isinstance(value, dict)]
+        if not any("error" in section for section in sections):
+            self._http_cache[url] = (time.monotonic(), data)
+        return data
+
+    def _invalidate_status(self, *paths):
+        """Drop cached status responses whose state is known to have changed.
+
+        Args:
+            *paths: API paths relative to api_url
+        """
+        for path in paths + ("/system/bootstrap",):
+            self._http_cache.pop(f"{self.api_url}{path}", None)
+
+    def _on_bootstrap(self, data):
+        """Update all status labels from the combined bootstrap data."""
+        appliers = (
+            ("ebay", self._apply_ebay_status, self._on_ebay_status_failed),
+            ("ollama", self._apply_ollama_status, self._on_ollama_status_failed),
+            ("system", self._apply_system_info, self._on_system_info_failed),
+        )
+        for name, apply, on_error in appliers:
+            section = data.get(name, {})
+            if "error" in section:
+                on_error(section["error"])
+            else:
+                apply(section)
+
+    def _on_bootstrap_failed(self, error):
+        """Mark every status as failed when the bootstrap request fails."""
+        self._on_ebay_status_failed(error)
+        self._on_ollama_status_failed(error)
+        self._on_system_info_failed(error)
+
+    def _read_env(self) -> dict:
+        """Read key/value pairs from the .env file.
+
+        The raw lines and parsed values are cached and reused until the
+        file's modification time or size changes.
+
+        Returns:
+            Dictionary of settings (empty if the file does not exist)
+        """
+        try:
+            stat = ENV_PATH.stat()
+        except FileNotFoundError:
+            self._env_cache, self._env_lines, self._env_stamp = {}, [], None
+            return {}
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._env_stamp != stamp:
+            self._cache_env(ENV_PATH.read_text(), stamp)
+        return dict(self._env_cache)
+
+    def _cache_env(self, text: str, stamp):
+        """Remember the lines and parsed values of .env text.
+
+        Args:
+            text: Contents of the .env file
+            stamp: (mtime_ns, size) of the file holding text
+        """
+        self._env_lines = text.splitlines()
+        self._env_cache = {
+            key: value
+            for key, value in dotenv_values(stream=io.StringIO(text)).items()
+            if value is not None
+        }
+        self._env_stamp = stamp
+
+    def _update_env(self, updates: dict):
+        """Set keys in the .env file, preserving comments and other entries.
+
+        Every line assigning an updated key is replaced; the first keeps
+        its place and later duplicates are dropped. The file is only read
+        if it changed since it was last cached, and is written once
+        regardless of how many keys change.
+
+        Args:
+            updates: Keys and values to set
+        """
+        self._read_env()
+
+        lines = []
+        written = set()
+        for line in self._env_lines:
+            match = ENV_KEY_PATTERN.match(line)
+            key = match.group(1) if match else None
+            if key in updates:
+                if key not in written:
+                    lines.append(f"{key}={updates[key]}")
+                    written.add(key)
+            else:
+                lines.append(line)
+        lines.extend(f"{key}={value}" for key, value in updates.items() if key not in written)
+
+        text = "\n".join(lines) + "\n"
+        ENV_PATH.write_text(text)
+        stat = ENV_PATH.stat()
+        self._cache_env(text, (stat.st_mtime_ns, stat.st_size))
 
     def load_ebay_credentials(self):
         """Load eBay credentials from .env file."""
         try:
-            env_path = ".env"
-            if os.path.exists(env_path):
-                with open(env_path, 'r') as f:
-                    content = f.read()
-
-                # Parse .env file
-                for line in content.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-
-                        if key == 'EBAY_CLIENT_ID':
-                            self.ebay_client_id_input.setText(value)
-                        elif key == 'EBAY_CLIENT_SECRET':
-                            self.ebay_client_secret_input.setText(value)
-                        elif key == 'EBAY_ENVIRONMENT':
-                            index = self.ebay_environment_combo.findText(value)
-                            if index >= 0:
-                                self.ebay_environment_combo.setCurrentIndex(index)
-                        elif key == 'OLLAMA_BASE_URL':
-                            self.ollama_url_input.setText(value)
-                        elif key == 'OLLAMA_MODEL':
-                            self.ollama_model_input.setText(value)
+            env = self._read_env()
+            for key, setter in self._env_setters.items():
+                if key in env:
+                    setter(env[key])
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
 
+    def _set_ebay_environment(self, value):
+        """Select an eBay environment in the combo box if it is known."""
+        index = self.ebay_environment_combo.findText(value)
+        if index >= 0:
+            self.ebay_environment_combo.setCurrentIndex(index)
+
     def save_ebay_credentials(self):
         """Save eBay credentials to .env file."""
         client_id = self.ebay_client_id_input.text().strip()
@@ -228,29 +401,13 @@ class SettingsView(QWidget):
             return
 
         try:
-            env_path = ".env"
-
-            # Read existing .env content
-            env_content = {}
-            if os.path.exists(env_path):
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            env_content[key.strip()] = value.strip()
-
-            # Update eBay credentials
-            env_content['EBAY_CLIENT_ID'] = client_id
-            env_content['EBAY_CLIENT_SECRET'] = client_secret
-            env_content['EBAY_ENVIRONMENT'] = environment
-            # Always set redirect URI to HTTPS (required by eBay)
-            env_content['EBAY_REDIRECT_URI'] = 'https://localhost:8443'
-
-            # Write back to .env file
-            with open(env_path, 'w') as f:
-                for key, value in env_content.items():
-                    f.write(f"{key}={value}\n")
+            self._update_env({
+                'EBAY_CLIENT_ID': client_id,
+                'EBAY_CLIENT_SECRET': client_secret,
+                'EBAY_ENVIRONMENT': environment,
+                # Always set redirect URI to HTTPS (required by eBay)
+                'EBAY_REDIRECT_URI': 'https://localhost:8443',
+            })
 
             QMessageBox.information(
                 self,
@@ -262,6 +419,7 @@ class SettingsView(QWidget):
             )
 
             logger.info("eBay credentials saved to .env file")
+            self._invalidate_status("/ebay/auth-status")
 
         except Exception as e:
             logger.error(f"Failed to save eBay credentials: {e}")
@@ -282,26 +440,10 @@ class SettingsView(QWidget):
             ollama_model = "phi3"
 
         try:
-            env_path = ".env"
-
-            # Read existing .env content
-            env_content = {}
-            if os.path.exists(env_path):
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            env_content[key.strip()] = value.strip()
-
-            # Update Ollama settings
-            env_content['OLLAMA_BASE_URL'] = ollama_url
-            env_content['OLLAMA_MODEL'] = ollama_model
-
-            # Write back to .env file
-            with open(env_path, 'w') as f:
-                for key, value in env_content.items():
-                    f.write(f"{key}={value}\n")
+            self._update_env({
+                'OLLAMA_BASE_URL': ollama_url,
+                'OLLAMA_MODEL': ollama_model,
+            })
 
             QMessageBox.information(
                 self,
@@ -313,6 +455,7 @@ class SettingsView(QWidget):
             logger.info("Ollama settings saved to .env file")
 
             # Refresh Ollama status
+            self._invalidate_status("/assistant/ollama-status")
             self.check_ollama_status()
 
         except Exception as e:
@@ -325,25 +468,33 @@ class SettingsView(QWidget):
 
     def check_ebay_status(self):
         """Check eBay connection status."""
-        try:
-            response = requests.get(f"{self.api_url}/ebay/auth-status", timeout=5)
-            if response.status_code == 200:
-                data = response.json().get("data", {})
-                if data.get("authenticated"):
-                    self.ebay_status_label.setText("✓ Connected")
-                    self.ebay_status_label.setStyleSheet("color: green; font-weight: bold;")
-                    self.connect_ebay_btn.setEnabled(False)
-                    self.disconnect_ebay_btn.setEnabled(True)
-                else:
-                    self.ebay_status_label.setText("✗ Not Connected")
-                    self.ebay_status_label.setStyleSheet("color: red;")
-                    self.connect_ebay_btn.setEnabled(True)
-                    self.disconnect_ebay_btn.setEnabled(False)
-            else:
-                self.ebay_status_label.setText("Error checking status")
-        except Exception as e:
-            logger.error(f"Failed to check eBay status: {e}")
-            self.ebay_status_label.setText("Error checking status")
+        run_in_background(
+            self._cached_get, f"{self.api_url}/ebay/auth-status",
+            on_result=self._on_ebay_status,
+            on_error=self._on_ebay_status_failed
+        )
+
+    def _on_ebay_status(self, data):
+        """Update eBay status from API status data."""
+        self._apply_ebay_status(data)
+
+    def _apply_ebay_status(self, data):
+        """Update eBay status widgets from status data."""
+        if data.get("authenticated"):
+            self.ebay_status_label.setText("✓ Connected")
+            self.ebay_status_label.setStyleSheet("color: green; font-weight: bold;")
+            self.connect_ebay_btn.setEnabled(False)
+            self.disconnect_ebay_btn.setEnabled(True)
+        else:
+            self.ebay_status_label.setText("✗ Not Connected")
+            self.ebay_status_label.setStyleSheet("color: red;")
+            self.connect_ebay_btn.setEnabled(True)
+            self.disconnect_ebay_btn.setEnabled(False)
+
+    def _on_ebay_status_failed(self, error):
+        """Handle eBay status check failure."""
+        logger.error(f"Failed to check eBay status: {error}")
+        self.ebay_status_label.setText("Error checking status")
 
     def connect_ebay(self):
         """Connect eBay account."""
@@ -355,20 +506,36 @@ class SettingsView(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                response = requests.post(f"{self.api_url}/ebay/auth/login", timeout=120)
-                if response.status_code == 200:
-                    QMessageBox.information(
-                        self, "Success",
-                        "Successfully connected to eBay!"
-                    )
-                    self.check_ebay_status()
-                else:
-                    error = response.json().get("detail", "Unknown error")
-                    QMessageBox.critical(self, "Error", f"Failed to connect: {error}")
-            except Exception as e:
-                logger.error(f"eBay connection failed: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to connect: {str(e)}")
+            # The login call blocks until the browser flow completes
+            self.connect_ebay_btn.setEnabled(False)
+            run_in_background(
+                self._session.post, f"{self.api_url}/ebay/auth/login", timeout=120,
+                on_result=self._on_ebay_connected,
+                on_error=self._on_ebay_connect_failed
+            )
+
+    def _on_ebay_connected(self, response):
+        """Handle eBay login response."""
+        try:
+            if response.status_code == 200:
+                QMessageBox.information(
+                    self, "Success",
+                    "Successfully connected to eBay!"
+                )
+                self._invalidate_status("/ebay/auth-status")
+                self.check_ebay_status()
+            else:
+                error = response.json().get("detail", "Unknown error")
+                self.connect_ebay_btn.setEnabled(True)
+                QMessageBox.critical(self, "Error", f"Failed to connect: {error}")
+        except Exception as e:
+            self._on_ebay_connect_failed(str(e))
+
+    def _on_ebay_connect_failed(self, error):
+        """Handle eBay login failure."""
+        logger.error(f"eBay connection failed: {error}")
+        self.connect_ebay_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", f"Failed to connect: {error}")
 
     def disconnect_ebay(self):
         """Disconnect eBay account."""
@@ -380,58 +547,92 @@ class SettingsView(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                response = requests.post(f"{self.api_url}/ebay/auth/logout", timeout=10)
-                if response.status_code == 200:
-                    QMessageBox.information(self, "Success", "Disconnected from eBay")
-                    self.check_ebay_status()
-                else:
-                    error = response.json().get("detail", "Unknown error")
-                    QMessageBox.critical(self, "Error", f"Failed to disconnect: {error}")
-            except Exception as e:
-                logger.error(f"eBay disconnection failed: {e}")
-                QMessageBox.critical(self, "Error", f"Failed to disconnect: {str(e)}")
+            run_in_background(
+                self._session.post, f"{self.api_url}/ebay/auth/logout", timeout=10,
+                on_result=self._on_ebay_disconnected,
+                on_error=self._on_ebay_disconnect_failed
+            )
 
-    def check_ollama_status(self):
-        """Check Ollama status."""
+    def _on_ebay_disconnected(self, response):
+        """Handle eBay logout response."""
         try:
-            response = requests.get(f"{self.api_url}/assistant/ollama-status", timeout=5)
             if response.status_code == 200:
-                data = response.json().get("data", {})
-                if data.get("available"):
-                    models = ", ".join(data.get("models", []))
-                    self.ollama_status_label.setText(f"✓ Online ({models})")
-                    self.ollama_status_label.setStyleSheet("color: green; font-weight: bold;")
-                else:
-                    self.ollama_status_label.setText("✗ Offline")
-                    self.ollama_status_label.setStyleSheet("color: orange;")
+                QMessageBox.information(self, "Success", "Disconnected from eBay")
+                self._invalidate_status("/ebay/auth-status")
+                self.check_ebay_status()
             else:
-                self.ollama_status_label.setText("Unknown")
+                error = response.json().get("detail", "Unknown error")
+                QMessageBox.critical(self, "Error", f"Failed to disconnect: {error}")
         except Exception as e:
-            logger.error(f"Failed to check Ollama status: {e}")
+            self._on_ebay_disconnect_failed(str(e))
+
+    def _on_ebay_disconnect_failed(self, error):
+        """Handle eBay logout failure."""
+        logger.error(f"eBay disconnection failed: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to disconnect: {error}")
+
+    def check_ollama_status(self):
+        """Check Ollama status."""
+        run_in_background(
+            self._cached_get, f"{self.api_url}/assistant/ollama-status",
+            on_result=self._on_ollama_status,
+            on_error=self._on_ollama_status_failed
+        )
+
+    def _on_ollama_status(self, data):
+        """Update Ollama status from API status data."""
+        self._apply_ollama_status(data)
+
+    def _apply_ollama_status(self, data):
+        """Update Ollama status widgets from status data."""
+        if data.get("available"):
+            models = ", ".join(data.get("models", []))
+            self.ollama_status_label.setText(f"✓ Online ({models})")
+            self.ollama_status_label.setStyleSheet("color: green; font-weight: bold;")
+        else:
             self.ollama_status_label.setText("✗ Offline")
             self.ollama_status_label.setStyleSheet("color: orange;")
 
+    def _on_ollama_status_failed(self, error):
+        """Handle Ollama status check failure."""
+        logger.error(f"Failed to check Ollama status: {error}")
+        self.ollama_status_label.setText("✗ Offline")
+        self.ollama_status_label.setStyleSheet("color: orange;")
+
     def load_system_info(self):
         """Load system information."""
-        try:
-            response = requests.get(f"{self.api_url}/system/info", timeout=5)
-            if response.status_code == 200:
-                data = response.json().get("data", {})
-                self.db_size_label.setText(f"{data.get('database_size_mb', 0)} MB")
-                self.uploads_size_label.setText(f"{data.get('uploads_size_mb', 0)} MB")
-            else:
-                self.db_size_label.setText("Error")
-                self.uploads_size_label.setText("Error")
-        except Exception as e:
-            logger.error(f"Failed to load system info: {e}")
-            self.db_size_label.setText("Error")
-            self.uploads_size_label.setText("Error")
+        run_in_background(
+            self._cached_get, f"{self.api_url}/system/info",
+            on_result=self._on_system_info,
+            on_error=self._on_system_info_failed
+        )
+
+    def _on_system_info(self, data):
+        """Update system information from API info data."""
+        self._apply_system_info(data)
+
+    def _apply_system_info(self, data):
+        """Update system information widgets from info data."""
+        self.db_size_label.setText(f"{data.get('database_size_mb', 0)} MB")
+        self.uploads_size_label.setText(f"{data.get('uploads_size_mb', 0)} MB")
+
+    def _on_system_info_failed(self, error):
+        """Handle system information failure."""
+        logger.error(f"Failed to load system info: {error}")
+        self.db_size_label.setText("Error")
+        self.uploads_size_label.setText("Error")
 
     def load_logs(self):
         """Load recent logs."""
+        run_in_background(
+            self._session.get, f"{self.api_url}/system/logs?lines=50", timeout=5,
+            on_result=self._on_logs_loaded,
+            on_error=self._on_logs_failed
+        )
+
+    def _on_logs_loaded(self, response):
+        """Display logs from API response."""
         try:
-            response = requests.get(f"{self.api_url}/system/logs?lines=50", timeout=5)
             if response.status_code == 200:
                 data = response.json().get("data", {})
                 logs = data.get("logs", [])
@@ -439,9 +640,13 @@ class SettingsView(QWidget):
             else:
                 self.logs_display.setText("Failed to load logs")
         except Exception as e:
-            logger.error(f"Failed to load logs: {e}")
-            self.logs_display.setText(f"Error loading logs: {str(e)}")
+            self._on_logs_failed(str(e))
+
+    def _on_logs_failed(self, error):
+        """Handle log loading failure."""
+        logger.error(f"Failed to load logs: {error}")
+        self.logs_display.setText(f"Error loading logs: {error}")
 
     def refresh(self):
         """Refresh view."""
-        self.load_settings()
+        self._schedule_refresh()
@@ -0,0 +1,17 @@
+"""
+Item delegates for table views.
+"""
+from PyQt6.QtWidgets import QStyledItemDelegate
+
+
+class CurrencyDelegate(QStyledItemDelegate):
+    """Render raw numeric model values as dollar amounts.
+
+    Formatting happens at paint time, so only visible cells are formatted.
+    """
+
+    def displayText(self, value, locale):
+        try:
+            return "$" + locale.toString(float(value or 0), "f", 2)
+        except (TypeError, ValueError):
+            return super().displayText(value, locale)
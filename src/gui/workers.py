@@ -0,0 +1,97 @@
+"""
+Background workers for running blocking calls off the GUI thread.
+"""
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from requests.adapters import HTTPAdapter
+import requests
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Workers still running; keeps their signal objects alive until delivery
+_active_workers = set()
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by ApiWorker.
+
+    Created on the GUI thread so that connected slots are invoked there
+    through a queued connection.
+    """
+
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal()
+
+
+class ApiWorker(QRunnable):
+    """Run a blocking callable (typically a requests call) on the global thread pool."""
+
+    def __init__(self, fn, *args, **kwargs):
+        """Initialize worker.
+
+        Args:
+            fn: Callable to run in the background
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Execute the callable and emit its result or error."""
+        try:
+            try:
+                result = self.fn(*self.args, **self.kwargs)
+            except Exception as e:
+                logger.error(f"Background request failed: {e}")
+                self.signals.error.emit(str(e))
+            else:
+                self.signals.result.emit(result)
+            self.signals.finished.emit()
+        except RuntimeError:
+            # Signals were destroyed because the application is shutting down
+            pass
+
+
+def run_in_background(fn, *args, on_result=None, on_error=None, **kwargs):
+    """Start fn on the global thread pool and route its outcome to GUI slots.
+
+    Args:
+        fn: Callable to run in the background
+        *args: Positional arguments for fn
+        on_result: Slot receiving the return value of fn
+        on_error: Slot receiving the error message if fn raises
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        The started ApiWorker
+    """
+    worker = ApiWorker(fn, *args, **kwargs)
+    if on_result is not None:
+        worker.signals.result.connect(on_result)
+    if on_error is not None:
+        worker.signals.error.connect(on_error)
+
+    _active_workers.add(worker)
+    worker.signals.finished.connect(lambda: _active_workers.discard(worker))
+    QThreadPool.globalInstance().start(worker)
+    return worker
+
+
+def create_api_session():
+    """Create a keep-alive HTTP session for talking to the local API.
+
+    The connection pool is sized so that concurrent worker threads can
+    share the session without opening extra connections.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
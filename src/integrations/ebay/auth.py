@@ -1,26 +1,85 @@
 """
 eBay OAuth authentication handler.
 """
-import webbrowser
 import base64
 import requests
-from urllib.parse import urlencode, parse_qs
-import http.server
-import socketserver
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode, urlparse, urlsplit, unquote_plus
 import ssl
-import tempfile
 import os
-from threading import Thread
+import secrets
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
 from typing import Optional
 from pathlib import Path
 import logging
 
-from src.config.settings import settings
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from src.config.settings import settings, current_settings
 from src.core.security import SecureStorage
 from src.core.exceptions import EbayAuthError
 
 logger = logging.getLogger(__name__)
 
+# Seconds an is_authenticated() result is reused
+AUTH_STATUS_TTL = 5.0
+
+# OAuth scopes requested from eBay
+_OAUTH_SCOPE = " ".join([
+    "https://api.ebay.com/oauth/api_scope/sell.inventory",
+    "https://api.ebay.com/oauth/api_scope/sell.account",
+    "https://api.ebay.com/oauth/api_scope/sell.fulfillment",
+])
+
+# Pages served by the OAuth callback server
+_SUCCESS_HTML = """
+<html>
+<body style="font-family: Arial; text-align: center; padding: 50px;">
+    <h1 style="color: green;">✓ Authorization Successful!</h1>
+    <p>You can close this window and return to ResellerOS.</p>
+</body>
+</html>
+""".encode()
+
+_FAILURE_HTML = """
+<html>
+<body style="font-family: Arial; text-align: center; padding: 50px;">
+    <h1 style="color: red;">✗ Authorization Failed</h1>
+    <p>Please try again or check your eBay credentials.</p>
+</body>
+</html>
+""".encode()
+
+
+def _open_browser(url: str):
+    """Open a URL in the user's browser without waiting on it.
+
+    On Linux, xdg-open is launched directly; webbrowser would otherwise
+    probe several browser backends in turn before returning.
+
+    Args:
+        url: URL to open
+    """
+    if sys.platform.startswith("linux") and shutil.which("xdg-open"):
+        subprocess.Popen(
+            ["xdg-open", url],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    else:
+        import webbrowser
+        webbrowser.open(url, new=2)
+
 
 class EbayAuth:
     """eBay OAuth 2.0 authentication handler."""
@@ -28,19 +87,77 @@ class EbayAuth:
     def __init__(self):
         """Initialize eBay auth handler."""
         self.secure_storage = SecureStorage()
+        # (access_token, monotonic expiry) to avoid decrypting storage per call
+        self._token_cache: Optional[tuple] = None
+        self._refresh_lock = Lock()
+        # (is_authenticated result, monotonic timestamp) for status polling
+        self._auth_status_cache: Optional[tuple] = None
+        self._logged_authorization_url: Optional[str] = None
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        # (token_url, retries) the token endpoint adapter was mounted for
+        self._token_adapter: Optional[tuple] = None
         self._reload_settings()
 
     def _reload_settings(self):
         """Reload settings from .env file to get latest credentials."""
-        # Force reload settings from .env file
-        from src.config.settings import Settings
-        fresh_settings = Settings()
+        fresh_settings = current_settings()
 
         self.client_id = fresh_settings.ebay_client_id
         self.client_secret = fresh_settings.ebay_client_secret
         self.redirect_uri = fresh_settings.ebay_redirect_uri
         self.auth_url = fresh_settings.ebay_auth_url
         self.token_url = fresh_settings.ebay_token_url
+        self.refresh_buffer = fresh_settings.ebay_refresh_buffer
+        self.timeout = fresh_settings.ebay_timeout
+
+        # Retry transient refresh failures instead of forcing a new
+        # interactive login. Mounted on the token URL only, so inventory
+        # writes sharing the session are never replayed, and only remounted
+        # when the URL or retry count changes, so the pooled connection
+        # stays warm between refreshes.
+        token_adapter = (self.token_url, fresh_settings.ebay_token_retries)
+        if token_adapter != self._token_adapter:
+            if self._token_adapter is not None:
+                previous = self.session.adapters.pop(self._token_adapter[0], None)
+                if previous is not None:
+                    previous.close()
+            retry = Retry(
+                total=fresh_settings.ebay_token_retries,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["POST"],
+                raise_on_status=False,
+            )
+            self.session.mount(self.token_url, HTTPAdapter(max_retries=retry))
+            self._token_adapter = token_adapter
+
+        # Local callback server settings derived from the redirect URI.
+        # External URLs (like Cloudflare tunnels) have no explicit port, so
+        # default to 8443 for HTTPS and 8080 for HTTP.
+        redirect = urlparse(self.redirect_uri or "")
+        self._callback_https = redirect.scheme == "https"
+        self._callback_port = redirect.port or (8443 if self._callback_https else 8080)
+        self._callback_is_local = redirect.hostname in ("localhost", "127.0.0.1")
+
+        # Basic auth header for the token endpoint, rebuilt whenever credentials change
+        self._basic_auth = None
+        if self.client_id and self.client_secret:
+            self._basic_auth = "Basic " + base64.b64encode(
+                f"{self.client_id}:{self.client_secret}".encode()
+            ).decode()
+
+        self._build_authorization_url()
+
+    def _build_authorization_url(self):
+        """Precompute the OAuth authorization URL for the current settings."""
+        params = {
+            "client_id": self.client_id,
+            "redirect_uri": self.redirect_uri,
+            "response_type": "code",
+            "scope": _OAUTH_SCOPE,
+        }
+        self._authorization_url = f"{self.auth_url}?{urlencode(params)}"
 
     def _generate_self_signed_cert(self):
         """Generate self-signed certificate for HTTPS OAuth callback.
@@ -58,83 +175,57 @@ class EbayAuth:
         if cert_file.exists() and key_file.exists():
             return str(cert_file), str(key_file)
 
-        # Generate new self-signed certificate using openssl command
-        try:
-            import subprocess
-            subprocess.run([
-                "openssl", "req", "-x509", "-newkey", "rsa:4096",
-                "-keyout", str(key_file),
-                "-out", str(cert_file),
-                "-days", "365", "-nodes",
-                "-subj", "/CN=localhost"
-            ], check=True, capture_output=True)
-
-            logger.info(f"Generated self-signed certificate at {cert_file}")
-            return str(cert_file), str(key_file)
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            logger.warning(f"Could not generate certificate with openssl: {e}")
-            # Fall back to Python's certificate generation
-            return self._generate_cert_python(cert_file, key_file)
+        # Generated in-process; avoids spawning openssl and RSA-4096 keygen
+        return self._generate_cert_python(cert_file, key_file)
 
     def _generate_cert_python(self, cert_file, key_file):
         """Generate certificate using pure Python (cryptography library)."""
-        try:
-            from cryptography import x509
-            from cryptography.x509.oid import NameOID
-            from cryptography.hazmat.primitives import hashes
-            from cryptography.hazmat.primitives.asymmetric import rsa
-            from cryptography.hazmat.primitives import serialization
-            import datetime
-
-            # Generate private key
-            private_key = rsa.generate_private_key(
-                public_exponent=65537,
-                key_size=2048,
-            )
-
-            # Generate certificate
-            subject = issuer = x509.Name([
-                x509.NameAttribute(NameOID.COMMON_NAME, u"localhost"),
-            ])
-
-            cert = x509.CertificateBuilder().subject_name(
-                subject
-            ).issuer_name(
-                issuer
-            ).public_key(
-                private_key.public_key()
-            ).serial_number(
-                x509.random_serial_number()
-            ).not_valid_before(
-                datetime.datetime.utcnow()
-            ).not_valid_after(
-                datetime.datetime.utcnow() + datetime.timedelta(days=365)
-            ).add_extension(
-                x509.SubjectAlternativeName([
-                    x509.DNSName(u"localhost"),
-                ]),
-                critical=False,
-            ).sign(private_key, hashes.SHA256())
-
-            # Write certificate
-            with open(cert_file, "wb") as f:
-                f.write(cert.public_bytes(serialization.Encoding.PEM))
-
-            # Write private key
-            with open(key_file, "wb") as f:
-                f.write(private_key.private_bytes(
-                    encoding=serialization.Encoding.PEM,
-                    format=serialization.PrivateFormat.TraditionalOpenSSL,
-                    encryption_algorithm=serialization.NoEncryption()
-                ))
-
-            logger.info(f"Generated self-signed certificate using cryptography library")
-            return str(cert_file), str(key_file)
-
-        except ImportError:
-            raise EbayAuthError(
-                "Cannot generate HTTPS certificate. Please install openssl or ensure cryptography library is available."
-            )
+        # Generate private key
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=2048,
+        )
+
+        # Generate certificate
+        subject = issuer = x509.Name([
+            x509.NameAttribute(NameOID.COMMON_NAME, u"localhost"),
+        ])
+
+        now = datetime.utcnow()
+        cert = x509.CertificateBuilder().subject_name(
+            subject
+        ).issuer_name(
+            issuer
+        ).public_key(
+            private_key.public_key()
+        ).serial_number(
+            x509.random_serial_number()
+        ).not_valid_before(
+            now
+        ).not_valid_after(
+            now + timedelta(days=3650)
+        ).add_extension(
+            x509.SubjectAlternativeName([
+                x509.DNSName(u"localhost"),
+            ]),
+            critical=False,
+        ).sign(private_key, hashes.SHA256())
+
+        # Write certificate
+        with open(cert_file, "wb") as f:
+            f.write(cert.public_bytes(serialization.Encoding.PEM))
+
+        # Write private key
+        with open(key_file, "wb") as f:
+            f.write(private_key.private_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PrivateFormat.TraditionalOpenSSL,
+                encryption_algorithm=serialization.NoEncryption()
+            ))
+        os.chmod(key_file, 0o600)
+
+        logger.info("Generated self-signed certificate using cryptography library")
+        return str(cert_file), str(key_file)
 
     def get_authorization_url(self) -> str:
         """Generate OAuth authorization URL.
@@ -147,28 +238,23 @@ class EbayAuth:
                 "eBay Client ID is not configured. Please configure it in Settings."
             )
 
-        params = {
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "response_type": "code",
-            "scope": " ".join([
-                "https://api.ebay.com/oauth/api_scope/sell.inventory",
-                "https://api.ebay.com/oauth/api_scope/sell.account",
-                "https://api.ebay.com/oauth/api_scope/sell.fulfillment",
-            ])
-        }
+        # Log the configuration once per distinct URL
+        if self._authorization_url != self._logged_authorization_url:
+            self._log_oauth_configuration()
+            self._logged_authorization_url = self._authorization_url
 
-        # Log the URL for debugging
-        logger.info(f"eBay OAuth Configuration:")
-        logger.info(f"  Auth URL: {self.auth_url}")
-        logger.info(f"  Redirect URI: {self.redirect_uri}")
-        logger.info(f"  Environment: {'Sandbox' if 'sandbox' in self.auth_url else 'Production'}")
-        logger.info(f"")
-        logger.info(f"IMPORTANT: Make sure your eBay app has this redirect URI configured:")
-        logger.info(f"  {self.redirect_uri}")
-        logger.info(f"")
+        return self._authorization_url
 
-        return f"{self.auth_url}?{urlencode(params)}"
+    def _log_oauth_configuration(self):
+        """Log the OAuth settings the user must match in their eBay app."""
+        logger.info("eBay OAuth Configuration:")
+        logger.info("  Auth URL: %s", self.auth_url)
+        logger.info("  Redirect URI: %s", self.redirect_uri)
+        logger.info("  Environment: %s", 'Sandbox' if 'sandbox' in self.auth_url else 'Production')
+        logger.info("")
+        logger.info("IMPORTANT: Make sure your eBay app has this redirect URI configured:")
+        logger.info("  %s", self.redirect_uri)
+        logger.info("")
 
     def start_oauth_flow(self) -> bool:
         """Start OAuth flow with local callback server.
@@ -179,6 +265,10 @@ class EbayAuth:
         Raises:
             EbayAuthError: If authentication fails
         """
+        # Only needed for the interactive flow, so not imported at module load
+        import http.server
+        import socketserver
+
         # Reload settings to get latest credentials from .env
         self._reload_settings()
 
@@ -188,66 +278,71 @@ class EbayAuth:
                 "Please configure them in Settings and try again."
             )
 
+        # A valid cached or stored token needs neither a refresh nor the
+        # browser; get_access_token already refreshes one close to expiry
+        if self.get_access_token():
+            return True
+
+        # A stored refresh token avoids the interactive browser flow
+        token_data = self.secure_storage.get_ebay_token(include_expired=True)
+        if token_data and token_data.get("refresh_token"):
+            try:
+                return self.refresh_access_token()
+            except EbayAuthError as e:
+                logger.info("Stored refresh token not usable, starting browser flow: %s", e)
+
         authorization_code = [None]
         error = [None]
+        callback_received = Event()
+        # Ties the callback to this flow; other requests are ignored
+        state = secrets.token_urlsafe(24)
+
+        class CallbackHandler(http.server.BaseHTTPRequestHandler):
+            # One request per connection; no keep-alive sockets to drain
+            protocol_version = 'HTTP/1.0'
 
-        class CallbackHandler(http.server.SimpleHTTPRequestHandler):
             def do_GET(self):
                 try:
-                    if '?' in self.path:
-                        query = parse_qs(self.path.split('?')[1])
-                        authorization_code[0] = query.get('code', [None])[0]
-                        error[0] = query.get('error', [None])[0]
-
+                    params = {}
+                    for part in urlsplit(self.path).query.split('&'):
+                        key, _, value = part.partition('=')
+                        if key in ('code', 'error', 'state') and key not in params:
+                            params[key] = unquote_plus(value)
+
+                    if ('code' in params or 'error' in params) and params.get('state') != state:
+                        logger.warning("Ignoring OAuth callback with missing or mismatched state")
+                    elif 'error' in params:
+                        error[0] = params['error']
+                        callback_received.set()
+                    elif 'code' in params:
+                        authorization_code[0] = params['code']
+                        callback_received.set()
+
+                    body = _SUCCESS_HTML if authorization_code[0] else _FAILURE_HTML
                     self.send_response(200)
-                    self.send_header('Content-type', 'text/html')
+                    self.send_header('Content-type', 'text/html; charset=utf-8')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.send_header('Connection', 'close')
                     self.end_headers()
-
-                    if authorization_code[0]:
-                        html = """
-                        <html>
-                        <body style="font-family: Arial; text-align: center; padding: 50px;">
-                            <h1 style="color: green;">✓ Authorization Successful!</h1>
-                            <p>You can close this window and return to ResellerOS.</p>
-                        </body>
-                        </html>
-                        """
-                    else:
-                        html = """
-                        <html>
-                        <body style="font-family: Arial; text-align: center; padding: 50px;">
-                            <h1 style="color: red;">✗ Authorization Failed</h1>
-                            <p>Please try again or check your eBay credentials.</p>
-                        </body>
-                        </html>
-                        """
-
-                    self.wfile.write(html.encode())
+                    self.wfile.write(body)
                 except Exception as e:
-                    logger.error(f"Callback handler error: {e}")
+                    logger.error("Callback handler error: %s", e)
 
             def log_message(self, format, *args):
                 pass  # Suppress default logging
 
-        # Custom TCPServer that allows address reuse
-        class ReusableTCPServer(socketserver.TCPServer):
+        # Threaded server that allows address reuse, so stray requests
+        # (e.g. favicon fetches) cannot consume the callback
+        class ReusableTCPServer(socketserver.ThreadingTCPServer):
             allow_reuse_address = True
+            daemon_threads = True
 
         try:
-            # Determine if HTTPS is needed
-            use_https = self.redirect_uri.startswith('https://')
+            use_https = self._callback_https
             protocol = 'https' if use_https else 'http'
+            port = self._callback_port
 
-            # Extract port from redirect URI, or use defaults
-            # For external URLs (like Cloudflare tunnels), use default HTTPS port 8443
-            if ':' in self.redirect_uri.split('/')[-1]:
-                # Port is explicitly specified in URL
-                port = int(self.redirect_uri.split(':')[-1].rstrip('/'))
-            else:
-                # No explicit port - use 8443 for HTTPS, 8080 for HTTP
-                port = 8443 if use_https else 8080
-
-            logger.info(f"Callback server will listen on local port {port}")
+            logger.info("Callback server will listen on local port %s", port)
 
             # Generate certificate if HTTPS is needed
             cert_file = None
@@ -257,40 +352,24 @@ class EbayAuth:
                     cert_file, key_file = self._generate_self_signed_cert()
                     logger.info("Using HTTPS for OAuth callback server")
                 except Exception as e:
-                    logger.error(f"Failed to generate certificate: {e}")
+                    logger.error("Failed to generate certificate: %s", e)
                     raise EbayAuthError(
                         "Failed to set up HTTPS for OAuth callback. "
-                        "Please ensure openssl is installed or the cryptography library is available."
+                        "Please ensure the cryptography library is installed."
                     )
 
+            # Load the certificate once, outside the port retry loop, so a
+            # certificate problem is not reported as a port conflict
+            context = None
+            if use_https and cert_file and key_file:
+                context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+                context.load_cert_chain(cert_file, key_file)
+
             # Create server with address reuse
             httpd = None
             for attempt_port in [port, port + 1, port + 2]:  # Try original port, +1, +2
                 try:
                     httpd = ReusableTCPServer(("", attempt_port), CallbackHandler)
-                    actual_port = httpd.server_address[1]
-
-                    # Wrap with SSL if HTTPS
-                    if use_https and cert_file and key_file:
-                        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-                        context.load_cert_chain(cert_file, key_file)
-                        httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
-
-                    logger.info(f"OAuth callback server started on {protocol}://localhost:{actual_port}")
-
-                    # Only update redirect URI if using localhost (not external tunnel)
-                    if 'localhost' in self.redirect_uri or '127.0.0.1' in self.redirect_uri:
-                        if actual_port != port:
-                            original_redirect = self.redirect_uri
-                            self.redirect_uri = f"{protocol}://localhost:{actual_port}"
-                            logger.warning(
-                                f"Using port {actual_port} instead of {port}. "
-                                f"Make sure your eBay app redirect URI is set to {self.redirect_uri}"
-                            )
-                    else:
-                        logger.info(f"Using external tunnel URL: {self.redirect_uri}")
-                        logger.info(f"Local server listening on port {actual_port}, accessible via tunnel")
-
                     break
                 except OSError as e:
                     if attempt_port == port + 2:  # Last attempt
@@ -303,17 +382,46 @@ class EbayAuth:
             if httpd is None:
                 raise EbayAuthError("Could not start OAuth callback server")
 
+            actual_port = httpd.server_address[1]
+
+            # Wrap with SSL if HTTPS
+            if context is not None:
+                try:
+                    httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
+                except Exception:
+                    httpd.server_close()
+                    raise
+
+            logger.info("OAuth callback server started on %s://localhost:%s", protocol, actual_port)
+
+            # Only update redirect URI if using localhost (not external tunnel)
+            if self._callback_is_local:
+                if actual_port != port:
+                    self.redirect_uri = f"{protocol}://localhost:{actual_port}"
+                    self._build_authorization_url()
+                    logger.warning(
+                        "Using port %s instead of %s. "
+                        "Make sure your eBay app redirect URI is set to %s",
+                        actual_port, port, self.redirect_uri
+                    )
+            else:
+                logger.info("Using external tunnel URL: %s", self.redirect_uri)
+                logger.info("Local server listening on port %s, accessible via tunnel", actual_port)
+
             with httpd:
-                server_thread = Thread(target=httpd.handle_request, daemon=True)
+                server_thread = Thread(target=httpd.serve_forever, daemon=True)
                 server_thread.start()
 
-                # Open browser for authorization
-                auth_url = self.get_authorization_url()
-                logger.info(f"Opening browser for eBay authorization...")
-                webbrowser.open(auth_url)
+                try:
+                    # Open browser for authorization
+                    auth_url = f"{self.get_authorization_url()}&{urlencode({'state': state})}"
+                    logger.info("Opening browser for eBay authorization...")
+                    _open_browser(auth_url)
 
-                # Wait for callback (timeout after 2 minutes)
-                server_thread.join(timeout=120)
+                    # Wait for callback (timeout after 2 minutes)
+                    callback_received.wait(timeout=120)
+                finally:
+                    httpd.shutdown()
 
             if error[0]:
                 raise EbayAuthError(f"eBay authorization error: {error[0]}")
@@ -327,9 +435,83 @@ class EbayAuth:
         except EbayAuthError:
             raise
         except Exception as e:
-            logger.error(f"OAuth flow failed: {e}")
+            logger.error("OAuth flow failed: %s", e)
             raise EbayAuthError(f"OAuth flow failed: {str(e)}")
 
+    def _token_headers(self) -> dict:
+        """Build headers for a request to the token endpoint.
+
+        Returns:
+            Headers dictionary
+
+        Raises:
+            EbayAuthError: If client credentials are not configured
+        """
+        if not self._basic_auth:
+            raise EbayAuthError(
+                "eBay API credentials not configured. "
+                "Please configure them in Settings and try again."
+            )
+
+        return {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Authorization": self._basic_auth
+        }
+
+    def _request_tokens(
+        self,
+        data: dict,
+        action: str,
+        refresh_token: Optional[str] = None,
+        replayable: bool = True,
+    ) -> bool:
+        """Post a grant to the token endpoint and store the returned tokens.
+
+        Args:
+            data: Form fields for the grant
+            action: Name of the operation used in error messages
+            refresh_token: Refresh token to keep if the response omits one
+            replayable: Whether the grant may be resent after a transient
+                failure; single-use grants bypass the retrying adapter
+
+        Returns:
+            True if successful
+
+        Raises:
+            EbayAuthError: If the request fails or tokens cannot be stored
+        """
+        # requests.post uses a fresh adapter without retries
+        post = self.session.post if replayable else requests.post
+        try:
+            response = post(
+                self.token_url, headers=self._token_headers(), data=data, timeout=self.timeout
+            )
+        except requests.RequestException as e:
+            logger.error("%s request failed: %s", action, e)
+            raise EbayAuthError(f"{action} failed: {str(e)}")
+
+        if response.status_code != 200:
+            try:
+                error_data = response.json()
+            except ValueError:
+                error_data = {}
+            error_msg = error_data.get("error_description") or response.text[:500]
+            raise EbayAuthError(f"{action} failed: {error_msg}")
+
+        token_data = response.json()
+
+        # Store tokens securely
+        success = self.secure_storage.store_ebay_token(
+            access_token=token_data["access_token"],
+            refresh_token=token_data.get("refresh_token", refresh_token),
+            expires_in=token_data["expires_in"]
+        )
+        if not success:
+            raise EbayAuthError("Failed to store eBay tokens securely")
+
+        self._cache_token(token_data["access_token"], token_data["expires_in"])
+        return True
+
     def exchange_code_for_token(self, code: str) -> bool:
         """Exchange authorization code for access token.
 
@@ -343,16 +525,6 @@ class EbayAuth:
             EbayAuthError: If token exchange fails
         """
         try:
-            # Prepare auth header
-            auth_header = base64.b64encode(
-                f"{self.client_id}:{self.client_secret}".encode()
-            ).decode()
-
-            headers = {
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Authorization": f"Basic {auth_header}"
-            }
-
             data = {
                 "grant_type": "authorization_code",
                 "code": code,
@@ -360,38 +532,39 @@ class EbayAuth:
             }
 
             logger.info("Exchanging authorization code for access token...")
-            response = requests.post(self.token_url, headers=headers, data=data, timeout=30)
-
-            if response.status_code == 200:
-                token_data = response.json()
-
-                # Store tokens securely
-                success = self.secure_storage.store_ebay_token(
-                    access_token=token_data["access_token"],
-                    refresh_token=token_data["refresh_token"],
-                    expires_in=token_data["expires_in"]
-                )
-
-                if success:
-                    logger.info("eBay authentication successful!")
-                    return True
-                else:
-                    raise EbayAuthError("Failed to store eBay tokens securely")
-            else:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error_description", response.text)
-                raise EbayAuthError(f"Token exchange failed: {error_msg}")
+            # An authorization code is single-use: replaying it after a 5xx
+            # the server did process would only earn invalid_grant
+            self._request_tokens(data, "Token exchange", replayable=False)
+            logger.info("eBay authentication successful!")
+            return True
 
-        except requests.RequestException as e:
-            logger.error(f"Token exchange request failed: {e}")
-            raise EbayAuthError(f"Token exchange failed: {str(e)}")
+        except EbayAuthError:
+            raise
         except Exception as e:
-            logger.error(f"Token exchange failed: {e}")
+            logger.error("Token exchange failed: %s", e)
             raise EbayAuthError(f"Token exchange failed: {str(e)}")
 
     def refresh_access_token(self) -> bool:
         """Refresh the access token using refresh token.
 
+        Concurrent callers are serialized; a caller that waited while another
+        thread refreshed reuses that result instead of refreshing again.
+
+        Returns:
+            True if successful
+
+        Raises:
+            EbayAuthError: If refresh fails
+        """
+        seen = self._token_cache
+        with self._refresh_lock:
+            if self._token_cache is not None and self._token_cache is not seen:
+                return True
+            return self._refresh_access_token()
+
+    def _refresh_access_token(self) -> bool:
+        """Request a new access token from eBay.
+
         Returns:
             True if successful
 
@@ -400,7 +573,7 @@ class EbayAuth:
         """
         try:
             # Get stored tokens
-            token_data = self.secure_storage.get_ebay_token()
+            token_data = self.secure_storage.get_ebay_token(include_expired=True)
             if not token_data:
                 raise EbayAuthError("No eBay tokens found. Please authenticate first.")
 
@@ -408,89 +581,89 @@ class EbayAuth:
             if not refresh_token:
                 raise EbayAuthError("No refresh token available. Please re-authenticate.")
 
-            # Prepare auth header
-            auth_header = base64.b64encode(
-                f"{self.client_id}:{self.client_secret}".encode()
-            ).decode()
-
-            headers = {
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Authorization": f"Basic {auth_header}"
-            }
-
             data = {
                 "grant_type": "refresh_token",
                 "refresh_token": refresh_token,
             }
 
             logger.info("Refreshing eBay access token...")
-            response = requests.post(self.token_url, headers=headers, data=data, timeout=30)
-
-            if response.status_code == 200:
-                new_token_data = response.json()
-
-                # Store new tokens
-                success = self.secure_storage.store_ebay_token(
-                    access_token=new_token_data["access_token"],
-                    refresh_token=new_token_data.get("refresh_token", refresh_token),
-                    expires_in=new_token_data["expires_in"]
-                )
-
-                if success:
-                    logger.info("Access token refreshed successfully")
-                    return True
-                else:
-                    raise EbayAuthError("Failed to store refreshed tokens")
-            else:
-                error_data = response.json() if response.text else {}
-                error_msg = error_data.get("error_description", response.text)
-                raise EbayAuthError(f"Token refresh failed: {error_msg}")
+            self._request_tokens(data, "Token refresh", refresh_token)
+            logger.info("Access token refreshed successfully")
+            return True
 
         except EbayAuthError:
             raise
         except Exception as e:
-            logger.error(f"Token refresh failed: {e}")
+            logger.error("Token refresh failed: %s", e)
             raise EbayAuthError(f"Token refresh failed: {str(e)}")
 
+    def _cache_token(self, access_token: str, expires_in: float):
+        """Remember an access token until it expires.
+
+        Args:
+            access_token: eBay access token
+            expires_in: Seconds until the token expires
+        """
+        self._token_cache = (access_token, time.monotonic() + expires_in)
+        self._auth_status_cache = None
+
     def get_access_token(self) -> Optional[str]:
         """Get valid access token, refreshing if necessary.
 
+        The token is refreshed proactively once it is within
+        refresh_buffer seconds of expiry, so API calls are not sent
+        with a token that is about to be rejected.
+
         Returns:
             Access token or None if not authenticated
-
-        Raises:
-            EbayAuthError: If unable to get valid token
         """
-        token_data = self.secure_storage.get_ebay_token()
+        if self._token_cache and time.monotonic() < self._token_cache[1] - self.refresh_buffer:
+            return self._token_cache[0]
 
-        if not token_data:
+        token_data = self.secure_storage.get_ebay_token(include_expired=True)
+        access_token = token_data.get("access_token") if token_data else None
+
+        if not access_token:
+            self._token_cache = None
             return None
 
-        # Token is valid if not expired (handled by secure storage)
-        access_token = token_data.get("access_token")
-        if access_token:
+        remaining = (
+            datetime.fromisoformat(token_data["expires_at"]) - datetime.utcnow()
+        ).total_seconds()
+        if remaining > self.refresh_buffer:
+            self._cache_token(access_token, remaining)
             return access_token
 
-        # Try to refresh if expired
+        # Close to or past expiry: refresh before handing out the token
         try:
             if self.refresh_access_token():
-                token_data = self.secure_storage.get_ebay_token()
-                return token_data.get("access_token") if token_data else None
-        except EbayAuthError:
-            return None
+                return self._token_cache[0]
+        except EbayAuthError as e:
+            logger.warning("Proactive token refresh failed: %s", e)
 
-        return None
+        # Never return an expired token
+        return access_token if remaining > 0 else None
 
     def is_authenticated(self) -> bool:
         """Check if user is authenticated with eBay.
 
+        The result is reused for AUTH_STATUS_TTL seconds so that status
+        polling does not re-read secure storage when not authenticated.
+
         Returns:
             True if authenticated and token is valid
         """
+        now = time.monotonic()
+        if self._auth_status_cache and now - self._auth_status_cache[1] < AUTH_STATUS_TTL:
+            return self._auth_status_cache[0]
+
         try:
-            return self.get_access_token() is not None
+            authenticated = self.get_access_token() is not None
         except Exception:
-            return False
+            authenticated = False
+
+        self._auth_status_cache = (authenticated, now)
+        return authenticated
 
     def logout(self) -> bool:
         """Logout and delete stored tokens.
@@ -498,4 +671,6 @@ class EbayAuth:
         Returns:
             True if successful
         """
+        self._token_cache = None
+        self._auth_status_cache = None
         return self.secure_storage.delete_ebay_token()
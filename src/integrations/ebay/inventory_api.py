@@ -2,7 +2,10 @@
 eBay Inventory API client.
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 
 from src.config.settings import settings
@@ -12,17 +15,42 @@ from src.core.exceptions import EbayAPIError, EbayAuthError, EbayRateLimitError
 
 logger = logging.getLogger(__name__)
 
+# eBay accepts at most 25 records per bulk request
+BULK_BATCH_SIZE = 25
+# Page size used when fetching complete listings
+PAGE_SIZE = 100
+# Requests in flight at once for batched and paginated calls
+MAX_CONCURRENT_REQUESTS = 5
+
 
 class EbayInventoryAPI:
     """Client for eBay Inventory API."""
 
-    def __init__(self):
-        """Initialize eBay Inventory API client."""
-        self.auth = EbayAuth()
+    def __init__(self, auth: Optional[EbayAuth] = None):
+        """Initialize eBay Inventory API client.
+
+        Args:
+            auth: Shared auth handler (creates one if not provided)
+        """
+        self.auth = auth or EbayAuth()
         self.base_url = f"{settings.ebay_api_base_url}/sell/inventory/v1"
         self.rate_limiter = RateLimiter(calls_per_second=5, burst=10)
         self.request_tracker = RequestTracker()
 
+        # Larger pool for concurrent listing calls on the shared session.
+        # Retry's default methods exclude POST, so creating offers is never
+        # replayed; idempotent GET/PUT/DELETE calls retry on transient 5xx.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        self.auth.session.mount(
+            self.base_url,
+            HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry),
+        )
+
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API request.
 
@@ -71,14 +99,19 @@ class EbayInventoryAPI:
 
         try:
             headers = self._get_headers()
+        except EbayAuthError:
+            # Nothing was sent, so the token goes back to waiting callers
+            self.rate_limiter.release()
+            raise
 
-            response = requests.request(
+        try:
+            response = self.auth.session.request(
                 method=method,
                 url=url,
                 headers=headers,
                 json=data,
                 params=params,
-                timeout=30,
+                timeout=self.auth.timeout,
             )
 
             # Track request
@@ -88,45 +121,50 @@ class EbayInventoryAPI:
             if response.status_code == 204:
                 return {}
             elif 200 <= response.status_code < 300:
-                return response.json() if response.text else {}
+                return response.json() if response.content else {}
             elif response.status_code == 401:
                 # Try to refresh token and retry once
                 logger.warning("Access token expired, attempting refresh...")
                 self.auth.refresh_access_token()
-                headers = self._get_headers()
+                access_token = self.auth.get_access_token()
+                if not access_token:
+                    raise EbayAuthError("Not authenticated with eBay. Please login first.")
+                headers["Authorization"] = f"Bearer {access_token}"
 
-                response = requests.request(
+                response = self.auth.session.request(
                     method=method,
                     url=url,
                     headers=headers,
                     json=data,
                     params=params,
-                    timeout=30,
+                    timeout=self.auth.timeout,
                 )
 
                 if 200 <= response.status_code < 300:
-                    return response.json() if response.text else {}
+                    return response.json() if response.content else {}
                 else:
                     raise EbayAuthError("Authentication failed after token refresh")
             elif response.status_code == 429:
                 raise EbayRateLimitError("eBay API rate limit exceeded")
             else:
-                error_msg = response.text
-                try:
-                    error_data = response.json()
-                    error_msg = error_data.get("errors", [{}])[0].get("message", error_msg)
-                except:
-                    pass
+                error_msg = None
+                if "json" in response.headers.get("Content-Type", ""):
+                    try:
+                        error_data = response.json()
+                        error_msg = (error_data.get("errors") or [{}])[0].get("message")
+                    except ValueError:
+                        pass
+                error_msg = error_msg or response.text[:500]
 
                 raise EbayAPIError(f"eBay API error ({response.status_code}): {error_msg}")
 
         except (EbayAPIError, EbayAuthError, EbayRateLimitError):
             raise
         except requests.RequestException as e:
-            logger.error(f"eBay API request failed: {e}")
+            logger.error("eBay API request failed: %s", e)
             raise EbayAPIError(f"Request failed: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error in eBay API request: {e}")
+            logger.error("Unexpected error in eBay API request: %s", e)
             raise EbayAPIError(f"Unexpected error: {str(e)}")
 
     def create_inventory_item(self, sku: str, item_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -143,12 +181,12 @@ class EbayInventoryAPI:
             EbayAPIError: If creation fails
         """
         try:
-            logger.info(f"Creating eBay inventory item with SKU: {sku}")
+            logger.info("Creating eBay inventory item with SKU: %s", sku)
             result = self._make_request("PUT", f"inventory_item/{sku}", data=item_data)
-            logger.info(f"Successfully created inventory item: {sku}")
+            logger.info("Successfully created inventory item: %s", sku)
             return result
         except Exception as e:
-            logger.error(f"Failed to create inventory item {sku}: {e}")
+            logger.error("Failed to create inventory item %s: %s", sku, e)
             raise
 
     def get_inventory_item(self, sku: str) -> Dict[str, Any]:
@@ -166,7 +204,7 @@ class EbayInventoryAPI:
         try:
             return self._make_request("GET", f"inventory_item/{sku}")
         except Exception as e:
-            logger.error(f"Failed to get inventory item {sku}: {e}")
+            logger.error("Failed to get inventory item %s: %s", sku, e)
             raise
 
     def delete_inventory_item(self, sku: str) -> bool:
@@ -182,12 +220,12 @@ class EbayInventoryAPI:
             EbayAPIError: If deletion fails
         """
         try:
-            logger.info(f"Deleting eBay inventory item: {sku}")
+            logger.info("Deleting eBay inventory item: %s", sku)
             self._make_request("DELETE", f"inventory_item/{sku}")
-            logger.info(f"Successfully deleted inventory item: {sku}")
+            logger.info("Successfully deleted inventory item: %s", sku)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete inventory item {sku}: {e}")
+            logger.error("Failed to delete inventory item %s: %s", sku, e)
             raise
 
     def create_offer(self, offer_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -206,10 +244,10 @@ class EbayInventoryAPI:
             logger.info("Creating eBay listing offer")
             result = self._make_request("POST", "offer", data=offer_data)
             offer_id = result.get("offerId")
-            logger.info(f"Successfully created offer: {offer_id}")
+            logger.info("Successfully created offer: %s", offer_id)
             return result
         except Exception as e:
-            logger.error(f"Failed to create offer: {e}")
+            logger.error("Failed to create offer: %s", e)
             raise
 
     def publish_offer(self, offer_id: str) -> Dict[str, Any]:
@@ -225,13 +263,13 @@ class EbayInventoryAPI:
             EbayAPIError: If publishing fails
         """
         try:
-            logger.info(f"Publishing eBay offer: {offer_id}")
+            logger.info("Publishing eBay offer: %s", offer_id)
             result = self._make_request("POST", f"offer/{offer_id}/publish")
             listing_id = result.get("listingId")
-            logger.info(f"Successfully published offer {offer_id} as listing {listing_id}")
+            logger.info("Successfully published offer %s as listing %s", offer_id, listing_id)
             return result
         except Exception as e:
-            logger.error(f"Failed to publish offer {offer_id}: {e}")
+            logger.error("Failed to publish offer %s: %s", offer_id, e)
             raise
 
     def get_offers(self, sku: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -251,7 +289,7 @@ class EbayInventoryAPI:
             result = self._make_request("GET", "offer", params=params)
             return result.get("offers", [])
         except Exception as e:
-            logger.error(f"Failed to get offers: {e}")
+            logger.error("Failed to get offers: %s", e)
             raise
 
     def get_inventory_items(
@@ -273,7 +311,125 @@ class EbayInventoryAPI:
             params = {"limit": limit, "offset": offset}
             return self._make_request("GET", "inventory_item", params=params)
         except Exception as e:
-            logger.error(f"Failed to get inventory items: {e}")
+            logger.error("Failed to get inventory items: %s", e)
+            raise
+
+    def _get_all_pages(self, endpoint: str, key: str, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Fetch every page of a paginated collection.
+
+        The first page reveals the total; the remaining pages are then
+        requested concurrently.
+
+        Args:
+            endpoint: API endpoint
+            key: Response key holding the page's records
+            params: Additional query parameters
+
+        Returns:
+            All records in order
+        """
+        params = dict(params or {})
+
+        def fetch(offset):
+            return self._make_request(
+                "GET", endpoint, params={**params, "limit": PAGE_SIZE, "offset": offset}
+            )
+
+        first = fetch(0)
+        records = list(first.get(key, []))
+        offsets = list(range(PAGE_SIZE, first.get("total", 0), PAGE_SIZE))
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(offsets))) as executor:
+                for page in executor.map(fetch, offsets):
+                    records.extend(page.get(key, []))
+        return records
+
+    def get_all_inventory_items(self) -> List[Dict[str, Any]]:
+        """Get all inventory items across every page.
+
+        Returns:
+            List of inventory items
+
+        Raises:
+            EbayAPIError: If retrieval fails
+        """
+        try:
+            return self._get_all_pages("inventory_item", "inventoryItems")
+        except Exception as e:
+            logger.error("Failed to get all inventory items: %s", e)
+            raise
+
+    def get_all_offers(self, sku: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get all offers across every page, optionally filtered by SKU.
+
+        Args:
+            sku: Optional SKU to filter by
+
+        Returns:
+            List of offers
+
+        Raises:
+            EbayAPIError: If retrieval fails
+        """
+        try:
+            return self._get_all_pages("offer", "offers", {"sku": sku} if sku else None)
+        except Exception as e:
+            logger.error("Failed to get all offers: %s", e)
+            raise
+
+    def _post_in_batches(self, endpoint: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """POST bulk requests in batches of BULK_BATCH_SIZE.
+
+        Multiple batches are sent concurrently, up to MAX_CONCURRENT_REQUESTS
+        at a time; the rate limiter still applies to every request.
+
+        Args:
+            endpoint: Bulk API endpoint
+            records: Per-record request bodies
+
+        Returns:
+            Bulk response with the per-record responses of all batches in order
+        """
+        batches = [
+            records[i:i + BULK_BATCH_SIZE] for i in range(0, len(records), BULK_BATCH_SIZE)
+        ]
+
+        def send(batch):
+            return self._make_request("POST", endpoint, data={"requests": batch})
+
+        if len(batches) <= 1:
+            return send(records)
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(batches))) as executor:
+            results = list(executor.map(send, batches))
+        return {
+            "responses": [
+                response for batch_result in results
+                for response in batch_result.get("responses", [])
+            ]
+        }
+
+    def bulk_publish_offers(self, offer_ids: List[str]) -> Dict[str, Any]:
+        """Publish many offers using the bulk publish endpoint.
+
+        Args:
+            offer_ids: Offer IDs to publish
+
+        Returns:
+            Bulk response with one entry per offer, in order
+
+        Raises:
+            EbayAPIError: If bulk publishing fails
+        """
+        try:
+            logger.info("Bulk publishing %s offers", len(offer_ids))
+            result = self._post_in_batches(
+                "bulk_publish_offer", [{"offerId": offer_id} for offer_id in offer_ids]
+            )
+            logger.info("Bulk publishing completed")
+            return result
+        except Exception as e:
+            logger.error("Bulk offer publishing failed: %s", e)
             raise
 
     def bulk_create_or_replace_inventory(
@@ -285,19 +441,18 @@ class EbayInventoryAPI:
             items: List of inventory item requests
 
         Returns:
-            Bulk response
+            Bulk response with the per-item responses of all batches in order
 
         Raises:
             EbayAPIError: If bulk operation fails
         """
         try:
-            logger.info(f"Bulk creating {len(items)} inventory items")
-            data = {"requests": items}
-            result = self._make_request("POST", "bulk_create_or_replace_inventory_item", data=data)
-            logger.info(f"Bulk creation completed")
+            logger.info("Bulk creating %s inventory items", len(items))
+            result = self._post_in_batches("bulk_create_or_replace_inventory_item", items)
+            logger.info("Bulk creation completed")
             return result
         except Exception as e:
-            logger.error(f"Bulk inventory creation failed: {e}")
+            logger.error("Bulk inventory creation failed: %s", e)
             raise
 
     def get_api_stats(self) -> Dict[str, Any]:
@@ -1,12 +1,16 @@
 """
 Rate limiter for eBay API requests.
 """
+import functools
 import time
 import threading
-from collections import deque
+from array import array
+from bisect import bisect_left
 from typing import Callable, Any
 import logging
 
+from src.core.exceptions import EbayRateLimitError
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,14 +27,14 @@ class RateLimiter:
         self.calls_per_second = calls_per_second
         self.burst = burst
         self.tokens = burst
-        self.last_update = time.time()
-        self.lock = threading.Lock()
+        self.last_update = time.monotonic()
+        self.cond = threading.Condition()
 
         logger.info(f"Rate limiter initialized: {calls_per_second} calls/sec, burst={burst}")
 
     def _add_tokens(self):
         """Add tokens based on elapsed time."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_update
         new_tokens = elapsed * self.calls_per_second
 
@@ -48,23 +52,36 @@ class RateLimiter:
             True if tokens acquired, False if timeout
 
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while True:
-            with self.lock:
+        with self.cond:
+            while True:
                 self._add_tokens()
 
                 if self.tokens >= tokens:
                     self.tokens -= tokens
                     return True
 
-            # Check timeout
-            if time.time() - start_time >= timeout:
-                logger.warning(f"Rate limiter timeout after {timeout}s")
-                return False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(f"Rate limiter timeout after {timeout}s")
+                    return False
+
+                # Wake when enough tokens have been refilled, or earlier
+                # if another caller returns unused tokens
+                wait = (tokens - self.tokens) / self.calls_per_second
+                self.cond.wait(timeout=min(wait, remaining))
 
-            # Wait a bit before retrying
-            time.sleep(0.1)
+    def release(self, tokens: int = 1):
+        """Return tokens that were acquired but not used.
+
+        Args:
+            tokens: Number of tokens to return
+        """
+        with self.cond:
+            self._add_tokens()
+            self.tokens = min(self.burst, self.tokens + tokens)
+            self.cond.notify_all()
 
     def __call__(self, func: Callable) -> Callable:
         """Decorator to rate limit function calls.
@@ -75,11 +92,13 @@ class RateLimiter:
         Returns:
             Wrapped function
         """
+        acquire = self.acquire
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            if self.acquire():
-                return func(*args, **kwargs)
-            else:
-                raise Exception("Rate limit exceeded")
+            if not acquire():
+                raise EbayRateLimitError("Rate limit exceeded")
+            return func(*args, **kwargs)
 
         return wrapper
 
@@ -87,15 +106,24 @@ class RateLimiter:
 class RequestTracker:
     """Track API request history for monitoring."""
 
-    def __init__(self, window_size: int = 3600):
+    def __init__(self, window_size: int = 3600, capacity: int = 20000):
         """Initialize request tracker.
 
         Args:
             window_size: Time window in seconds (default 1 hour)
+            capacity: Maximum number of requests remembered; the default
+                covers an hour of traffic at the 5 calls/sec API limit
         """
         self.window_size = window_size
-        self.requests = deque()
-        self.lock = threading.Lock()
+        self.capacity = capacity
+        # Preallocated ring buffer, one column per field; unused slots
+        # carry a timestamp that always falls outside the window
+        self._timestamps = array("d", [float("-inf")]) * capacity
+        self._successes = array("B", [0]) * capacity
+        # Next slot to write; slots are written in timestamp order under
+        # the lock, so it is also the oldest slot
+        self._next = 0
+        self._lock = threading.Lock()
 
     def record_request(self, endpoint: str, status_code: int):
         """Record an API request.
@@ -104,15 +132,14 @@ class RequestTracker:
             endpoint: API endpoint called
             status_code: HTTP status code
         """
-        with self.lock:
-            now = time.time()
-
-            # Remove old requests outside window
-            while self.requests and self.requests[0][0] < now - self.window_size:
-                self.requests.popleft()
-
-            # Add new request
-            self.requests.append((now, endpoint, status_code))
+        success = 200 <= status_code < 300
+        # Claim the slot and stamp it together, so slot order always
+        # matches timestamp order even when batch workers finish at once
+        with self._lock:
+            index = self._next
+            self._next = (index + 1) % self.capacity
+            self._successes[index] = success
+            self._timestamps[index] = time.monotonic()
 
     def get_stats(self) -> dict:
         """Get request statistics.
@@ -120,28 +147,33 @@ class RequestTracker:
         Returns:
             Dictionary with request stats
         """
-        with self.lock:
-            now = time.time()
-
-            # Remove old requests
-            while self.requests and self.requests[0][0] < now - self.window_size:
-                self.requests.popleft()
-
-            total_requests = len(self.requests)
-            success_count = sum(1 for _, _, status in self.requests if 200 <= status < 300)
-            error_count = total_requests - success_count
-
-            # Requests per minute
-            if self.requests:
-                time_span = now - self.requests[0][0]
-                rpm = (total_requests / time_span * 60) if time_span > 0 else 0
-            else:
-                rpm = 0
-
-            return {
-                "total_requests": total_requests,
-                "success_count": success_count,
-                "error_count": error_count,
-                "requests_per_minute": round(rpm, 2),
-                "window_size": self.window_size,
-            }
+        now = time.monotonic()
+        cutoff = now - self.window_size
+
+        # Rotate the snapshot so it starts at the oldest slot; timestamps
+        # are then sorted, and unused slots sort first
+        with self._lock:
+            timestamps = self._timestamps[:]
+            successes = self._successes[:]
+            head = self._next
+        timestamps = timestamps[head:] + timestamps[:head]
+        successes = successes[head:] + successes[:head]
+
+        # Binary search for the window start, then count in C
+        start = bisect_left(timestamps, cutoff)
+        total_requests = len(timestamps) - start
+        success_count = sum(successes[start:])
+        oldest = timestamps[start] if total_requests else now
+        error_count = total_requests - success_count
+
+        # Requests per minute
+        time_span = now - oldest
+        rpm = (total_requests / time_span * 60) if time_span > 0 else 0
+
+        return {
+            "total_requests": total_requests,
+            "success_count": success_count,
+            "error_count": error_count,
+            "requests_per_minute": round(rpm, 2),
+            "window_size": self.window_size,
+        }
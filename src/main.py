@@ -5,7 +5,7 @@ import sys
 import os
 import logging
 import time
-from threading import Thread
+from threading import Event, Thread
 from pathlib import Path
 
 # Add project root to Python path
@@ -19,23 +19,75 @@ setup_logging()
 
 logger = logging.getLogger(__name__)
 
+HEALTH_URL = "http://127.0.0.1:8000/api/health"
+
+# Set once the backend accepts connections, or once it has failed to start
+backend_ready = Event()
+
 def run_backend():
     """Run FastAPI backend server in background thread."""
     try:
         import uvicorn
         from src.api.app import app
 
+        class BackendServer(uvicorn.Server):
+            async def startup(self, sockets=None):
+                await super().startup(sockets=sockets)
+                # Sockets are bound and lifespan startup has completed
+                if self.started:
+                    backend_ready.set()
+
         logger.info("Starting FastAPI backend server...")
-        uvicorn.run(
+        config = uvicorn.Config(
             app,
             host="127.0.0.1",
             port=8000,
             log_level="error",  # Reduce noise in logs
             access_log=False,
         )
+        BackendServer(config).run()
     except Exception as e:
         logger.critical(f"Backend server failed to start: {e}")
         raise
+    finally:
+        # Never leave main() waiting on a server that has stopped
+        backend_ready.set()
+
+
+def wait_for_backend(timeout: float = 10.0) -> bool:
+    """Poll the backend health endpoint with exponential backoff.
+
+    Args:
+        timeout: Maximum time to wait for the backend (seconds)
+
+    Returns:
+        True if the backend answered with 200, False otherwise
+    """
+    import requests
+
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    # One keep-alive connection is reused across polls
+    with requests.Session() as session:
+        while True:
+            try:
+                response = session.get(HEALTH_URL, timeout=2)
+                if response.status_code == 200:
+                    return True
+                logger.warning("Backend API returned unexpected status")
+                return False
+            except requests.ConnectionError:
+                pass  # Not listening yet
+            except Exception as e:
+                logger.error(f"Backend API health check failed: {e}")
+                return False
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error(f"Backend API did not start within {timeout}s")
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
 
 
 def ensure_directories():
@@ -91,20 +143,14 @@ def main():
         backend_thread = Thread(target=run_backend, daemon=True, name="BackendThread")
         backend_thread.start()
 
-        # Give backend time to start
+        # Block until the server signals it is listening; the health poll
+        # then confirms it, and covers the case where no signal arrives
         logger.info("Waiting for backend to initialize...")
-        time.sleep(2)
-
-        # Check if backend is running
-        import requests
-        try:
-            response = requests.get("http://localhost:8000/api/health", timeout=5)
-            if response.status_code == 200:
-                logger.info("✓ Backend API is running")
-            else:
-                logger.warning("Backend API returned unexpected status")
-        except Exception as e:
-            logger.error(f"Backend API health check failed: {e}")
+        if not backend_ready.wait(timeout=30):
+            logger.warning("Backend did not signal readiness within 30s")
+        if wait_for_backend():
+            logger.info("✓ Backend API is running")
+        else:
             logger.warning("Continuing anyway...")
 
         # Start PyQt6 GUI
@@ -3,11 +3,39 @@ Expense model for tracking business expenses.
 """
 from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from typing import Optional
 
 from src.core.database import Base
 
 
+# Columns serialized by to_dict, in output order
+_EXPENSE_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "category",
+    "amount",
+    "currency",
+    "payment_method",
+    "receipt_number",
+    "vendor",
+    "date",
+    "is_recurring",
+    "recurring_period",
+    "is_deductible",
+    "tax_category",
+    "notes",
+    "receipt_photo",
+    "created_at",
+    "updated_at",
+)
+_EXPENSE_DATETIME_FIELDS = ("date", "created_at", "updated_at")
+_EXPENSE_GETTER = attrgetter(*_EXPENSE_FIELDS)
+_EXPENSE_LOADED_GETTER = itemgetter(*_EXPENSE_FIELDS)
+_isoformat = datetime.isoformat
+
+
 class Expense(Base):
     """Business expense model."""
 
@@ -19,7 +47,7 @@ class Expense(Base):
     # Basic information
     title = Column(String(200), nullable=False)
     description = Column(Text)
-    category = Column(String(100), nullable=False, index=True)
+    category = Column(String(100), nullable=False)  # Indexed by idx_category_date
     # Categories: Inventory, Shipping, Supplies, Fees, Marketing, Other
 
     # Financial information
@@ -60,26 +88,20 @@ class Expense(Base):
         Returns:
             Dictionary representation of expense
         """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "category": self.category,
-            "amount": self.amount,
-            "currency": self.currency,
-            "payment_method": self.payment_method,
-            "receipt_number": self.receipt_number,
-            "vendor": self.vendor,
-            "date": self.date.isoformat() if self.date else None,
-            "is_recurring": bool(self.is_recurring),
-            "recurring_period": self.recurring_period,
-            "is_deductible": bool(self.is_deductible),
-            "tax_category": self.tax_category,
-            "notes": self.notes,
-            "receipt_photo": self.receipt_photo,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        try:
+            # Loaded column values sit in the instance dict; reading them
+            # directly skips the per-attribute descriptor call
+            values = _EXPENSE_LOADED_GETTER(self.__dict__)
+        except KeyError:
+            # Expired or unset attributes load through the descriptors
+            values = _EXPENSE_GETTER(self)
+        data = dict(zip(_EXPENSE_FIELDS, values))
+        data["is_recurring"] = bool(data["is_recurring"])
+        data["is_deductible"] = bool(data["is_deductible"])
+        for key in _EXPENSE_DATETIME_FIELDS:
+            value = data[key]
+            data[key] = _isoformat(value) if value is not None else None
+        return data
 
     @property
     def is_recurring_expense(self) -> bool:
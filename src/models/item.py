@@ -1,14 +1,90 @@
 """
 Item model for inventory management.
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, Index
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, Index, func, text
+from sqlalchemy.types import TypeDecorator
 from datetime import datetime
+from operator import attrgetter, itemgetter
 import json
 from typing import List, Optional
 
 from src.core.database import Base
 
 
+# Estimated eBay final value fee, as a fraction of the sale price
+EBAY_FEE_RATE = 0.13
+
+# Rows without photos, including JSON-encoded empties written by older
+# versions. Kept literal so SQLite can match it to the partial index.
+NO_PHOTOS_SQL = "photos IS NULL OR photos IN ('null', '[]', '')"
+
+
+def _decode_json_list(value: Optional[str]) -> list:
+    """Decode JSON list text, treating empty or malformed text as empty."""
+    if not value:
+        return []
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return []
+
+
+class JSONList(TypeDecorator):
+    """List column stored as JSON text and decoded once per row load.
+
+    The stored format matches a plain text column holding a JSON array,
+    with NULL for an empty list, so existing databases need no migration.
+    Raw strings are bound unchanged, which keeps SQL comparisons against
+    literal JSON text working.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        return json.dumps(value) if value else None
+
+    def process_result_value(self, value, dialect):
+        return _decode_json_list(value)
+
+
+# Columns serialized by to_dict, in output order
+_ITEM_FIELDS = (
+    "id",
+    "title",
+    "category",
+    "description",
+    "notes",
+    "cost",
+    "price",
+    "shipping_cost",
+    "status",
+    "photos",
+    "ebay_id",
+    "ebay_listing_url",
+    "ebay_status",
+    "ai_title",
+    "ai_description",
+    "ai_price",
+    "ai_category",
+    "seo_score",
+    "sku",
+    "condition",
+    "quantity",
+    "location",
+    "created_at",
+    "updated_at",
+    "listed_at",
+    "sold_at",
+)
+_ITEM_DATETIME_FIELDS = ("created_at", "updated_at", "listed_at", "sold_at")
+_ITEM_GETTER = attrgetter(*_ITEM_FIELDS)
+_ITEM_LOADED_GETTER = itemgetter(*_ITEM_FIELDS)
+_isoformat = datetime.isoformat
+
+
 class Item(Base):
     """Inventory item model."""
 
@@ -19,7 +95,7 @@ class Item(Base):
 
     # Basic information
     title = Column(String(200), nullable=False, index=True)
-    category = Column(String(100), index=True)
+    category = Column(String(100))  # Indexed by idx_category_status
     description = Column(Text)
     notes = Column(Text)
 
@@ -33,11 +109,10 @@ class Item(Base):
         String(50),
         default="Draft",
         nullable=False,
-        index=True
-    )  # Draft, Ready, Listed, Sold, Archived
+    )  # Draft, Ready, Listed, Sold, Archived; indexed by idx_status_created
 
     # Photos (JSON array of filenames)
-    photos = Column(Text)
+    photos = Column(JSONList)
 
     # eBay integration
     ebay_id = Column(String(100), unique=True, index=True)
@@ -67,6 +142,13 @@ class Item(Base):
     __table_args__ = (
         Index('idx_status_created', 'status', 'created_at'),
         Index('idx_category_status', 'category', 'status'),
+        Index('idx_category_created', 'category', 'created_at'),
+        Index('idx_status_category_created', 'status', 'category', 'created_at'),
+        # Case-insensitive prefix search on SKU and title
+        Index('idx_sku_lower', func.lower(sku)),
+        Index('idx_title_lower', func.lower(title)),
+        # Only the (usually few) items still needing photos
+        Index('idx_no_photos', 'id', sqlite_where=text(NO_PHOTOS_SQL)),
     )
 
     def get_photos(self) -> List[str]:
@@ -75,12 +157,12 @@ class Item(Base):
         Returns:
             List of photo filenames
         """
-        if not self.photos:
-            return []
-        try:
-            return json.loads(self.photos)
-        except json.JSONDecodeError:
-            return []
+        photos = self.photos
+        if isinstance(photos, str):
+            # Raw JSON text assigned directly and not reloaded yet
+            return _decode_json_list(photos)
+        # Copy, so that callers mutating the list cannot bypass change tracking
+        return list(photos or [])
 
     def set_photos(self, photo_list: List[str]):
         """Set photo filenames.
@@ -88,7 +170,7 @@ class Item(Base):
         Args:
             photo_list: List of photo filenames
         """
-        self.photos = json.dumps(photo_list) if photo_list else None
+        self.photos = list(photo_list) if photo_list else None
 
     def add_photo(self, filename: str):
         """Add a photo filename.
@@ -143,7 +225,7 @@ class Item(Base):
         """
         if not self.price:
             return 0.0
-        return self.price * 0.13
+        return self.price * EBAY_FEE_RATE
 
     @property
     def net_profit(self) -> float:
@@ -171,37 +253,31 @@ class Item(Base):
         Returns:
             Dictionary representation of item
         """
-        return {
-            "id": self.id,
-            "title": self.title,
-            "category": self.category,
-            "description": self.description,
-            "notes": self.notes,
-            "cost": self.cost,
-            "price": self.price,
-            "shipping_cost": self.shipping_cost,
-            "status": self.status,
-            "photos": self.get_photos(),
-            "ebay_id": self.ebay_id,
-            "ebay_listing_url": self.ebay_listing_url,
-            "ebay_status": self.ebay_status,
-            "ai_title": self.ai_title,
-            "ai_description": self.ai_description,
-            "ai_price": self.ai_price,
-            "ai_category": self.ai_category,
-            "seo_score": self.seo_score,
-            "sku": self.sku,
-            "condition": self.condition,
-            "quantity": self.quantity,
-            "location": self.location,
-            "profit": self.profit,
-            "profit_margin": self.profit_margin,
-            "net_profit": self.net_profit,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "listed_at": self.listed_at.isoformat() if self.listed_at else None,
-            "sold_at": self.sold_at.isoformat() if self.sold_at else None,
-        }
+        try:
+            # Loaded column values sit in the instance dict; reading them
+            # directly skips the per-attribute descriptor call
+            values = _ITEM_LOADED_GETTER(self.__dict__)
+        except KeyError:
+            # Expired or unset attributes load through the descriptors
+            values = _ITEM_GETTER(self)
+        data = dict(zip(_ITEM_FIELDS, values))
+        data["photos"] = self.get_photos()
+        for key in _ITEM_DATETIME_FIELDS:
+            value = data[key]
+            data[key] = _isoformat(value) if value is not None else None
+
+        # Same arithmetic as the profit properties, evaluated once
+        price = data["price"]
+        if price:
+            profit = price - data["cost"] - (data["shipping_cost"] or 0.0)
+            data["profit"] = profit
+            data["profit_margin"] = (profit / price) * 100
+            data["net_profit"] = profit - price * EBAY_FEE_RATE
+        else:
+            data["profit"] = 0.0
+            data["profit_margin"] = 0.0
+            data["net_profit"] = 0.0
+        return data
 
     def __repr__(self) -> str:
         return f"<Item(id={self.id}, title='{self.title}', status='{self.status}')>"
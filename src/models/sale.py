@@ -3,9 +3,50 @@ Sale model for tracking completed sales.
 """
 from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Index
 from datetime import datetime
+from operator import attrgetter, itemgetter
 from typing import Optional
 
 from src.core.database import Base
+from src.models.item import EBAY_FEE_RATE
+
+
+# Columns serialized by to_dict, in output order
+_SALE_FIELDS = (
+    "id",
+    "item_id",
+    "item_title",
+    "item_sku",
+    "sale_price",
+    "quantity",
+    "currency",
+    "item_cost",
+    "shipping_cost",
+    "ebay_fees",
+    "payment_fees",
+    "other_fees",
+    "platform",
+    "platform_order_id",
+    "platform_transaction_id",
+    "buyer_username",
+    "buyer_location",
+    "shipping_method",
+    "tracking_number",
+    "shipped_at",
+    "delivered_at",
+    "status",
+    "payment_method",
+    "payment_date",
+    "notes",
+    "sale_date",
+    "created_at",
+    "updated_at",
+)
+_SALE_DATETIME_FIELDS = (
+    "shipped_at", "delivered_at", "payment_date", "sale_date", "created_at", "updated_at",
+)
+_SALE_GETTER = attrgetter(*_SALE_FIELDS)
+_SALE_LOADED_GETTER = itemgetter(*_SALE_FIELDS)
+_isoformat = datetime.isoformat
 
 
 class Sale(Base):
@@ -49,7 +90,7 @@ class Sale(Base):
     delivered_at = Column(DateTime)
 
     # Status
-    status = Column(String(50), default="Pending", nullable=False, index=True)
+    status = Column(String(50), default="Pending", nullable=False)  # Indexed by idx_status_sale_date
     # Pending, Paid, Shipped, Delivered, Completed, Cancelled, Refunded
 
     # Payment information
@@ -60,7 +101,7 @@ class Sale(Base):
     notes = Column(Text)
 
     # Timestamps
-    sale_date = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    sale_date = Column(DateTime, nullable=False, default=datetime.utcnow)  # Indexed by idx_sale_date_platform
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -132,7 +173,7 @@ class Sale(Base):
         Returns:
             Estimated eBay fees
         """
-        return self.total_revenue * 0.13
+        return self.total_revenue * EBAY_FEE_RATE
 
     def calculate_payment_fees(self, rate: float = 0.029, fixed: float = 0.30) -> float:
         """Calculate PayPal/payment processor fees.
@@ -152,41 +193,36 @@ class Sale(Base):
         Returns:
             Dictionary representation of sale
         """
-        return {
-            "id": self.id,
-            "item_id": self.item_id,
-            "item_title": self.item_title,
-            "item_sku": self.item_sku,
-            "sale_price": self.sale_price,
-            "quantity": self.quantity,
-            "currency": self.currency,
-            "item_cost": self.item_cost,
-            "shipping_cost": self.shipping_cost,
-            "ebay_fees": self.ebay_fees,
-            "payment_fees": self.payment_fees,
-            "other_fees": self.other_fees,
-            "platform": self.platform,
-            "platform_order_id": self.platform_order_id,
-            "platform_transaction_id": self.platform_transaction_id,
-            "buyer_username": self.buyer_username,
-            "buyer_location": self.buyer_location,
-            "shipping_method": self.shipping_method,
-            "tracking_number": self.tracking_number,
-            "shipped_at": self.shipped_at.isoformat() if self.shipped_at else None,
-            "delivered_at": self.delivered_at.isoformat() if self.delivered_at else None,
-            "status": self.status,
-            "payment_method": self.payment_method,
-            "payment_date": self.payment_date.isoformat() if self.payment_date else None,
-            "notes": self.notes,
-            "sale_date": self.sale_date.isoformat() if self.sale_date else None,
-            "total_revenue": self.total_revenue,
-            "total_costs": self.total_costs,
-            "profit": self.profit,
-            "profit_margin": self.profit_margin,
-            "roi": self.roi,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+        try:
+            # Loaded column values sit in the instance dict; reading them
+            # directly skips the per-attribute descriptor call
+            values = _SALE_LOADED_GETTER(self.__dict__)
+        except KeyError:
+            # Expired or unset attributes load through the descriptors
+            values = _SALE_GETTER(self)
+        data = dict(zip(_SALE_FIELDS, values))
+        for key in _SALE_DATETIME_FIELDS:
+            value = data[key]
+            data[key] = _isoformat(value) if value is not None else None
+
+        # Same arithmetic as the totals properties, evaluated once
+        quantity = data["quantity"]
+        total_revenue = data["sale_price"] * quantity
+        total_item_cost = data["item_cost"] * quantity
+        total_costs = (
+            total_item_cost +
+            (data["shipping_cost"] or 0.0) +
+            (data["ebay_fees"] or 0.0) +
+            (data["payment_fees"] or 0.0) +
+            (data["other_fees"] or 0.0)
+        )
+        profit = total_revenue - total_costs
+        data["total_revenue"] = total_revenue
+        data["total_costs"] = total_costs
+        data["profit"] = profit
+        data["profit_margin"] = (profit / total_revenue) * 100 if total_revenue != 0 else 0.0
+        data["roi"] = (profit / total_item_cost) * 100 if total_item_cost != 0 else 0.0
+        return data
 
     def __repr__(self) -> str:
         return f"<Sale(id={self.id}, item='{self.item_title}', price=${self.sale_price:.2f})>"
@@ -4,7 +4,7 @@ UserSettings model for application preferences and configuration.
 from sqlalchemy import Column, Integer, String, Text, DateTime
 from datetime import datetime
 import json
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from src.core.database import Base
 
@@ -36,25 +36,50 @@ class UserSettings(Base):
     def get_value(self) -> Any:
         """Get the setting value with type conversion.
 
+        The converted value is cached on the instance until the stored
+        value or type changes, so JSON settings are decoded only once.
+        Callers that modify a returned JSON value should store it again
+        with set_value.
+
         Returns:
             Value converted to appropriate type
         """
-        if self.value is None:
+        raw, value_type = self.value, self.type
+        cached = self.__dict__.get("_value_cache")
+        if cached is not None and cached[0] is raw and cached[1] == value_type:
+            return cached[2]
+
+        value = self._convert_value(raw, value_type)
+        self._value_cache = (raw, value_type, value)
+        return value
+
+    @staticmethod
+    def _convert_value(raw: Optional[str], value_type: Optional[str]) -> Any:
+        """Convert a stored string to the type named by value_type.
+
+        Args:
+            raw: Stored string value
+            value_type: Setting type
+
+        Returns:
+            Converted value
+        """
+        if raw is None:
             return None
 
-        if self.type == "integer":
-            return int(self.value)
-        elif self.type == "float":
-            return float(self.value)
-        elif self.type == "boolean":
-            return self.value.lower() in ("true", "1", "yes")
-        elif self.type == "json":
+        if value_type == "integer":
+            return int(raw)
+        elif value_type == "float":
+            return float(raw)
+        elif value_type == "boolean":
+            return raw.lower() in ("true", "1", "yes")
+        elif value_type == "json":
             try:
-                return json.loads(self.value)
+                return json.loads(raw)
             except json.JSONDecodeError:
                 return None
         else:  # string
-            return self.value
+            return raw
 
     def set_value(self, value: Any):
         """Set the setting value with type conversion.
@@ -64,21 +89,31 @@ class UserSettings(Base):
         """
         if value is None:
             self.value = None
-        elif isinstance(value, (dict, list)):
-            self.value = json.dumps(value)
-            self.type = "json"
+        else:
+            self.value, self.type = self.encode_value(value)
+        # Drop any cached conversion; the next get_value recomputes it
+        self.__dict__.pop("_value_cache", None)
+
+    @staticmethod
+    def encode_value(value: Any) -> Tuple[str, str]:
+        """Encode a Python value as a stored string and its setting type.
+
+        Args:
+            value: Value to encode (not None)
+
+        Returns:
+            Tuple of (stored string, setting type)
+        """
+        if isinstance(value, (dict, list)):
+            return json.dumps(value), "json"
         elif isinstance(value, bool):
-            self.value = str(value)
-            self.type = "boolean"
+            return str(value), "boolean"
         elif isinstance(value, int):
-            self.value = str(value)
-            self.type = "integer"
+            return str(value), "integer"
         elif isinstance(value, float):
-            self.value = str(value)
-            self.type = "float"
+            return str(value), "float"
         else:
-            self.value = str(value)
-            self.type = "string"
+            return str(value), "string"
 
     def to_dict(self) -> dict:
         """Convert setting to dictionary.
@@ -180,3 +215,20 @@ DEFAULT_SETTINGS = {
         "description": "Available expense categories",
     },
 }
+
+
+def _default_settings_row(key: str, spec: dict) -> dict:
+    """Build the column values for one default setting."""
+    value, value_type = UserSettings.encode_value(spec["value"])
+    return {
+        "key": key,
+        "value": value,
+        "type": value_type,
+        "description": spec["description"],
+    }
+
+
+# Encoded once at import, ready for a single executemany insert
+DEFAULT_SETTINGS_ROWS = tuple(
+    _default_settings_row(key, spec) for key, spec in DEFAULT_SETTINGS.items()
+)
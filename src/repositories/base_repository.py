@@ -1,11 +1,13 @@
 """
 Base repository with common CRUD operations.
 """
-from typing import Generic, TypeVar, Type, List, Optional, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
+from contextlib import contextmanager
+from typing import Generic, TypeVar, Type, List, Optional, Any, Dict, Iterable, Iterator, Sequence
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import and_, asc, desc, event, func, insert, inspect, or_, select, text, update
 import logging
 
+from src.config.settings import settings
 from src.core.database import Base
 from src.core.exceptions import NotFoundError, DatabaseError
 
@@ -13,6 +15,9 @@ logger = logging.getLogger(__name__)
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Values per IN (...) lookup; stays below SQLite's bound parameter limit
+IN_CHUNK_SIZE = 500
+
 
 class BaseRepository(Generic[ModelType]):
     """Generic base repository for CRUD operations."""
@@ -24,12 +29,20 @@ class BaseRepository(Generic[ModelType]):
             model: SQLAlchemy model class
         """
         self.model = model
+        # Mapped columns; get_all orders by and update() writes only these
+        self._columns = {
+            attr.key: getattr(model, attr.key) for attr in inspect(model).column_attrs
+        }
 
-    def create(self, db: Session, **kwargs) -> ModelType:
+    def create(self, db: Session, refresh: bool = False, **kwargs) -> ModelType:
         """Create a new record.
 
+        The flush fills in the new ID and the Python-side column defaults,
+        so no reload is needed unless the database itself changes the row.
+
         Args:
             db: Database session
+            refresh: Reload the row from the database after inserting it
             **kwargs: Model field values
 
         Returns:
@@ -42,16 +55,58 @@ class BaseRepository(Generic[ModelType]):
             instance = self.model(**kwargs)
             db.add(instance)
             db.flush()
-            db.refresh(instance)
-            logger.debug(f"Created {self.model.__name__} with id={instance.id}")
+            if refresh:
+                db.refresh(instance)
+            self._after_write(db)
+            logger.debug("Created %s with id=%s", self.model.__name__, instance.id)
             return instance
         except Exception as e:
-            logger.error(f"Failed to create {self.model.__name__}: {e}")
+            logger.error("Failed to create %s: %s", self.model.__name__, e)
             raise DatabaseError(f"Failed to create record: {str(e)}")
 
+    def create_many(self, db: Session, rows: List[dict]) -> List[int]:
+        """Insert many records and return their new IDs.
+
+        Uses INSERT ... RETURNING, batched into multi-row VALUES statements,
+        so IDs come back without a SELECT or refresh per record.
+
+        Args:
+            db: Database session
+            rows: Column values for each record
+
+        Returns:
+            IDs of the inserted records, in the order of rows
+
+        Raises:
+            DatabaseError: If insertion fails
+        """
+        if not rows:
+            return []
+        try:
+            stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+            ids = list(db.scalars(stmt, rows))
+            self._after_write(db)
+            logger.debug("Created %s %s records", len(ids), self.model.__name__)
+            return ids
+        except Exception as e:
+            logger.error("Failed to create %s records: %s", self.model.__name__, e)
+            raise DatabaseError(f"Failed to create records: {str(e)}")
+
+    def _after_write(self, db: Session) -> None:
+        """Hook called after every create, update or delete.
+
+        Subclasses override it to drop cached derived data.
+
+        Args:
+            db: Database session that made the change
+        """
+
     def get_by_id(self, db: Session, id: int) -> Optional[ModelType]:
         """Get record by ID.
 
+        Instances already in the session are returned without a query;
+        otherwise the session's cached primary key lookup is used.
+
         Args:
             db: Database session
             id: Record ID
@@ -60,11 +115,47 @@ class BaseRepository(Generic[ModelType]):
             Model instance or None if not found
         """
         try:
-            return db.query(self.model).filter(self.model.id == id).first()
+            return db.get(self.model, id)
         except Exception as e:
-            logger.error(f"Failed to get {self.model.__name__} by id={id}: {e}")
+            logger.error("Failed to get %s by id=%s: %s", self.model.__name__, id, e)
             raise DatabaseError(f"Failed to retrieve record: {str(e)}")
 
+    def get_by_ids(self, db: Session, ids: Iterable[int]) -> Dict[int, ModelType]:
+        """Get several records by ID in one query per chunk of IDs.
+
+        Args:
+            db: Database session
+            ids: Record IDs
+
+        Returns:
+            Dictionary mapping ID to model instance; missing IDs are absent
+        """
+        return self.get_many_by(db, "id", ids)
+
+    def get_many_by(self, db: Session, field: str, values: Iterable[Any]) -> Dict[Any, ModelType]:
+        """Get records whose field matches any of the given values.
+
+        Args:
+            db: Database session
+            field: Column name to match on (should be unique)
+            values: Values to look up
+
+        Returns:
+            Dictionary mapping field value to model instance
+        """
+        try:
+            column = getattr(self.model, field)
+            values = list(dict.fromkeys(values))
+            found = {}
+            for start in range(0, len(values), IN_CHUNK_SIZE):
+                chunk = values[start:start + IN_CHUNK_SIZE]
+                for instance in db.query(self.model).filter(column.in_(chunk)):
+                    found[getattr(instance, field)] = instance
+            return found
+        except Exception as e:
+            logger.error("Failed to get %s records by %s: %s", self.model.__name__, field, e)
+            raise DatabaseError(f"Failed to retrieve records: {str(e)}")
+
     def get_by_id_or_fail(self, db: Session, id: int) -> ModelType:
         """Get record by ID or raise exception.
 
@@ -90,6 +181,9 @@ class BaseRepository(Generic[ModelType]):
         limit: int = 100,
         order_by: str = "id",
         order_desc: bool = False,
+        after_id: Optional[int] = None,
+        load_only_fields: Optional[Sequence[str]] = None,
+        eager_load: Optional[Sequence[str]] = None,
     ) -> List[ModelType]:
         """Get all records with pagination.
 
@@ -97,8 +191,15 @@ class BaseRepository(Generic[ModelType]):
             db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
-            order_by: Field to order by
+            order_by: Column to order by (unknown names order by id)
             order_desc: Order descending if True
+            after_id: ID of the last record of the previous page; when set,
+                the page starts right after it and skip is ignored
+            load_only_fields: Columns to load; others are deferred until
+                accessed (the primary key is always loaded)
+            eager_load: Relationships to load up front with one extra
+                SELECT ... IN query each (selectinload, which also works
+                with yield_per)
 
         Returns:
             List of model instances
@@ -106,19 +207,87 @@ class BaseRepository(Generic[ModelType]):
         try:
             query = db.query(self.model)
 
-            # Apply ordering
-            if hasattr(self.model, order_by):
-                order_column = getattr(self.model, order_by)
-                if order_desc:
-                    query = query.order_by(desc(order_column))
-                else:
-                    query = query.order_by(asc(order_column))
-
-            return query.offset(skip).limit(limit).all()
+            options = []
+            if load_only_fields:
+                options.append(
+                    load_only(*[getattr(self.model, field) for field in load_only_fields])
+                )
+            for relationship_name in eager_load or ():
+                options.append(selectinload(getattr(self.model, relationship_name)))
+            if options:
+                query = query.options(*options)
+
+            # Apply ordering; unknown names fall back to id
+            order_column = self._columns.get(order_by, self.model.id)
+            query = self.paginate(query, order_column, order_desc, skip, limit, after_id)
+
+            return query.all()
         except Exception as e:
-            logger.error(f"Failed to get all {self.model.__name__}: {e}")
+            logger.error("Failed to get all %s: %s", self.model.__name__, e)
             raise DatabaseError(f"Failed to retrieve records: {str(e)}")
 
+    def paginate(
+        self,
+        query,
+        order_column,
+        order_desc: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+    ):
+        """Order a query and restrict it to one page.
+
+        With after_id the page is found by keyset: rows are ordered by
+        (order_column, id), and the filter seeks past the cursor row
+        through the index instead of scanning and discarding skip rows.
+        The order column should be non-null for keyset paging. If the
+        cursor row no longer exists, the page continues by id alone.
+
+        Args:
+            query: Query to paginate
+            order_column: Column to order by
+            order_desc: Order descending if True
+            skip: Number of records to skip (offset paging)
+            limit: Maximum number of records to return
+            after_id: ID of the last record of the previous page
+
+        Returns:
+            Paginated query
+        """
+        id_column = self.model.id
+        direction = desc if order_desc else asc
+        if order_column is id_column:
+            query = query.order_by(direction(id_column))
+        else:
+            query = query.order_by(direction(order_column), direction(id_column))
+
+        if after_id is None:
+            return query.offset(skip).limit(limit)
+
+        if order_column is id_column:
+            after = id_column < after_id if order_desc else id_column > after_id
+            return query.filter(after).limit(limit)
+
+        cursor = select(order_column).where(id_column == after_id)
+        cursor_value = cursor.scalar_subquery()
+        # If the cursor row was deleted meanwhile, its sort value is NULL
+        # and every comparison fails; seek by id alone instead of ending
+        # the listing early
+        cursor_missing = ~cursor.exists()
+        if order_desc:
+            after = or_(
+                order_column < cursor_value,
+                and_(order_column == cursor_value, id_column < after_id),
+                and_(cursor_missing, id_column < after_id),
+            )
+        else:
+            after = or_(
+                order_column > cursor_value,
+                and_(order_column == cursor_value, id_column > after_id),
+                and_(cursor_missing, id_column > after_id),
+            )
+        return query.filter(after).limit(limit)
+
     def count(self, db: Session, **filters) -> int:
         """Count records matching filters.
 
@@ -130,20 +299,32 @@ class BaseRepository(Generic[ModelType]):
             Count of matching records
         """
         try:
-            query = db.query(self.model)
+            # COUNT directly on the table rather than Query.count()'s subquery
+            query = db.query(func.count(self.model.id))
             if filters:
                 query = query.filter_by(**filters)
-            return query.count()
+            return query.scalar()
         except Exception as e:
-            logger.error(f"Failed to count {self.model.__name__}: {e}")
+            logger.error("Failed to count %s: %s", self.model.__name__, e)
             raise DatabaseError(f"Failed to count records: {str(e)}")
 
-    def update(self, db: Session, id: int, **kwargs) -> ModelType:
+    def update(
+        self,
+        db: Session,
+        id: int,
+        refresh: bool = False,
+        conditions: Sequence[Any] = (),
+        **kwargs,
+    ) -> ModelType:
         """Update a record.
 
         Args:
             db: Database session
             id: Record ID
+            refresh: Reload the row after updating it on backends without
+                UPDATE ... RETURNING (the RETURNING path always reloads)
+            conditions: Extra WHERE criteria; the record is treated as not
+                found when they do not hold
             **kwargs: Fields to update
 
         Returns:
@@ -154,20 +335,43 @@ class BaseRepository(Generic[ModelType]):
             DatabaseError: If update fails
         """
         try:
-            instance = self.get_by_id_or_fail(db, id)
-
-            for key, value in kwargs.items():
-                if hasattr(instance, key):
+            values = {key: value for key, value in kwargs.items() if key in self._columns}
+            if not values or not db.get_bind().dialect.update_returning:
+                instance = (
+                    db.query(self.model).filter(self.model.id == id, *conditions).first()
+                )
+                if instance is None:
+                    raise NotFoundError(f"{self.model.__name__} with id={id} not found")
+                for key, value in values.items():
                     setattr(instance, key, value)
-
+                db.flush()
+                if refresh:
+                    db.refresh(instance)
+                self._after_write(db)
+                logger.debug("Updated %s with id=%s", self.model.__name__, id)
+                return instance
+
+            # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh.
+            # Pending changes are flushed first so the returned row, which
+            # replaces the loaded state, does not discard them.
             db.flush()
-            db.refresh(instance)
-            logger.debug(f"Updated {self.model.__name__} with id={id}")
+            stmt = (
+                update(self.model)
+                .where(self.model.id == id, *conditions)
+                .values(**values)
+                .returning(self.model)
+                .execution_options(populate_existing=True)
+            )
+            instance = db.scalars(stmt).first()
+            if instance is None:
+                raise NotFoundError(f"{self.model.__name__} with id={id} not found")
+            self._after_write(db)
+            logger.debug("Updated %s with id=%s", self.model.__name__, id)
             return instance
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to update {self.model.__name__} id={id}: {e}")
+            logger.error("Failed to update %s id=%s: %s", self.model.__name__, id, e)
             raise DatabaseError(f"Failed to update record: {str(e)}")
 
     def delete(self, db: Session, id: int) -> bool:
@@ -185,15 +389,22 @@ class BaseRepository(Generic[ModelType]):
             DatabaseError: If deletion fails
         """
         try:
-            instance = self.get_by_id_or_fail(db, id)
-            db.delete(instance)
-            db.flush()
-            logger.debug(f"Deleted {self.model.__name__} with id={id}")
+            # Single DELETE; instances already loaded in this session are not
+            # marked deleted, which is fine for the short per-request sessions
+            deleted = (
+                db.query(self.model)
+                .filter(self.model.id == id)
+                .delete(synchronize_session=False)
+            )
+            if not deleted:
+                raise NotFoundError(f"{self.model.__name__} with id={id} not found")
+            self._after_write(db)
+            logger.debug("Deleted %s with id=%s", self.model.__name__, id)
             return True
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to delete {self.model.__name__} id={id}: {e}")
+            logger.error("Failed to delete %s id=%s: %s", self.model.__name__, id, e)
             raise DatabaseError(f"Failed to delete record: {str(e)}")
 
     def exists(self, db: Session, **filters) -> bool:
@@ -207,9 +418,9 @@ class BaseRepository(Generic[ModelType]):
             True if exists, False otherwise
         """
         try:
-            return db.query(self.model).filter_by(**filters).first() is not None
+            return db.query(db.query(self.model).filter_by(**filters).exists()).scalar()
         except Exception as e:
-            logger.error(f"Failed to check existence for {self.model.__name__}: {e}")
+            logger.error("Failed to check existence for %s: %s", self.model.__name__, e)
             return False
 
     def find_one(self, db: Session, **filters) -> Optional[ModelType]:
@@ -225,7 +436,7 @@ class BaseRepository(Generic[ModelType]):
         try:
             return db.query(self.model).filter_by(**filters).first()
         except Exception as e:
-            logger.error(f"Failed to find {self.model.__name__}: {e}")
+            logger.error("Failed to find %s: %s", self.model.__name__, e)
             raise DatabaseError(f"Failed to find record: {str(e)}")
 
     def find_all(self, db: Session, **filters) -> List[ModelType]:
@@ -241,5 +452,93 @@ class BaseRepository(Generic[ModelType]):
         try:
             return db.query(self.model).filter_by(**filters).all()
         except Exception as e:
-            logger.error(f"Failed to find {self.model.__name__}: {e}")
+            logger.error("Failed to find %s: %s", self.model.__name__, e)
             raise DatabaseError(f"Failed to find records: {str(e)}")
+
+    def iter_all(self, db: Session, batch_size: int = 1000, **filters) -> Iterator[ModelType]:
+        """Iterate over records matching filters without loading them all.
+
+        Rows are fetched and hydrated batch_size at a time, so memory stays
+        constant for large tables. Only selectinload eager options can be
+        combined with this.
+
+        Args:
+            db: Database session
+            batch_size: Number of rows fetched per batch
+            **filters: Filter conditions
+
+        Yields:
+            Model instances
+        """
+        try:
+            query = (
+                db.query(self.model)
+                .filter_by(**filters)
+                .yield_per(batch_size)
+            )
+            yield from query
+        except Exception as e:
+            logger.error("Failed to iterate %s: %s", self.model.__name__, e)
+            raise DatabaseError(f"Failed to iterate records: {str(e)}")
+
+    @contextmanager
+    def debug_queries(self, db: Session) -> Iterator[List[str]]:
+        """Collect the SQL statements a block of code sends through a session.
+
+        Only active in development mode (APP_ENV=development or DEBUG);
+        otherwise the list stays empty.
+
+        Usage:
+            with repo.debug_queries(db) as queries:
+                repo.search(db, "lamp")
+            logger.info("%s queries", len(queries))
+
+        Args:
+            db: Database session to watch
+
+        Yields:
+            List that receives each executed SQL statement
+        """
+        queries = []
+        if not settings.is_development:
+            yield queries
+            return
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            queries.append(statement)
+
+        connection = db.connection()
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            yield queries
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+            logger.debug("%s queries (%s): %s", self.model.__name__, len(queries), queries)
+
+    def explain(self, db: Session, statement) -> List[str]:
+        """Log and return the database's plan for a statement.
+
+        Uses EXPLAIN QUERY PLAN on SQLite and EXPLAIN (ANALYZE, BUFFERS) on
+        PostgreSQL, which executes the statement. Only available in
+        development mode.
+
+        Args:
+            db: Database session
+            statement: Select statement or ORM query
+
+        Returns:
+            Plan lines
+
+        Raises:
+            RuntimeError: If not in development mode
+        """
+        if not settings.is_development:
+            raise RuntimeError("Query plans are only available in development mode")
+
+        statement = getattr(statement, "statement", statement)
+        dialect = db.get_bind().dialect
+        sql = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        prefix = "EXPLAIN QUERY PLAN " if dialect.name == "sqlite" else "EXPLAIN (ANALYZE, BUFFERS) "
+        plan = [" ".join(str(col) for col in row) for row in db.execute(text(prefix + sql))]
+        logger.info("Query plan for %s:\n%s", self.model.__name__, "\n".join(plan))
+        return plan
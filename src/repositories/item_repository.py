@@ -1,18 +1,90 @@
 """
 Repository for Item model operations.
 """
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
+from sqlalchemy import Integer, or_, and_, bindparam, case, column, event, exists, func, select, text
+from sqlalchemy.dialects import postgresql, sqlite
 from datetime import datetime, timedelta
+import copy
+import functools
 import logging
+import time
 
-from src.models.item import Item
+from src.core import database
+from src.models.item import Item, NO_PHOTOS_SQL
 from src.repositories.base_repository import BaseRepository
-from src.core.exceptions import DatabaseError
+from src.core.exceptions import DatabaseError, DuplicateError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# IDs of items whose title, description or SKU contain the quoted phrase
+_ITEM_SEARCH_IDS = text(
+    f"SELECT rowid FROM {database.ITEM_SEARCH_TABLE} "
+    f"WHERE {database.ITEM_SEARCH_TABLE} MATCH :match"
+).columns(column("rowid", Integer))
+
+
+# Hot single-item lookups, built once so SQLAlchemy's compiled cache hits
+# without re-resolving filter_by() keyword names on every call
+_ITEM_BY_SKU = select(Item).where(Item.sku == bindparam("sku"))
+_ITEM_BY_EBAY_ID = select(Item).where(Item.ebay_id == bindparam("ebay_id"))
+
+# INSERT constructs that support ON CONFLICT DO NOTHING, by dialect name
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Seconds whole-table aggregates stay cached; writes through the
+# repository clear them sooner
+AGGREGATE_CACHE_TTL = 30.0
+
+# (method name, arguments) -> (monotonic timestamp, result)
+_aggregate_cache: Dict[tuple, tuple] = {}
+# Bumped on every clear so results computed before a write are not stored
+_aggregate_generation = 0
+
+
+def _clear_aggregate_cache(session=None, *args):
+    """Drop all cached aggregates.
+
+    Args:
+        session: Session that committed or rolled back the change (when
+            used as a listener)
+        *args: Further listener arguments, unused
+    """
+    global _aggregate_generation
+    _aggregate_generation += 1
+    _aggregate_cache.clear()
+    if session is not None:
+        session.info.pop("items_changed", None)
+
+
+def _cached_aggregate(method):
+    """Cache an aggregate query method's result for AGGREGATE_CACHE_TTL.
+
+    The session argument is not part of the cache key. A session holding
+    uncommitted item changes bypasses the cache both ways, since what it
+    reads may be rolled back. Callers get a copy, so they may modify the
+    result.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, db, *args, **kwargs):
+        if db.info.get("items_changed") or db.new or db.dirty or db.deleted:
+            return method(self, db, *args, **kwargs)
+
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        hit = _aggregate_cache.get(key)
+        if hit and time.monotonic() - hit[0] < AGGREGATE_CACHE_TTL:
+            return copy.deepcopy(hit[1])
+
+        generation = _aggregate_generation
+        result = method(self, db, *args, **kwargs)
+        if generation == _aggregate_generation:
+            _aggregate_cache[key] = (time.monotonic(), result)
+        return copy.deepcopy(result)
+
+    return wrapper
+
 
 class ItemRepository(BaseRepository[Item]):
     """Repository for Item model with specialized queries."""
@@ -20,6 +92,24 @@ class ItemRepository(BaseRepository[Item]):
     def __init__(self):
         super().__init__(Item)
 
+    def _after_write(self, db: Session) -> None:
+        """Clear cached aggregates now and again once the change commits.
+
+        The second clear stops a read that ran before the commit from
+        keeping its stale result. Until the transaction ends the session is
+        marked with items_changed, which keeps its reads out of the cache;
+        the mark is dropped on commit or rollback.
+
+        Args:
+            db: Database session that made the change
+        """
+        _clear_aggregate_cache()
+        db.info["items_changed"] = True
+        if not db.info.get("items_listeners"):
+            db.info["items_listeners"] = True
+            for name in ("after_commit", "after_rollback", "after_soft_rollback"):
+                event.listen(db, name, _clear_aggregate_cache)
+
     def search(
         self,
         db: Session,
@@ -28,6 +118,8 @@ class ItemRepository(BaseRepository[Item]):
         category: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        after_id: Optional[int] = None,
+        prefix: bool = False,
     ) -> List[Item]:
         """Search items by title, description, or SKU.
 
@@ -38,6 +130,10 @@ class ItemRepository(BaseRepository[Item]):
             category: Filter by category
             skip: Number of records to skip
             limit: Maximum number of records to return
+            after_id: ID of the last item of the previous page (keyset paging)
+            prefix: Only match titles or SKUs starting with the query
+                (case-insensitive); served by the lower(title)/lower(sku)
+                indexes instead of a substring search
 
         Returns:
             List of matching items
@@ -46,13 +142,32 @@ class ItemRepository(BaseRepository[Item]):
             q = db.query(Item)
 
             # Search filter
-            if query:
-                search_filter = or_(
-                    Item.title.ilike(f"%{query}%"),
-                    Item.description.ilike(f"%{query}%"),
-                    Item.sku.ilike(f"%{query}%"),
+            if query and prefix:
+                logger.debug("Item search mode: prefix (%r)", query)
+                # Range on lower(column) so the expression indexes apply
+                start = func.lower(query)
+                end = start + "\U0010ffff"
+                q = q.filter(
+                    or_(
+                        and_(func.lower(Item.sku) >= start, func.lower(Item.sku) < end),
+                        and_(func.lower(Item.title) >= start, func.lower(Item.title) < end),
+                    )
                 )
-                q = q.filter(search_filter)
+            elif query:
+                logger.debug("Item search mode: substring (%r)", query)
+                if database.item_search_enabled and len(query) >= 3:
+                    # Trigram index lookup; matches the same substrings as
+                    # the LIKE scan below (trigrams need 3+ characters)
+                    q = q.filter(Item.id.in_(_ITEM_SEARCH_IDS.bindparams(
+                        match='"' + query.replace('"', '""') + '"'
+                    )))
+                else:
+                    search_filter = or_(
+                        Item.title.ilike(f"%{query}%"),
+                        Item.description.ilike(f"%{query}%"),
+                        Item.sku.ilike(f"%{query}%"),
+                    )
+                    q = q.filter(search_filter)
 
             # Status filter
             if status:
@@ -62,9 +177,9 @@ class ItemRepository(BaseRepository[Item]):
             if category:
                 q = q.filter(Item.category == category)
 
-            return q.order_by(Item.created_at.desc()).offset(skip).limit(limit).all()
+            return self.paginate(q, Item.created_at, True, skip, limit, after_id).all()
         except Exception as e:
-            logger.error(f"Failed to search items: {e}")
+            logger.error("Failed to search items: %s", e)
             raise DatabaseError(f"Search failed: {str(e)}")
 
     def get_by_status(
@@ -93,6 +208,7 @@ class ItemRepository(BaseRepository[Item]):
         category: str,
         skip: int = 0,
         limit: int = 100,
+        after_id: Optional[int] = None,
     ) -> List[Item]:
         """Get items by category.
 
@@ -101,23 +217,111 @@ class ItemRepository(BaseRepository[Item]):
             category: Item category
             skip: Number of records to skip
             limit: Maximum number of records to return
+            after_id: ID of the last item of the previous page (keyset paging)
 
         Returns:
             List of items in specified category
         """
         try:
-            return (
-                db.query(Item)
-                .filter(Item.category == category)
-                .order_by(Item.created_at.desc())
-                .offset(skip)
-                .limit(limit)
-                .all()
+            query = db.query(Item).filter(Item.category == category)
+            return self.paginate(query, Item.created_at, True, skip, limit, after_id).all()
+        except Exception as e:
+            logger.error("Failed to get items by category: %s", e)
+            raise DatabaseError(f"Failed to retrieve items: {str(e)}")
+
+    def list_filtered(
+        self,
+        db: Session,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+    ) -> List[Item]:
+        """Get items matching optional status and category filters, newest first.
+
+        Args:
+            db: Database session
+            status: Filter by status
+            category: Filter by category
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            after_id: ID of the last item of the previous page (keyset paging)
+
+        Returns:
+            List of items
+        """
+        try:
+            stmt = self._filter_listing(select(Item), status, category)
+            stmt = self.paginate(stmt, Item.created_at, True, skip, limit, after_id)
+            return list(db.scalars(stmt))
+        except Exception as e:
+            logger.error("Failed to list items: %s", e)
+            raise DatabaseError(f"Failed to retrieve items: {str(e)}")
+
+    def list_with_count(
+        self,
+        db: Session,
+        status: Optional[str] = None,
+        category: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+    ) -> Tuple[List[Item], int]:
+        """Get one page of list_filtered together with the number of matches.
+
+        Without after_id the total comes from COUNT(*) OVER () on the same
+        SELECT, so no second COUNT query is needed. With after_id the
+        window would only see the rows from the cursor on, so the total is
+        counted separately without the keyset filter and stays the same
+        on every page.
+
+        Args:
+            db: Database session
+            status: Filter by status
+            category: Filter by category
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            after_id: ID of the last item of the previous page (keyset paging)
+
+        Returns:
+            Tuple of (items, total)
+        """
+        try:
+            if after_id is None:
+                stmt = self._filter_listing(
+                    select(Item, func.count().over().label("total")), status, category
+                )
+                page = self.paginate(stmt, Item.created_at, True, skip, limit)
+                rows = db.execute(page).all()
+                if rows:
+                    return [row[0] for row in rows], rows[0].total
+                if not skip:
+                    return [], 0
+                # Offset past the end: the window has no row to report on
+                items = []
+            else:
+                stmt = self._filter_listing(select(Item), status, category)
+                page = self.paginate(stmt, Item.created_at, True, skip, limit, after_id)
+                items = list(db.scalars(page))
+
+            counted = self._filter_listing(
+                select(func.count(Item.id)), status, category
             )
+            return items, db.scalar(counted)
         except Exception as e:
-            logger.error(f"Failed to get items by category: {e}")
+            logger.error("Failed to list items: %s", e)
             raise DatabaseError(f"Failed to retrieve items: {str(e)}")
 
+    @staticmethod
+    def _filter_listing(stmt, status: Optional[str], category: Optional[str]):
+        """Apply the list_filtered WHERE clauses to a select."""
+        if status:
+            stmt = stmt.where(Item.status == status)
+        if category:
+            stmt = stmt.where(Item.category == category)
+        return stmt
+
     def get_by_ebay_id(self, db: Session, ebay_id: str) -> Optional[Item]:
         """Get item by eBay ID.
 
@@ -128,7 +332,7 @@ class ItemRepository(BaseRepository[Item]):
         Returns:
             Item or None
         """
-        return self.find_one(db, ebay_id=ebay_id)
+        return self._lookup(db, _ITEM_BY_EBAY_ID, ebay_id=ebay_id)
 
     def get_by_sku(self, db: Session, sku: str) -> Optional[Item]:
         """Get item by SKU.
@@ -140,35 +344,223 @@ class ItemRepository(BaseRepository[Item]):
         Returns:
             Item or None
         """
-        return self.find_one(db, sku=sku)
+        return self._lookup(db, _ITEM_BY_SKU, sku=sku)
+
+    def create_item(self, db: Session, **fields) -> Item:
+        """Create an item, refusing a SKU another item uses.
+
+        Where the database supports it, the SKU check is an
+        ON CONFLICT (sku) DO NOTHING on the INSERT itself, so there is no
+        separate lookup and no window for a concurrent insert.
+
+        Args:
+            db: Database session
+            **fields: Item field values
+
+        Returns:
+            Created item
+
+        Raises:
+            DuplicateError: If another item already has the SKU
+            DatabaseError: If creation fails
+        """
+        sku = fields.get("sku")
+        if not sku:
+            return self.create(db, **fields)
+
+        dialect_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if dialect_insert is None:
+            if self.get_by_sku(db, sku) is not None:
+                raise DuplicateError(f"Item with SKU '{sku}' already exists")
+            return self.create(db, **fields)
+
+        stmt = (
+            dialect_insert(Item)
+            .values(**fields)
+            .on_conflict_do_nothing(index_elements=[Item.sku])
+            .returning(Item)
+        )
+        try:
+            db.flush()
+            item = db.execute(stmt).scalar_one_or_none()
+        except Exception as e:
+            logger.error("Failed to create Item: %s", e)
+            raise DatabaseError(f"Failed to create record: {str(e)}")
+        if item is None:
+            raise DuplicateError(f"Item with SKU '{sku}' already exists")
+        self._after_write(db)
+        return item
+
+    def update_item(self, db: Session, item_id: int, **fields) -> Item:
+        """Update an item in one statement, refusing a SKU another item uses.
+
+        The SKU check is a NOT EXISTS guard on the UPDATE itself; the item
+        is only looked up again if the UPDATE matched nothing, to tell a
+        missing item from a SKU conflict.
+
+        Args:
+            db: Database session
+            item_id: Item ID
+            **fields: Fields to update
+
+        Returns:
+            Updated item
+
+        Raises:
+            NotFoundError: If item not found
+            DuplicateError: If another item already has the SKU
+            DatabaseError: If update fails
+        """
+        sku = fields.get("sku")
+        if not sku:
+            return self.update(db, item_id, **fields)
+
+        guard = ~exists().where(Item.sku == sku, Item.id != item_id)
+        try:
+            return self.update(db, item_id, conditions=(guard,), **fields)
+        except NotFoundError:
+            if self.get_by_id(db, item_id) is None:
+                raise
+            raise DuplicateError(f"Item with SKU '{sku}' already exists")
+
+    def set_status(self, db: Session, item_id: int, new_status: str) -> Item:
+        """Change an item's status and stamp listed_at/sold_at in one UPDATE.
+
+        The timestamp is only set if it is still empty, decided in SQL with
+        COALESCE so the item does not have to be read first.
+
+        Args:
+            db: Database session
+            item_id: Item ID
+            new_status: New status
+
+        Returns:
+            Updated item
+
+        Raises:
+            NotFoundError: If item not found
+            DatabaseError: If update fails
+        """
+        changes = {"status": new_status}
+        if new_status == "Listed":
+            changes["listed_at"] = func.coalesce(Item.listed_at, datetime.utcnow())
+        elif new_status == "Sold":
+            changes["sold_at"] = func.coalesce(Item.sold_at, datetime.utcnow())
+        return self.update(db, item_id, **changes)
+
+    def append_photos(self, db: Session, item_id: int, filenames: Iterable[str]) -> Item:
+        """Add several photo filenames to an item with one UPDATE.
+
+        Filenames the item already has are skipped.
+
+        Args:
+            db: Database session
+            item_id: Item ID
+            filenames: Photo filenames to add
+
+        Returns:
+            Updated item
+
+        Raises:
+            NotFoundError: If item not found
+            DatabaseError: If update fails
+        """
+        photos = self._get_photos(db, item_id)
+        for filename in filenames:
+            if filename not in photos:
+                photos.append(filename)
+        return self.update(db, item_id, photos=photos or None)
+
+    def remove_photos(self, db: Session, item_id: int, filenames: Iterable[str]) -> Item:
+        """Remove several photo filenames from an item with one UPDATE.
+
+        Args:
+            db: Database session
+            item_id: Item ID
+            filenames: Photo filenames to remove
+
+        Returns:
+            Updated item
+
+        Raises:
+            NotFoundError: If item not found
+            DatabaseError: If update fails
+        """
+        removed = set(filenames)
+        photos = [f for f in self._get_photos(db, item_id) if f not in removed]
+        return self.update(db, item_id, photos=photos or None)
+
+    def _get_photos(self, db: Session, item_id: int) -> List[str]:
+        """Read only the photos column of an item.
+
+        Raises:
+            NotFoundError: If item not found
+            DatabaseError: If query fails
+        """
+        try:
+            db.flush()
+            row = db.execute(select(Item.photos).where(Item.id == item_id)).first()
+        except Exception as e:
+            logger.error("Failed to get photos of item %s: %s", item_id, e)
+            raise DatabaseError(f"Failed to retrieve item: {str(e)}")
+        if row is None:
+            raise NotFoundError(f"Item with id={item_id} not found")
+        return list(row.photos or [])
+
+    def _lookup(self, db: Session, statement, **params) -> Optional[Item]:
+        """Run a prebuilt single-item lookup statement.
+
+        Args:
+            db: Database session
+            statement: Select statement with bound parameters
+            **params: Values for the bound parameters
+
+        Returns:
+            Item or None
+        """
+        try:
+            return db.execute(statement, params).scalar_one_or_none()
+        except Exception as e:
+            logger.error("Failed to find Item by %s: %s", params, e)
+            raise DatabaseError(f"Failed to find record: {str(e)}")
+
+    def get_by_skus(self, db: Session, skus: Iterable[str]) -> Dict[str, Item]:
+        """Get items for several SKUs at once.
+
+        Args:
+            db: Database session
+            skus: Item SKUs
+
+        Returns:
+            Dictionary mapping SKU to item; unknown SKUs are absent
+        """
+        return self.get_many_by(db, "sku", skus)
 
     def get_recent_items(
         self,
         db: Session,
         days: int = 7,
         limit: int = 50,
+        after_id: Optional[int] = None,
     ) -> List[Item]:
-        """Get recently created items.
+        """Get recently created items, newest first.
 
         Args:
             db: Database session
             days: Number of days to look back
             limit: Maximum number of items to return
+            after_id: ID of the last item of the previous page (keyset paging)
 
         Returns:
             List of recent items
         """
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days)
-            return (
-                db.query(Item)
-                .filter(Item.created_at >= cutoff_date)
-                .order_by(Item.created_at.desc())
-                .limit(limit)
-                .all()
-            )
+            query = db.query(Item).filter(Item.created_at >= cutoff_date)
+            query = self.paginate(query, Item.created_at, True, 0, limit, after_id)
+            return query.all()
         except Exception as e:
-            logger.error(f"Failed to get recent items: {e}")
+            logger.error("Failed to get recent items: %s", e)
             raise DatabaseError(f"Failed to retrieve items: {str(e)}")
 
     def get_profitable_items(
@@ -188,30 +580,29 @@ class ItemRepository(BaseRepository[Item]):
             List of profitable items
         """
         try:
-            # Calculate profit margin: ((price - cost - shipping) / price) * 100
-            items = (
+            # Calculate profit margin in SQL so only the top rows are loaded:
+            # ((price - cost - shipping) / price) * 100
+            margin = (
+                (Item.price - Item.cost - func.coalesce(Item.shipping_cost, 0.0))
+                / Item.price
+                * 100
+            )
+            return (
                 db.query(Item)
                 .filter(
                     and_(
                         Item.price.isnot(None),
                         Item.price > 0,
                         Item.cost.isnot(None),
+                        margin >= min_margin,
                     )
                 )
+                .order_by(margin.desc(), Item.id)
+                .limit(limit)
                 .all()
             )
-
-            # Filter by profit margin
-            profitable = [
-                item for item in items if item.profit_margin >= min_margin
-            ]
-
-            # Sort by profit margin descending
-            profitable.sort(key=lambda x: x.profit_margin, reverse=True)
-
-            return profitable[:limit]
         except Exception as e:
-            logger.error(f"Failed to get profitable items: {e}")
+            logger.error("Failed to get profitable items: %s", e)
             raise DatabaseError(f"Failed to retrieve items: {str(e)}")
 
     def get_items_without_photos(
@@ -231,14 +622,15 @@ class ItemRepository(BaseRepository[Item]):
         try:
             return (
                 db.query(Item)
-                .filter(or_(Item.photos.is_(None), Item.photos == "null", Item.photos == "[]"))
+                .filter(text(NO_PHOTOS_SQL))
                 .limit(limit)
                 .all()
             )
         except Exception as e:
-            logger.error(f"Failed to get items without photos: {e}")
+            logger.error("Failed to get items without photos: %s", e)
             raise DatabaseError(f"Failed to retrieve items: {str(e)}")
 
+    @_cached_aggregate
     def count_by_status(self, db: Session) -> dict:
         """Count items grouped by status.
 
@@ -256,9 +648,10 @@ class ItemRepository(BaseRepository[Item]):
             )
             return {status: count for status, count in result}
         except Exception as e:
-            logger.error(f"Failed to count items by status: {e}")
+            logger.error("Failed to count items by status: %s", e)
             raise DatabaseError(f"Failed to count items: {str(e)}")
 
+    @_cached_aggregate
     def count_by_category(self, db: Session) -> dict:
         """Count items grouped by category.
 
@@ -276,9 +669,77 @@ class ItemRepository(BaseRepository[Item]):
             )
             return {category or "Uncategorized": count for category, count in result}
         except Exception as e:
-            logger.error(f"Failed to count items by category: {e}")
+            logger.error("Failed to count items by category: %s", e)
             raise DatabaseError(f"Failed to count items: {str(e)}")
 
+    @_cached_aggregate
+    def get_all_stats(self, db: Session) -> dict:
+        """Get item counts and inventory value in a single query.
+
+        One GROUP BY (status, category) pass returns per-group counts and
+        sums, which are folded into status and category counts and the
+        totals of get_inventory_value.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dictionary with total_items, by_status, by_category and
+            inventory_value
+        """
+        try:
+            priced = and_(Item.price.isnot(None), Item.price != 0)
+            result = (
+                db.query(
+                    Item.status,
+                    Item.category,
+                    func.count(Item.id),
+                    func.sum(Item.cost * Item.quantity),
+                    func.sum(func.coalesce(Item.price, 0.0) * Item.quantity),
+                    func.sum(
+                        case(
+                            (
+                                priced,
+                                Item.price - Item.cost - func.coalesce(Item.shipping_cost, 0.0),
+                            ),
+                            else_=0.0,
+                        )
+                    ),
+                )
+                .group_by(Item.status, Item.category)
+                .all()
+            )
+
+            by_status = {}
+            by_category = {}
+            total_items = 0
+            total_cost = total_potential_revenue = total_potential_profit = 0.0
+            for status, category, count, cost, revenue, profit in result:
+                by_status[status] = by_status.get(status, 0) + count
+                category = category or "Uncategorized"
+                by_category[category] = by_category.get(category, 0) + count
+                total_items += count
+                total_cost += cost or 0
+                total_potential_revenue += revenue or 0
+                total_potential_profit += profit or 0
+
+            return {
+                "total_items": total_items,
+                "by_status": by_status,
+                "by_category": by_category,
+                "inventory_value": {
+                    "total_items": total_items,
+                    "total_cost": round(total_cost, 2),
+                    "total_potential_revenue": round(total_potential_revenue, 2),
+                    "total_potential_profit": round(total_potential_profit, 2),
+                    "average_cost": round(total_cost / total_items, 2) if total_items else 0,
+                },
+            }
+        except Exception as e:
+            logger.error("Failed to get item statistics: %s", e)
+            raise DatabaseError(f"Failed to get statistics: {str(e)}")
+
+    @_cached_aggregate
     def get_inventory_value(self, db: Session, status: Optional[str] = None) -> dict:
         """Calculate total inventory value.
 
@@ -290,25 +751,36 @@ class ItemRepository(BaseRepository[Item]):
             Dictionary with inventory statistics
         """
         try:
-            query = db.query(Item)
+            # Aggregate in one query instead of loading every item; profit
+            # is per unit and only counts priced items, as Item.profit does
+            priced = and_(Item.price.isnot(None), Item.price != 0)
+            query = db.query(
+                func.count(Item.id),
+                func.sum(Item.cost * Item.quantity),
+                func.sum(func.coalesce(Item.price, 0.0) * Item.quantity),
+                func.sum(
+                    case(
+                        (
+                            priced,
+                            Item.price - Item.cost - func.coalesce(Item.shipping_cost, 0.0),
+                        ),
+                        else_=0.0,
+                    )
+                ),
+            )
             if status:
                 query = query.filter(Item.status == status)
 
-            items = query.all()
-
-            total_cost = sum(item.cost * item.quantity for item in items)
-            total_potential_revenue = sum(
-                (item.price or 0) * item.quantity for item in items if item.price
-            )
-            total_potential_profit = sum(item.profit for item in items if item.price)
+            count, total_cost, total_potential_revenue, total_potential_profit = query.one()
+            total_cost = total_cost or 0
 
             return {
-                "total_items": len(items),
+                "total_items": count,
                 "total_cost": round(total_cost, 2),
-                "total_potential_revenue": round(total_potential_revenue, 2),
-                "total_potential_profit": round(total_potential_profit, 2),
-                "average_cost": round(total_cost / len(items), 2) if items else 0,
+                "total_potential_revenue": round(total_potential_revenue or 0, 2),
+                "total_potential_profit": round(total_potential_profit or 0, 2),
+                "average_cost": round(total_cost / count, 2) if count else 0,
             }
         except Exception as e:
-            logger.error(f"Failed to calculate inventory value: {e}")
+            logger.error("Failed to calculate inventory value: %s", e)
             raise DatabaseError(f"Failed to calculate inventory value: {str(e)}")
@@ -1,17 +1,32 @@
 """
 Pydantic schemas for Expense validation and serialization.
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
+from enum import Enum
+
+
+class ExpenseCategory(str, Enum):
+    """Expense category."""
+
+    INVENTORY = "Inventory"
+    SHIPPING = "Shipping"
+    SUPPLIES = "Supplies"
+    FEES = "Fees"
+    MARKETING = "Marketing"
+    OTHER = "Other"
 
 
 class ExpenseBase(BaseModel):
     """Base expense schema with common fields."""
 
+    # Enum fields are checked by pydantic-core and stored as plain strings
+    model_config = ConfigDict(use_enum_values=True)
+
     title: str = Field(..., min_length=1, max_length=200, description="Expense title")
     description: Optional[str] = Field(None, description="Expense description")
-    category: str = Field(..., max_length=100, description="Expense category")
+    category: ExpenseCategory = Field(..., description="Expense category")
     amount: float = Field(..., gt=0, description="Expense amount")
     currency: str = Field(default="USD", max_length=3, description="Currency code")
     payment_method: Optional[str] = Field(None, max_length=50, description="Payment method")
@@ -24,22 +39,8 @@ class ExpenseBase(BaseModel):
     tax_category: Optional[str] = Field(None, max_length=100, description="Tax category")
     notes: Optional[str] = Field(None, description="Additional notes")
 
-    @validator("category")
-    def validate_category(cls, v):
-        """Validate category field."""
-        valid_categories = [
-            "Inventory",
-            "Shipping",
-            "Supplies",
-            "Fees",
-            "Marketing",
-            "Other",
-        ]
-        if v not in valid_categories:
-            raise ValueError(f"Category must be one of: {', '.join(valid_categories)}")
-        return v
-
-    @validator("currency")
+    @field_validator("currency")
+    @classmethod
     def validate_currency(cls, v):
         """Validate currency code."""
         if len(v) != 3:
@@ -55,9 +56,11 @@ class ExpenseCreate(ExpenseBase):
 class ExpenseUpdate(BaseModel):
     """Schema for updating an expense (all fields optional)."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     description: Optional[str] = None
-    category: Optional[str] = Field(None, max_length=100)
+    category: Optional[ExpenseCategory] = None
     amount: Optional[float] = Field(None, gt=0)
     currency: Optional[str] = Field(None, max_length=3)
     payment_method: Optional[str] = Field(None, max_length=50)
@@ -70,23 +73,6 @@ class ExpenseUpdate(BaseModel):
     tax_category: Optional[str] = Field(None, max_length=100)
     notes: Optional[str] = None
 
-    @validator("category")
-    def validate_category(cls, v):
-        """Validate category field."""
-        if v is None:
-            return v
-        valid_categories = [
-            "Inventory",
-            "Shipping",
-            "Supplies",
-            "Fees",
-            "Marketing",
-            "Other",
-        ]
-        if v not in valid_categories:
-            raise ValueError(f"Category must be one of: {', '.join(valid_categories)}")
-        return v
-
 
 class ExpenseResponse(ExpenseBase):
     """Schema for expense response."""
@@ -96,8 +82,7 @@ class ExpenseResponse(ExpenseBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExpenseListResponse(BaseModel):
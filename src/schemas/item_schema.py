@@ -1,14 +1,38 @@
 """
 Pydantic schemas for Item validation and serialization.
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
+from enum import Enum
+
+
+class ItemStatus(str, Enum):
+    """Item lifecycle status."""
+
+    DRAFT = "Draft"
+    READY = "Ready"
+    LISTED = "Listed"
+    SOLD = "Sold"
+    ARCHIVED = "Archived"
+
+
+class ItemCondition(str, Enum):
+    """Item condition grade."""
+
+    NEW = "New"
+    LIKE_NEW = "Like New"
+    GOOD = "Good"
+    FAIR = "Fair"
+    POOR = "Poor"
 
 
 class ItemBase(BaseModel):
     """Base item schema with common fields."""
 
+    # Enum fields are checked by pydantic-core and stored as plain strings
+    model_config = ConfigDict(use_enum_values=True)
+
     title: str = Field(..., min_length=1, max_length=200, description="Item title")
     category: Optional[str] = Field(None, max_length=100, description="Item category")
     description: Optional[str] = Field(None, description="Item description")
@@ -16,30 +40,12 @@ class ItemBase(BaseModel):
     cost: float = Field(default=0.0, ge=0, description="Item cost")
     price: Optional[float] = Field(None, ge=0, description="Listing price")
     shipping_cost: Optional[float] = Field(default=0.0, ge=0, description="Shipping cost")
-    status: str = Field(default="Draft", description="Item status")
-    condition: Optional[str] = Field(None, description="Item condition")
+    status: ItemStatus = Field(default=ItemStatus.DRAFT.value, description="Item status")
+    condition: Optional[ItemCondition] = Field(None, description="Item condition")
     quantity: int = Field(default=1, ge=1, description="Quantity available")
     location: Optional[str] = Field(None, max_length=100, description="Storage location")
     sku: Optional[str] = Field(None, max_length=100, description="SKU")
 
-    @validator("status")
-    def validate_status(cls, v):
-        """Validate status field."""
-        valid_statuses = ["Draft", "Ready", "Listed", "Sold", "Archived"]
-        if v not in valid_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
-        return v
-
-    @validator("condition")
-    def validate_condition(cls, v):
-        """Validate condition field."""
-        if v is None:
-            return v
-        valid_conditions = ["New", "Like New", "Good", "Fair", "Poor"]
-        if v not in valid_conditions:
-            raise ValueError(f"Condition must be one of: {', '.join(valid_conditions)}")
-        return v
-
 
 class ItemCreate(ItemBase):
     """Schema for creating a new item."""
@@ -49,6 +55,8 @@ class ItemCreate(ItemBase):
 class ItemUpdate(BaseModel):
     """Schema for updating an item (all fields optional)."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     title: Optional[str] = Field(None, min_length=1, max_length=200)
     category: Optional[str] = Field(None, max_length=100)
     description: Optional[str] = None
@@ -56,8 +64,8 @@ class ItemUpdate(BaseModel):
     cost: Optional[float] = Field(None, ge=0)
     price: Optional[float] = Field(None, ge=0)
     shipping_cost: Optional[float] = Field(None, ge=0)
-    status: Optional[str] = None
-    condition: Optional[str] = None
+    status: Optional[ItemStatus] = None
+    condition: Optional[ItemCondition] = None
     quantity: Optional[int] = Field(None, ge=1)
     location: Optional[str] = Field(None, max_length=100)
     sku: Optional[str] = Field(None, max_length=100)
@@ -70,16 +78,6 @@ class ItemUpdate(BaseModel):
     ai_category: Optional[str] = None
     seo_score: Optional[float] = None
 
-    @validator("status")
-    def validate_status(cls, v):
-        """Validate status field."""
-        if v is None:
-            return v
-        valid_statuses = ["Draft", "Ready", "Listed", "Sold", "Archived"]
-        if v not in valid_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
-        return v
-
 
 class ItemResponse(ItemBase):
     """Schema for item response."""
@@ -102,8 +100,7 @@ class ItemResponse(ItemBase):
     listed_at: Optional[datetime] = None
     sold_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ItemListResponse(BaseModel):
@@ -1,10 +1,11 @@
 """
 Inventory service for business logic operations.
 """
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple, Type, Union
 from sqlalchemy.orm import Session
+from contextlib import contextmanager
+import functools
 import logging
-from datetime import datetime
 
 from src.repositories.item_repository import ItemRepository
 from src.models.item import Item
@@ -14,14 +15,66 @@ from src.core.database import get_db
 
 logger = logging.getLogger(__name__)
 
+# Shared by all service instances; the repository is stateless apart from
+# the column map it builds from the model
+_repository = ItemRepository()
+
+
+@contextmanager
+def _session(db: Optional[Session] = None):
+    """Yield the caller's session, or a new one committed on exit.
+
+    Args:
+        db: Session owned by the caller, if any
+    """
+    if db is not None:
+        yield db
+    else:
+        with get_db() as new_db:
+            yield new_db
+
+
+def service_call(action: str, translate: Optional[Type[Exception]] = None) -> Callable:
+    """Run a service method inside a database session.
+
+    The wrapped method receives the session as its first argument after
+    self. Callers may pass db=session to run several calls in one
+    transaction that they commit themselves; otherwise each call gets its
+    own session. NotFoundError and DuplicateError pass through unchanged;
+    other errors are logged and re-raised, as translate if given.
+
+    Args:
+        action: Description of the operation for error messages
+        translate: Exception type to raise for unexpected errors
+
+    Returns:
+        Decorator
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, db: Optional[Session] = None, **kwargs):
+            try:
+                with _session(db) as session:
+                    return fn(self, session, *args, **kwargs)
+            except (NotFoundError, DuplicateError):
+                raise
+            except Exception as e:
+                logger.error("Failed to %s: %s", action, e)
+                if translate is None:
+                    raise
+                raise translate(f"Failed to {action}: {str(e)}")
+        return wrapper
+    return decorator
+
 
 class InventoryService:
     """Service for inventory management."""
 
     def __init__(self):
-        self.repository = ItemRepository()
+        self.repository = _repository
 
-    def create_item(self, item_data: ItemCreate) -> Item:
+    @service_call("create item", translate=ValidationError)
+    def create_item(self, db: Session, item_data: ItemCreate) -> Item:
         """Create a new inventory item.
 
         Args:
@@ -34,25 +87,43 @@ class InventoryService:
             ValidationError: If data is invalid
             DuplicateError: If SKU already exists
         """
-        try:
-            with get_db() as db:
-                # Check for duplicate SKU
-                if item_data.sku:
-                    existing = self.repository.get_by_sku(db, item_data.sku)
-                    if existing:
-                        raise DuplicateError(f"Item with SKU '{item_data.sku}' already exists")
-
-                # Create item
-                item = self.repository.create(db, **item_data.model_dump())
-                logger.info(f"Created item: {item.id} - {item.title}")
-                return item
-        except DuplicateError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to create item: {e}")
-            raise ValidationError(f"Failed to create item: {str(e)}")
+        # Refuses a duplicate SKU as part of the INSERT
+        item = self.repository.create_item(db, **item_data.model_dump())
+        logger.info("Created item: %s - %s", item.id, item.title)
+        return item
+
+    @service_call("create items", translate=ValidationError)
+    def create_items(self, db: Session, items_data: List[ItemCreate]) -> List[int]:
+        """Create many inventory items with batched INSERT statements.
+
+        Intended for imports; no item instances are built or returned.
+
+        Args:
+            items_data: Item creation data for each item
 
-    def get_item(self, item_id: int) -> Item:
+        Returns:
+            IDs of the created items, in input order
+
+        Raises:
+            ValidationError: If data is invalid
+            DuplicateError: If a SKU repeats or already exists
+        """
+        rows = [item_data.model_dump() for item_data in items_data]
+        skus = [row["sku"] for row in rows if row.get("sku")]
+        if len(set(skus)) != len(skus):
+            raise DuplicateError("Import contains the same SKU more than once")
+        existing = self.repository.get_by_skus(db, skus)
+        if existing:
+            raise DuplicateError(
+                f"Items with SKU already exist: {', '.join(sorted(existing))}"
+            )
+
+        ids = self.repository.create_many(db, rows)
+        logger.info("Created %s items", len(ids))
+        return ids
+
+    @service_call("get item")
+    def get_item(self, db: Session, item_id: int) -> Item:
         """Get item by ID.
 
         Args:
@@ -64,16 +135,10 @@ class InventoryService:
         Raises:
             NotFoundError: If item not found
         """
-        try:
-            with get_db() as db:
-                return self.repository.get_by_id_or_fail(db, item_id)
-        except NotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to get item {item_id}: {e}")
-            raise
+        return self.repository.get_by_id_or_fail(db, item_id)
 
-    def update_item(self, item_id: int, item_data: ItemUpdate) -> Item:
+    @service_call("update item", translate=ValidationError)
+    def update_item(self, db: Session, item_id: int, item_data: ItemUpdate) -> Item:
         """Update an item.
 
         Args:
@@ -87,29 +152,17 @@ class InventoryService:
             NotFoundError: If item not found
             ValidationError: If update fails
         """
-        try:
-            with get_db() as db:
-                # Get existing item
-                item = self.repository.get_by_id_or_fail(db, item_id)
-
-                # Check for SKU conflict
-                if item_data.sku and item_data.sku != item.sku:
-                    existing = self.repository.get_by_sku(db, item_data.sku)
-                    if existing and existing.id != item_id:
-                        raise DuplicateError(f"Item with SKU '{item_data.sku}' already exists")
-
-                # Update only provided fields
-                update_dict = item_data.model_dump(exclude_unset=True)
-                updated_item = self.repository.update(db, item_id, **update_dict)
-                logger.info(f"Updated item: {item_id}")
-                return updated_item
-        except (NotFoundError, DuplicateError):
-            raise
-        except Exception as e:
-            logger.error(f"Failed to update item {item_id}: {e}")
-            raise ValidationError(f"Failed to update item: {str(e)}")
-
-    def delete_item(self, item_id: int) -> bool:
+        # Update only provided fields; a SKU conflict raises DuplicateError
+        update_dict = item_data.model_dump(exclude_unset=True)
+        if not update_dict:
+            # Nothing to write, and no reason to drop cached aggregates
+            return self.repository.get_by_id_or_fail(db, item_id)
+        updated_item = self.repository.update_item(db, item_id, **update_dict)
+        logger.info("Updated item: %s", item_id)
+        return updated_item
+
+    @service_call("delete item")
+    def delete_item(self, db: Session, item_id: int) -> bool:
         """Delete an item.
 
         Args:
@@ -121,16 +174,9 @@ class InventoryService:
         Raises:
             NotFoundError: If item not found
         """
-        try:
-            with get_db() as db:
-                self.repository.delete(db, item_id)
-                logger.info(f"Deleted item: {item_id}")
-                return True
-        except NotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to delete item {item_id}: {e}")
-            raise
+        self.repository.delete(db, item_id)
+        logger.info("Deleted item: %s", item_id)
+        return True
 
     def list_items(
         self,
@@ -139,7 +185,11 @@ class InventoryService:
         status: Optional[str] = None,
         category: Optional[str] = None,
         search: Optional[str] = None,
-    ) -> List[Item]:
+        after_id: Optional[int] = None,
+        prefix: bool = False,
+        with_total: bool = False,
+        db: Optional[Session] = None,
+    ) -> Union[List[Item], Tuple[List[Item], Optional[int]]]:
         """List items with filters.
 
         Args:
@@ -148,37 +198,47 @@ class InventoryService:
             status: Filter by status
             category: Filter by category
             search: Search query
+            after_id: ID of the last item of the previous page; when set,
+                the page starts right after it and skip is ignored
+            prefix: Match search only against the start of title or SKU
+            with_total: Also return the number of matching items
+            db: Session to run in instead of a new one
 
         Returns:
-            List of items
+            List of items, or (items, total) if with_total is set; total
+            is None for searches and when the items could not be loaded
         """
         try:
-            with get_db() as db:
+            with _session(db) as db:
                 if search:
-                    return self.repository.search(
-                        db, search, status=status, category=category, skip=skip, limit=limit
+                    items = self.repository.search(
+                        db, search, status=status, category=category,
+                        skip=skip, limit=limit, after_id=after_id, prefix=prefix,
+                    )
+                    return (items, None) if with_total else items
+                elif with_total:
+                    return self.repository.list_with_count(
+                        db, status=status, category=category,
+                        skip=skip, limit=limit, after_id=after_id,
                     )
-                elif status or category:
-                    query = db.query(Item)
-                    if status:
-                        query = query.filter(Item.status == status)
-                    if category:
-                        query = query.filter(Item.category == category)
-                    return query.order_by(Item.created_at.desc()).offset(skip).limit(limit).all()
                 else:
-                    return self.repository.get_all(
-                        db, skip=skip, limit=limit, order_by="created_at", order_desc=True
+                    return self.repository.list_filtered(
+                        db, status=status, category=category,
+                        skip=skip, limit=limit, after_id=after_id,
                     )
         except Exception as e:
-            logger.error(f"Failed to list items: {e}")
-            return []
+            logger.error("Failed to list items: %s", e)
+            return ([], None) if with_total else []
 
-    def add_photo(self, item_id: int, filename: str) -> Item:
+    def add_photo(
+        self, item_id: int, filename: str, db: Optional[Session] = None
+    ) -> Item:
         """Add a photo to an item.
 
         Args:
             item_id: Item ID
             filename: Photo filename
+            db: Session to run in instead of a new one
 
         Returns:
             Updated item
@@ -186,26 +246,35 @@ class InventoryService:
         Raises:
             NotFoundError: If item not found
         """
-        try:
-            with get_db() as db:
-                item = self.repository.get_by_id_or_fail(db, item_id)
-                item.add_photo(filename)
-                db.flush()
-                db.refresh(item)
-                logger.info(f"Added photo to item {item_id}: {filename}")
-                return item
-        except NotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to add photo to item {item_id}: {e}")
-            raise
+        return self.add_photos(item_id, [filename], db=db)
+
+    @service_call("add photos")
+    def add_photos(self, db: Session, item_id: int, filenames: List[str]) -> Item:
+        """Add several photos to an item in one update.
+
+        Args:
+            item_id: Item ID
+            filenames: Photo filenames
+
+        Returns:
+            Updated item
+
+        Raises:
+            NotFoundError: If item not found
+        """
+        item = self.repository.append_photos(db, item_id, filenames)
+        logger.info("Added photos to item %s: %s", item_id, ', '.join(filenames))
+        return item
 
-    def remove_photo(self, item_id: int, filename: str) -> Item:
+    def remove_photo(
+        self, item_id: int, filename: str, db: Optional[Session] = None
+    ) -> Item:
         """Remove a photo from an item.
 
         Args:
             item_id: Item ID
             filename: Photo filename
+            db: Session to run in instead of a new one
 
         Returns:
             Updated item
@@ -213,21 +282,28 @@ class InventoryService:
         Raises:
             NotFoundError: If item not found
         """
-        try:
-            with get_db() as db:
-                item = self.repository.get_by_id_or_fail(db, item_id)
-                item.remove_photo(filename)
-                db.flush()
-                db.refresh(item)
-                logger.info(f"Removed photo from item {item_id}: {filename}")
-                return item
-        except NotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to remove photo from item {item_id}: {e}")
-            raise
+        return self.remove_photos(item_id, [filename], db=db)
+
+    @service_call("remove photos")
+    def remove_photos(self, db: Session, item_id: int, filenames: List[str]) -> Item:
+        """Remove several photos from an item in one update.
+
+        Args:
+            item_id: Item ID
+            filenames: Photo filenames
 
-    def update_status(self, item_id: int, new_status: str) -> Item:
+        Returns:
+            Updated item
+
+        Raises:
+            NotFoundError: If item not found
+        """
+        item = self.repository.remove_photos(db, item_id, filenames)
+        logger.info("Removed photos from item %s: %s", item_id, ', '.join(filenames))
+        return item
+
+    @service_call("update item status")
+    def update_status(self, db: Session, item_id: int, new_status: str) -> Item:
         """Update item status.
 
         Args:
@@ -240,46 +316,25 @@ class InventoryService:
         Raises:
             NotFoundError: If item not found
         """
-        try:
-            with get_db() as db:
-                item = self.repository.get_by_id_or_fail(db, item_id)
-
-                # Update timestamps based on status
-                if new_status == "Listed" and not item.listed_at:
-                    item.listed_at = datetime.utcnow()
-                elif new_status == "Sold" and not item.sold_at:
-                    item.sold_at = datetime.utcnow()
-
-                updated_item = self.repository.update(db, item_id, status=new_status)
-                logger.info(f"Updated item {item_id} status to {new_status}")
-                return updated_item
-        except NotFoundError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to update status for item {item_id}: {e}")
-            raise
+        # Also stamps listed_at/sold_at the first time
+        updated_item = self.repository.set_status(db, item_id, new_status)
+        logger.info("Updated item %s status to %s", item_id, new_status)
+        return updated_item
 
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, db: Optional[Session] = None) -> Dict[str, Any]:
         """Get inventory statistics.
 
+        Args:
+            db: Session to run in instead of a new one
+
         Returns:
             Dictionary with statistics
         """
         try:
-            with get_db() as db:
-                total_items = self.repository.count(db)
-                by_status = self.repository.count_by_status(db)
-                by_category = self.repository.count_by_category(db)
-                inventory_value = self.repository.get_inventory_value(db)
-
-                return {
-                    "total_items": total_items,
-                    "by_status": by_status,
-                    "by_category": by_category,
-                    "inventory_value": inventory_value,
-                }
+            with _session(db) as db:
+                return self.repository.get_all_stats(db)
         except Exception as e:
-            logger.error(f"Failed to get inventory statistics: {e}")
+            logger.error("Failed to get inventory statistics: %s", e)
             return {
                 "total_items": 0,
                 "by_status": {},
@@ -287,19 +342,29 @@ class InventoryService:
                 "inventory_value": {},
             }
 
-    def get_recent_items(self, days: int = 7, limit: int = 50) -> List[Item]:
+    def get_recent_items(
+        self,
+        days: int = 7,
+        limit: int = 50,
+        after_id: Optional[int] = None,
+        db: Optional[Session] = None,
+    ) -> List[Item]:
         """Get recently created items.
 
         Args:
             days: Number of days to look back
             limit: Maximum number of items
+            after_id: ID of the last item of the previous page
+            db: Session to run in instead of a new one
 
         Returns:
             List of recent items
         """
         try:
-            with get_db() as db:
-                return self.repository.get_recent_items(db, days=days, limit=limit)
+            with _session(db) as db:
+                return self.repository.get_recent_items(
+                    db, days=days, limit=limit, after_id=after_id
+                )
         except Exception as e:
-            logger.error(f"Failed to get recent items: {e}")
+            logger.error("Failed to get recent items: %s", e)
             return []